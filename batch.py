@@ -0,0 +1,225 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import gzip
+import json
+import multiprocessing
+import statistics
+import time
+from collections import Counter
+from game import MONSTER_TYPES
+from map import Map
+from simulation import run_match, setup_headless, RandomPolicy, CombinedPolicy, DEFAULT_TIME_LIMIT
+from timing import STEP_MS
+
+MONSTER_CLASSES = {monster_class.__name__: monster_class for monster_class in MONSTER_TYPES}
+
+# Bot policies a player can be given, built from the match seed and the player's id; 'idle' players stand still
+POLICIES = {
+    'random': lambda seed, player_id: RandomPolicy(seed * 10 + player_id, players=[player_id]),
+    'busy': lambda seed, player_id: RandomPolicy(seed * 10 + player_id, actions_per_second=10, players=[player_id]),
+    'idle': lambda seed, player_id: None,
+}
+
+# Columns of the per-match and per-death tables in the output file
+MATCH_COLUMNS = ('seed', 'winners', 'ticks', 'game_time', 'wall_time')
+DEATH_COLUMNS = ('match', 'time', 'player', 'cause')
+
+
+def load_map(spec, seed):
+    """
+    Builds the map for a match.
+
+    Args:
+        spec (str): '1', '2' or '3' for a map from the maps folder, or 'WIDTHxHEIGHT' for a generated map.
+        seed (int): The match seed, which also lays out generated maps.
+
+    Returns:
+        int or Map: A map as accepted by Game.
+    """
+    if 'x' in spec:
+        width, height = (int(size) for size in spec.split('x'))
+        return Map.generate(width, height, 40, seed=seed)
+    return int(spec)
+
+
+def play(job):
+    """
+    Plays one match in a worker process.
+
+    Args:
+        job (tuple): The seed, map spec, number of players, monster class names, policy names per player,
+                     step length and time limit.
+
+    Returns:
+        dict: The match result, with one entry per column in MATCH_COLUMNS plus its deaths.
+    """
+    seed, map_spec, player_mode, monster_names, policy_names, dt, time_limit = job
+    policies = []
+    for player_id in range(1, player_mode + 1):
+        policy = POLICIES[policy_names[(player_id - 1) % len(policy_names)]](seed, player_id)
+        if policy is not None:
+            policies.append(policy)
+    result = run_match(load_map(map_spec, seed), player_mode, seed, dt, time_limit, CombinedPolicy(policies),
+                       monster_types=[MONSTER_CLASSES[name] for name in monster_names])
+    return {
+        'seed': result.seed,
+        'winners': result.winners,
+        'ticks': result.ticks,
+        'game_time': result.game_time,
+        'wall_time': result.wall_time,
+        'deaths': result.deaths,
+    }
+
+
+class BatchStats:
+    """
+    Aggregates match results as they come in and keeps them as columns for the output file.
+
+    Attributes:
+        matches (dict): One list per column in MATCH_COLUMNS, one entry per match.
+        deaths (dict): One list per column in DEATH_COLUMNS, one entry per player death.
+    """
+    def __init__(self):
+        self.matches = {column: [] for column in MATCH_COLUMNS}
+        self.deaths = {column: [] for column in DEATH_COLUMNS}
+
+    def add(self, row):
+        """
+        Adds the result of one match.
+
+        Args:
+            row (dict): A result returned by `play`.
+        """
+        index = len(self.matches['seed'])
+        for column in MATCH_COLUMNS:
+            self.matches[column].append(row[column])
+        for death_time, player_id, cause in row['deaths']:
+            for column, value in zip(DEATH_COLUMNS, (index, death_time, player_id, cause)):
+                self.deaths[column].append(value)
+
+    def summary(self):
+        """
+        Returns the win rates, match lengths and kill causes of the matches added so far.
+        """
+        count = len(self.matches['seed'])
+        wins = Counter()
+        for winners in self.matches['winners']:
+            if winners is None:
+                wins['timeout'] += 1
+            elif not winners:
+                wins['draw'] += 1
+            else:
+                wins.update(f"player{player_id}" for player_id in winners)
+        lengths = sorted(game_time / 1000 for game_time in self.matches['game_time'])
+        return {
+            'matches': count,
+            'win_rates': {key: wins[key] / count for key in sorted(wins)},
+            'length_mean': statistics.fmean(lengths) if lengths else 0.0,
+            'length_median': statistics.median(lengths) if lengths else 0.0,
+            'length_p90': lengths[int(0.9 * (len(lengths) - 1))] if lengths else 0.0,
+            'kill_causes': dict(Counter(self.deaths['cause']).most_common()),
+            'ticks': sum(self.matches['ticks']),
+        }
+
+    def write(self, path, config):
+        """
+        Writes the results as gzipped JSON with one list per column.
+
+        Args:
+            path (str): The output file.
+            config (dict): The batch settings, stored next to the results.
+        """
+        with gzip.open(path, 'wt', encoding='utf-8') as file:
+            json.dump({'config': config, 'matches': self.matches, 'deaths': self.deaths}, file, separators=(',', ':'))
+
+
+def run_batch(jobs, workers, on_result=None):
+    """
+    Plays matches on a pool of worker processes and aggregates the results in the order they finish.
+
+    Args:
+        jobs (list): The matches to play, as accepted by `play`.
+        workers (int): The number of processes; with 1 the matches are played in this process.
+        on_result (callable): Called with every result as soon as it is in.
+
+    Returns:
+        BatchStats: The aggregated results.
+    """
+    stats = BatchStats()
+    if workers <= 1:
+        setup_headless()
+        results = map(play, jobs)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers, initializer=setup_headless)
+        # Small chunks keep the workers busy until the end even though match lengths vary a lot
+        results = pool.imap_unordered(play, jobs, chunksize=max(1, len(jobs) // (workers * 8)))
+    try:
+        for row in results:
+            stats.add(row)
+            if on_result is not None:
+                on_result(row)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plays many headless matches in parallel and aggregates the results.")
+    parser.add_argument('--matches', type=int, default=100, help="Number of matches, one per seed")
+    parser.add_argument('--seed', type=int, default=0, help="First seed, the others follow it")
+    parser.add_argument('--map', default='1', help="1, 2 or 3 for a map file, or WIDTHxHEIGHT for a generated map")
+    parser.add_argument('--players', type=int, default=2, choices=[2, 3], help="Number of players")
+    parser.add_argument('--monsters', default=','.join(MONSTER_CLASSES),
+                        help="Comma separated monster classes to spawn, repeat a class for more of it")
+    parser.add_argument('--policies', default='random',
+                        help=f"Comma separated bot policy per player, from {', '.join(POLICIES)}; the list repeats")
+    parser.add_argument('--dt', type=float, default=STEP_MS, help="Length of a step in milliseconds")
+    parser.add_argument('--time-limit', type=float, default=DEFAULT_TIME_LIMIT / 1000, help="Seconds of game time per match")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument('--output', default='results.json.gz', help="Columnar results file")
+    parser.add_argument('--quiet', action='store_true', help="Only print the summary")
+    args = parser.parse_args(argv)
+
+    monster_names = [name for name in args.monsters.split(',') if name]
+    policy_names = [name for name in args.policies.split(',') if name]
+    for name in monster_names:
+        if name not in MONSTER_CLASSES:
+            parser.error(f"unknown monster {name!r}, choose from {', '.join(MONSTER_CLASSES)}")
+    for name in policy_names:
+        if name not in POLICIES:
+            parser.error(f"unknown policy {name!r}, choose from {', '.join(POLICIES)}")
+    if not policy_names:
+        parser.error("at least one policy is needed")
+
+    jobs = [(seed, args.map, args.players, monster_names, policy_names, args.dt, args.time_limit * 1000)
+            for seed in range(args.seed, args.seed + args.matches)]
+
+    def report(row):
+        if not args.quiet:
+            print(f"seed {row['seed']}: winners {row['winners']}, {row['game_time'] / 1000:.1f}s, "
+                  f"deaths {[cause for _, _, cause in row['deaths']]}")
+
+    started = time.perf_counter()
+    stats = run_batch(jobs, args.workers, report)
+    elapsed = time.perf_counter() - started
+    config = {key: value for key, value in vars(args).items() if key not in ('output', 'quiet')}
+    stats.write(args.output, config)
+
+    summary = stats.summary()
+    print(f"{summary['matches']} matches in {elapsed:.2f}s on {args.workers} worker(s): "
+          f"{summary['matches'] / elapsed:.1f} matches/s, {summary['ticks'] / elapsed:.0f} ticks/s")
+    print("win rates: " + ", ".join(f"{key} {rate:.1%}" for key, rate in summary['win_rates'].items()))
+    print(f"match length: mean {summary['length_mean']:.1f}s, median {summary['length_median']:.1f}s, "
+          f"p90 {summary['length_p90']:.1f}s")
+    print("kill causes: " + ", ".join(f"{cause} {count}" for cause, count in summary['kill_causes'].items()))
+    print(f"results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
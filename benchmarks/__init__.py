@@ -0,0 +1,7 @@
+"""
+Micro-benchmarks for the game's hot paths. Each module can be run on its own, e.g.
+`python -m benchmarks.pathfinding`, and prints its timings to the console.
+
+`python -m benchmarks.suite` times every hot path on fixed maps and seeds and compares the results with
+benchmarks/baseline.json; `--save` makes the new results the baseline.
+"""
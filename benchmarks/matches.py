@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from eventlog import log
+from game import Game
+from server import MatchServer, TICK_RATES
+from simulation import setup_headless, RandomPolicy
+
+
+def add_bot_match(server, seed):
+    """Starts a match of two or three bots on map 1, alternating with the seed."""
+    game = Game(None, 1, 2 + seed % 2, 1, seed=seed)
+    server.add_match(game, RandomPolicy(seed))
+
+
+async def measure(count, duration):
+    """
+    Hosts `count` bot matches for `duration` seconds, replacing the ones that end, and returns what the
+    server sustained.
+    """
+    seeds = iter(range(10 ** 9))
+    finished = []
+
+    def replace(match_id, match):
+        finished.append(match)
+        add_bot_match(server, next(seeds))
+
+    server = MatchServer(on_finished=replace)
+    for _ in range(count):
+        add_bot_match(server, next(seeds))
+    lowest_rate = server.tick_rate
+    run = asyncio.create_task(server.run(duration))
+    loads = []
+    while not run.done():
+        await asyncio.sleep(1)
+        loads.append(server.load)
+        lowest_rate = min(lowest_rate, server.tick_rate)
+    await run
+    matches = finished + list(server.matches.values())
+    ticks = sum(match.ticks for match in matches)
+    cpu_time = sum(match.cpu_time for match in matches)
+    await server.close()
+    return {
+        'rate': ticks / count / duration,
+        'lowest_rate': lowest_rate,
+        'load': max(loads[1:] or loads),
+        'late': server.late_ticks,
+        'cpu_per_tick': cpu_time / ticks * 1e6 if ticks else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Finds how many bot matches one MatchServer process sustains.")
+    parser.add_argument('--counts', default='25,50,100,150,200,300', help="Comma separated numbers of matches to try")
+    parser.add_argument('--duration', type=float, default=5, help="Seconds to host each number of matches")
+    args = parser.parse_args(argv)
+
+    setup_headless()
+    sustained = 0
+    print(f"{'matches':>8} {'ticks/s':>8} {'lowest Hz':>10} {'load':>6} {'late':>6} {'cpu us/tick':>12}")
+    for count in (int(count) for count in args.counts.split(',')):
+        with log.quiet():
+            result = asyncio.run(measure(count, args.duration))
+        print(f"{count:>8} {result['rate']:>8.1f} {result['lowest_rate']:>10} {result['load']:>6.0%} "
+              f"{result['late']:>6} {result['cpu_per_tick']:>12.0f}")
+        if result['lowest_rate'] == TICK_RATES[0]:
+            sustained = count
+    print(f"sustained at {TICK_RATES[0]} Hz: {sustained} matches")
+
+
+if __name__ == '__main__':
+    main()
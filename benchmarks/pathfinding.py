@@ -0,0 +1,69 @@
+import argparse
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from map import Map
+from monster import bfs_path, astar_path
+
+
+def corridor_lines(width, height):
+    """
+    Builds a serpentine map: full-width corridors joined at alternating ends, so the only path between
+    the top-left and the bottom-left corner runs through every corridor.
+
+    Args:
+        width (int): Number of columns.
+        height (int): Number of rows, odd so that the last row is a corridor.
+
+    Returns:
+        list: One string of tile digits per row.
+    """
+    lines = []
+    for row in range(height):
+        if row % 2 == 0:
+            lines.append('0' * width)
+        elif row % 4 == 1:
+            lines.append('1' * (width - 1) + '0')
+        else:
+            lines.append('0' + '1' * (width - 1))
+    return lines
+
+
+def time_search(search, game_map, start, goal, repeat):
+    """
+    Runs a search several times and returns the best time in milliseconds and the path length.
+    """
+    best = float('inf')
+    path = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        path = search(game_map, start, goal)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, len(path) if path else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compares the BFS and A* pathfinders on large generated maps.")
+    parser.add_argument('--size', type=int, default=201, help="Width and height of the generated maps")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per measurement, the best one is reported")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    size = args.size | 1
+    scenarios = [
+        ("open field", Map.generate(size, size, 40, brick_density=0, seed=1), (0, 0), (size - 1, size - 1)),
+        ("corridors", Map(None, 40, lines=corridor_lines(size, size)), (0, 0), (size - 1, 0)),
+    ]
+    print(f"{'scenario':<12} {'size':>9} {'path':>7} {'bfs ms':>9} {'a* ms':>9}")
+    for name, game_map, start, goal in scenarios:
+        bfs_ms, length = time_search(bfs_path, game_map, start, goal, args.repeat)
+        astar_ms, astar_length = time_search(astar_path, game_map, start, goal, args.repeat)
+        assert length == astar_length, "A* should find a shortest path"
+        print(f"{name:<12} {f'{size}x{size}':>9} {length:>7} {bfs_ms:>9.1f} {astar_ms:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
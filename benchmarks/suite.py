@@ -0,0 +1,272 @@
+import argparse
+import gc
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from bomb import Bomb
+from eventlog import log
+from game import Game
+from gameField import GameField
+from map import Map, generate_layout
+from monster import Monster, PathfindingMonster, is_monster_move_valid
+from occupancy import GridGroup
+from player import Player
+from simulation import RandomPolicy
+from timing import STEP_MS
+
+# Where the timings are compared against and saved to with --save
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# How much slower than the baseline the fastest sample of a case may get before it is reported as a regression
+DEFAULT_TOLERANCE = 0.25
+
+
+class Case:
+    """
+    A timed operation of the suite.
+
+    Attributes:
+        name (str): The name the case is reported and stored in the baseline under.
+        run (callable): The operation, called with the state `setup` returned.
+        setup (callable): Builds a fresh state before every sample, outside the timing, or None if the
+                          operation leaves nothing to reset and is called with None.
+        number (int): How many times `run` is called per sample; the sample is the average of the calls.
+    """
+    def __init__(self, name, run, setup=None, number=1):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.number = number
+
+
+def measure(case, samples):
+    """
+    Times a case.
+
+    Parameters:
+        case (Case): The case to time.
+        samples (int): The number of samples to take, after one untimed warm-up call. Like timeit, the
+                       garbage collector is off while a sample runs.
+
+    Returns:
+        dict: The minimum, median, mean and 95th percentile time of one call in microseconds, and the calls
+              per second at the median.
+    """
+    state = case.setup() if case.setup is not None else None
+    case.run(state)
+    times = []
+    collecting = gc.isenabled()
+    try:
+        for _ in range(samples):
+            state = case.setup() if case.setup is not None else None
+            gc.disable()
+            started = time.perf_counter()
+            for _ in range(case.number):
+                case.run(state)
+            times.append((time.perf_counter() - started) / case.number * 1e6)
+            if collecting:
+                gc.enable()
+    finally:
+        if collecting:
+            gc.enable()
+    times.sort()
+    median = statistics.median(times)
+    return {
+        'min_us': times[0],
+        'median_us': median,
+        'mean_us': statistics.fmean(times),
+        'p95_us': times[min(len(times) - 1, len(times) * 95 // 100)],
+        'ops_per_sec': 1e6 / median if median else 0.0,
+    }
+
+
+def map_cases(directory):
+    """Loading every shipped map, and generated maps written to `directory` as map files."""
+    cases = []
+    for filename in sorted(os.listdir('maps')):
+        game_map = Map(filename, 40)
+        cases.append(Case(f'load_map/{filename}', lambda state, game_map=game_map, filename=filename:
+                          game_map.load_map(filename), number=20))
+    for size in (101, 401):
+        path = os.path.join(directory, f'generated{size}.txt')
+        with open(path, 'w') as file:
+            file.write('\n'.join(generate_layout(size, size, seed=size)))
+        # Map.load_map reads from the maps directory
+        filename = os.path.relpath(path, 'maps')
+        game_map = Map(filename, 40)
+        cases.append(Case(f'load_map/generated{size}x{size}', lambda state, game_map=game_map, filename=filename:
+                          game_map.load_map(filename), number=5 if size < 200 else 1))
+    return cases
+
+
+def pathfinding_cases():
+    """PathfindingMonster.bfs on an open 201x201 map, to targets at increasing path lengths."""
+    game_map = Map.generate(201, 201, 40, brick_density=0, seed=1)
+    monster = PathfindingMonster(GameField(game_map), 0, 0, 1)
+    cases = []
+    for target in ((0, 10), (0, 50), (50, 50), (100, 100), (200, 200)):
+        distance = target[0] + target[1]
+        cases.append(Case(f'bfs/distance{distance}', lambda state, target=target: monster.bfs(game_map, target),
+                          number=max(1, 200 // distance)))
+    return cases
+
+
+def explosion_cases():
+    """Bomb.explode setting off a chain of bombs along the top row, with bricks around it."""
+    def chain(length):
+        lines = generate_layout(2 * length + 1, 5, brick_density=0.5, seed=length)
+        lines[0] = '0' * len(lines[0])
+        player = Player(1, 0, 0, length, 2, [])
+
+        def setup():
+            game_map = Map(None, 40, lines)
+            game_map.rng = random.Random(length)
+            bombs = GridGroup()
+            for col in range(0, 2 * length, 2):
+                bomb = Bomb(player, 0, col, 2, float('inf'))
+                bombs.add(bomb)
+                game_map.mark_bomb_tile(0, col)
+                player.placed_bomb(bomb)
+            return game_map, bombs, bombs.sprites()[0]
+
+        def run(state):
+            game_map, bombs, first = state
+            first.explode(game_map, GridGroup(), bombs, [], GridGroup(), GridGroup())
+
+        return Case(f'explode/chain{length}', run, setup)
+    return [chain(length) for length in (1, 8, 64)]
+
+
+def move_check_cases():
+    """is_monster_move_valid and GameField.is_valid_move, each call on the next of 1000 random cells."""
+    game_map = Map.generate(101, 101, 40, brick_density=0.3, seed=2)
+    rng = random.Random(3)
+    cells = [(rng.randrange(game_map.height), rng.randrange(game_map.width)) for _ in range(1000)]
+    moves = [rng.choice(((-1, 0), (1, 0), (0, -1), (0, 1))) for _ in cells]
+    cases = []
+    for count in (4, 100, 1000):
+        monsters = GridGroup()
+        for row, col in rng.sample(cells, count):
+            monsters.add(Monster(game_map, row, col, 1))
+        positions = itertools.cycle(cells)
+
+        def check_monster_move(state, monsters=monsters, positions=positions):
+            row, col = next(positions)
+            is_monster_move_valid(game_map, monsters, row, col)
+        cases.append(Case(f'is_monster_move_valid/monsters{count}', check_monster_move, number=1000))
+
+    game_field = GameField(game_map)
+    players = GridGroup(Player(player_id, row, col, 1, 1, []) for player_id, (row, col) in enumerate(cells[:3], 1))
+    player_moves = itertools.cycle(zip(cells, moves))
+
+    def check_player_move(state):
+        cell, move = next(player_moves)
+        game_field.is_valid_move(cell, move, False, players)
+    cases.append(Case('is_valid_move/players3', check_player_move, number=1000))
+    return cases
+
+
+def frame_cases(screen):
+    """One frame of a game on map 1 with random players, stepped only and stepped and rendered."""
+    cases = []
+    for name, rendered in (('headless', False), ('rendered', True)):
+        games = {}
+
+        def setup(rendered=rendered, games=games):
+            # A game that ended is replaced, so every sample times a running game
+            game = games.get('game')
+            if game is None or game.winners is not None:
+                seed = games['seed'] = games.get('seed', 0) + 1
+                game = games['game'] = Game(screen if rendered else None, 1, 2, 1, seed=seed)
+                games['policy'] = RandomPolicy(seed)
+            return game, games['policy'], rendered
+
+        def run(state):
+            game, policy, rendered = state
+            game.step(policy(game, STEP_MS), STEP_MS)
+            if rendered:
+                game.render()
+        cases.append(Case(f'game_frame/{name}', run, setup))
+    return cases
+
+
+def build_cases(directory, screen):
+    """Every case of the suite, in the order they run."""
+    return (map_cases(directory) + pathfinding_cases() + explosion_cases() + move_check_cases()
+            + frame_cases(screen))
+
+
+def compare(result, baseline, tolerance):
+    """
+    Returns how a case's fastest sample changed against the baseline, as text, and whether it regressed.
+    Like timeit, the minimum is compared: other processes and the OS only ever make samples slower, and
+    they move the mean, and on a busy machine even the median, by more than most regressions.
+    """
+    if baseline is None or 'min_us' not in baseline:
+        return '', False
+    change = result['min_us'] / baseline['min_us'] - 1
+    return f'{change:+.1%}', change > tolerance
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Times the engine's hot paths on fixed maps and seeds.")
+    parser.add_argument('--samples', type=int, default=50, help="Samples per case")
+    parser.add_argument('--filter', default='', help="Only run the cases whose name contains this text")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="JSON file to compare against and to save to")
+    parser.add_argument('--save', action='store_true', help="Save the results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Slowdown of the fastest sample against the baseline reported as a regression")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.display.set_mode((13 * 40, 11 * 40))
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)['cases']
+
+    results = {}
+    regressions = []
+    print(f"{'case':<36} {'median us':>10} {'min us':>10} {'p95 us':>10} {'ops/s':>10} {'vs baseline':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for case in build_cases(directory, screen):
+            if args.filter not in case.name:
+                continue
+            with log.quiet():
+                result = measure(case, args.samples)
+            results[case.name] = result
+            change, regressed = compare(result, baseline.get(case.name), args.tolerance)
+            if regressed:
+                regressions.append(case.name)
+            print(f"{case.name:<36} {result['median_us']:>10.1f} {result['min_us']:>10.1f} {result['p95_us']:>10.1f} "
+                  f"{result['ops_per_sec']:>10.0f} {change:>12}")
+
+    if args.save:
+        with open(args.baseline, 'w') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'samples': args.samples,
+                'cases': {name: {key: round(value, 3) for key, value in result.items()}
+                          for name, result in results.items()},
+            }, file, indent=2, sort_keys=True)
+            file.write('\n')
+        print(f"saved the baseline to {args.baseline}")
+    if regressions:
+        print(f"slower than the baseline by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,141 +1,213 @@
-import pygame
-from explosion import Explosion
-from pygame.sprite import Sprite
-
-class Bomb(Sprite):
-    def __init__(self, player, row, col, blast_range, explode_time):
-        """
-        Initialize the Bomb object.
-
-        :param player: The player who placed the bomb.
-        :param row: The row position of the bomb on the grid.
-        :param col: The column position of the bomb on the grid.
-        :param blast_range: The range of the bomb's explosion.
-        :param explode_time: The time in milliseconds until the bomb explodes.
-        """
-        super().__init__()
-        self.player = player
-        self.image = pygame.image.load("images/bomb_image.png")
-        self.rect = self.image.get_rect(topleft=(col * 40, row * 40))  # Modify the size accordingly
-        self.clock = pygame.time.Clock()
-        self.explodeTime = pygame.time.get_ticks() + explode_time
-        self.blast_range = blast_range
-        self.is_exploding = False
-        self.row = row
-        self.col = col
-        self.explosion_tiles = []
-
-
-    def update(self,gameMap,monsters,bombs,explosion_tiles,power_ups,players):
-        """
-        Update the state of the bomb.
-
-        :param gameMap: The game map containing the layout of the game.
-        :param monsters: A list of monsters in the game.
-        :param bombs: A list of active bombs in the game.
-        :param explosion_tiles: A list of tiles affected by explosions.
-        :param power_ups: A list of power-ups available in the game.
-        :param players: A list of players in the game.
-        """
-        if(self.player.has_detonator) :
-            pass
-            
-        else :
-            current_time = pygame.time.get_ticks()
-            if current_time >= self.explodeTime:
-                self.explode(gameMap,monsters,bombs,explosion_tiles,power_ups,players)
-
-        
-
-    def isValidRange(self,x,y):
-        """
-        Check if the given coordinates are within valid range.
-
-        :param x: The x-coordinate (column).
-        :param y: The y-coordinate (row).
-        :return: True if the coordinates are within valid range, False otherwise.
-        """
-        return x>=0 and x<=10 and y>=0 and y<=12
-
-    def activate_bomb(self):
-        """
-        Activate the bomb, starting its countdown or adding it to the game.
-        """
-        pass
-
-    def explode(self, game_map, monsters, bombs,explosion_tiles,power_ups,players):
-        """
-        Handle the bomb explosion logic.
-
-        :param game_map: The game map containing the layout of the game.
-        :param monsters: A list of monsters in the game.
-        :param bombs: A list of active bombs in the game.
-        :param explosion_tiles: A list of tiles affected by explosions.
-        :param power_ups: A list of power-ups available in the game.
-        :param players: A list of players in the game.
-        """
-        explosion_delay = 500  # Delay for distance 2 explosions in milliseconds
-        self.is_exploding = True
-
-        # Immediate effect on the bomb's tile
-        self.check_and_affect_tile(game_map, monsters, bombs, self.row, self.col,explosion_tiles,power_ups,players)
-        explosion_tiles.append((self.row,self.col,4500))
-        # Explode in each direction up to 2 tiles away
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Right, Down, Left, Up
-        for drow, dcol in directions:
-            for distance in range(1, self.blast_range+1):  # Up to 2 tiles away
-                affected_row, affected_col = self.row + drow * distance, self.col + dcol * distance
-                if not self.isValidRange(affected_row, affected_col) or game_map.isWall(affected_row, affected_col):
-                    break  # Stop if out of bounds or a wall is encountered
-                if game_map.isBrick(affected_row, affected_col):
-                    game_map.destroy_brick(affected_row, affected_col,power_ups,self.player)
-                    break  # Stop if a brick is encountered and destroyed
-                
-                self.check_and_affect_tile(game_map, monsters, bombs, affected_row, affected_col,explosion_tiles,power_ups,players)
-                explosion_tiles.append((affected_row,affected_col,4500+explosion_delay*distance))
-
-        game_map.unmark_bomb_tile(self.row, self.col)
-        self.player.bomb_exploded(self)
-        self.kill()
-
-    def check_and_affect_tile(self, game_map, monsters, bombs, row, col,explosion_tiles,power_ups,players):
-        """
-        Check and affect the specified tile during an explosion.
-
-        :param game_map: The game map containing the layout of the game.
-        :param monsters: A list of monsters in the game.
-        :param bombs: A list of active bombs in the game.
-        :param row: The row position of the tile.
-        :param col: The column position of the tile.
-        :param explosion_tiles: A list of tiles affected by explosions.
-        :param power_ups: A list of power-ups available in the game.
-        :param players: A list of players in the game.
-        """
-        # Check for other bombs and trigger their explosion
-        for bomb in bombs:
-            if bomb.row == row and bomb.col == col and not bomb.is_exploding:
-                bomb.explode(game_map,monsters,bombs,explosion_tiles,power_ups,players)
-
-        # Check for player in the affected tile
-        for player in players:
-            if player.row == row and player.col == col and not player.is_invincible:
-                #print("Player with id ", player.id, " died in bomb explosion!")
-                self.player.kill()
-                players.remove(player)
-
-        # Check for monsters in the affected tile
-        for monster in monsters:
-            if monster.row == row and monster.col == col:
-                monster.image = pygame.image.load("images/explosion_image.png")
-                monster.kill()
-        
-        
-        
-
-    def draw(self, screen):
-        """
-        Draw the bomb on the given screen.
-
-        :param screen: The screen surface to draw the bomb on.
-        """
-        screen.blit(self.image, self.rect)
\ No newline at end of file
+import pygame
+from explosion import Explosion
+from pygame.sprite import Sprite
+from resources import load_image
+from timing import get_ticks
+from collections import deque
+from occupancy import GridOccupant, occupants_at
+
+class Bomb(GridOccupant, Sprite):
+    def __init__(self, player, row, col, blast_range, explode_time):
+        """
+        Initialize the Bomb object.
+
+        :param player: The player who placed the bomb.
+        :param row: The row position of the bomb on the grid.
+        :param col: The column position of the bomb on the grid.
+        :param blast_range: The range of the bomb's explosion.
+        :param explode_time: The time in milliseconds until the bomb explodes.
+        """
+        super().__init__()
+        self.player = player
+        self.image = load_image("images/bomb_image.png")
+        self.rect = self.image.get_rect(topleft=(col * 40, row * 40))  # Modify the size accordingly
+        self.clock = pygame.time.Clock()
+        self.explodeTime = get_ticks() + explode_time
+        self.blast_range = blast_range
+        self.is_exploding = False
+        self.row = row
+        self.col = col
+        self.explosion_tiles = []
+        self.fuse = None  # The timer that explodes the bomb, when placed by a game with a TimerService
+
+
+    def update(self,gameMap,monsters,bombs,explosion_tiles,power_ups,players):
+        """
+        Update the state of the bomb.
+
+        :param gameMap: The game map containing the layout of the game.
+        :param monsters: A list of monsters in the game.
+        :param bombs: A list of active bombs in the game.
+        :param explosion_tiles: A list of tiles affected by explosions.
+        :param power_ups: A list of power-ups available in the game.
+        :param players: A list of players in the game.
+        """
+        if self.is_due():
+            self.explode(gameMap,monsters,bombs,explosion_tiles,power_ups,players)
+
+        
+
+    def isValidRange(self,x,y,game_map):
+        """
+        Check if the given coordinates are within the map.
+
+        :param x: The x-coordinate (row).
+        :param y: The y-coordinate (column).
+        :param game_map: The game map providing the bounds.
+        :return: True if the coordinates are within valid range, False otherwise.
+        """
+        return 0 <= x < game_map.height and 0 <= y < game_map.width
+
+    def activate_bomb(self):
+        """
+        Activate the bomb, starting its countdown or adding it to the game.
+        """
+        pass
+
+    def is_due(self, current_time=None):
+        """
+        Check if the bomb's timer has run out. Bombs of a player holding a detonator only explode on demand.
+
+        :param current_time: The current time in milliseconds, defaults to the active clock's time.
+        :return: True if the bomb should explode now, False otherwise.
+        """
+        if self.player.has_detonator or self.is_exploding:
+            return False
+        if current_time is None:
+            current_time = get_ticks()
+        return current_time >= self.explodeTime
+
+    def explode(self, game_map, monsters, bombs,explosion_tiles,power_ups,players):
+        """
+        Handle the bomb explosion logic, including every bomb set off by the blast.
+
+        :param game_map: The game map containing the layout of the game.
+        :param monsters: A list of monsters in the game.
+        :param bombs: A list of active bombs in the game.
+        :param explosion_tiles: A list of tiles affected by explosions.
+        :param power_ups: A list of power-ups available in the game.
+        :param players: A list of players in the game.
+        :return: The BlastReport of the whole chain reaction.
+        """
+        return resolve_blasts([self], game_map, monsters, bombs, explosion_tiles, power_ups, players)
+
+    def blast_cells(self, game_map):
+        """
+        Collect the tiles reached by the blast of this bomb, without changing anything.
+
+        The blast spreads up to `blast_range` tiles in each direction. It stops at walls and the map border,
+        and at the first brick, which is destroyed but not covered by the blast.
+
+        :param game_map: The game map containing the layout of the game.
+        :return: A tuple of the (row, col, delay) tiles covered by the blast, where delay is the explosion
+                 effect's delay in milliseconds, and the list of (row, col) bricks hit.
+        """
+        explosion_delay = 500  # Delay for each tile of distance in milliseconds
+        cells = [(self.row, self.col, 4500)]
+        bricks = []
+        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Right, Down, Left, Up
+        for drow, dcol in directions:
+            for distance in range(1, self.blast_range+1):
+                affected_row, affected_col = self.row + drow * distance, self.col + dcol * distance
+                if not self.isValidRange(affected_row, affected_col, game_map) or game_map.isWall(affected_row, affected_col):
+                    break  # Stop if out of bounds or a wall is encountered
+                if game_map.isBrick(affected_row, affected_col):
+                    bricks.append((affected_row, affected_col))
+                    break  # Stop if a brick is encountered and destroyed
+                cells.append((affected_row, affected_col, 4500+explosion_delay*distance))
+        return cells, bricks
+
+    def draw(self, screen):
+        """
+        Draw the bomb on the given screen.
+
+        :param screen: The screen surface to draw the bomb on.
+        """
+        screen.blit(self.image, self.rect)
+
+
+class BlastReport:
+    """
+    What a chain of bomb explosions did, as returned by `resolve_blasts`.
+
+    Attributes:
+        bombs (list): The bombs that exploded, in the order the chain reached them.
+        cells (dict): Maps each (row, col) covered by the blast to the delay of its explosion effect.
+        bricks (list): The (row, col) of every brick and obstacle destroyed.
+        power_ups (list): The power-ups dropped by the destroyed bricks.
+        players (list): The players killed by the blast.
+        monsters (list): The monsters killed by the blast.
+    """
+    def __init__(self):
+        self.bombs = []
+        self.cells = {}
+        self.bricks = []
+        self.power_ups = []
+        self.players = []
+        self.monsters = []
+
+
+def resolve_blasts(detonated, game_map, monsters, bombs, explosion_tiles, power_ups, players):
+    """
+    Explode a set of bombs together with every bomb their blasts reach.
+
+    The chain is followed with a work queue instead of recursion: each exploding bomb adds the bombs on its
+    blast tiles to the queue, so the chain is resolved in one pass however long it is. Nothing changes
+    while the blast tiles are collected; bricks, power-up drops and deaths are applied once afterwards,
+    so the groups are never modified while they are being looked at.
+
+    :param detonated: The bombs that explode first, e.g. the ones whose timer ran out this tick.
+    :param game_map: The game map containing the layout of the game.
+    :param monsters: A list of monsters in the game.
+    :param bombs: A list of active bombs in the game.
+    :param explosion_tiles: A list of tiles affected by explosions, extended with the blast tiles.
+    :param power_ups: A list of power-ups available in the game.
+    :param players: A list of players in the game.
+    :return: The BlastReport of the chain.
+    """
+    report = BlastReport()
+    brick_owners = {}
+    queue = deque()
+    for bomb in detonated:
+        if not bomb.is_exploding:
+            bomb.is_exploding = True
+            queue.append(bomb)
+
+    while queue:
+        bomb = queue.popleft()
+        report.bombs.append(bomb)
+        cells, bricks = bomb.blast_cells(game_map)
+        for row, col, delay in cells:
+            if (row, col) not in report.cells or delay < report.cells[(row, col)]:
+                report.cells[(row, col)] = delay
+            for other in occupants_at(bombs, row, col):
+                if not other.is_exploding:
+                    other.is_exploding = True
+                    queue.append(other)
+        for brick in bricks:
+            brick_owners.setdefault(brick, bomb.player)
+
+    for (row, col), owner in brick_owners.items():
+        report.bricks.append((row, col))
+        power_up = game_map.destroy_brick(row, col, power_ups, owner)
+        if power_up is not None:
+            report.power_ups.append(power_up)
+
+    for (row, col), delay in report.cells.items():
+        explosion_tiles.append((row, col, delay))
+        for player in occupants_at(players, row, col):
+            if not player.is_invincible:
+                #print("Player with id ", player.id, " died in bomb explosion!")
+                player.kill()
+                players.remove(player)
+                report.players.append(player)
+        for monster in occupants_at(monsters, row, col):
+            monster.image = load_image("images/explosion_image.png")
+            monster.kill()
+            report.monsters.append(monster)
+
+    for bomb in report.bombs:
+        game_map.unmark_bomb_tile(bomb.row, bomb.col)
+        bomb.player.bomb_exploded(bomb)
+        bomb.kill()
+    return report
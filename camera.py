@@ -0,0 +1,82 @@
+import pygame
+
+
+class Camera:
+    """
+    The part of the game world that is visible on the screen.
+
+    World positions are in pixels, with the map's top-left tile at (0, 0). Maps smaller than the screen are
+    drawn from the top-left corner; larger maps scroll so that the followed sprites stay in view.
+
+    Attributes:
+        rect (pygame.Rect): The visible world area; its size is the size of the screen.
+        world_width (int): Width of the whole map in pixels.
+        world_height (int): Height of the whole map in pixels.
+    """
+    def __init__(self, screen_width, screen_height, world_width, world_height):
+        """
+        Initializes the camera at the top-left corner of the map.
+
+        Parameters:
+            screen_width (int): Width of the screen in pixels.
+            screen_height (int): Height of the screen in pixels.
+            world_width (int): Width of the whole map in pixels.
+            world_height (int): Height of the whole map in pixels.
+        """
+        self.rect = pygame.Rect(0, 0, screen_width, screen_height)
+        self.world_width = world_width
+        self.world_height = world_height
+
+    @property
+    def offset(self):
+        """
+        The world position drawn at the screen's top-left corner.
+        """
+        return self.rect.topleft
+
+    def center_on(self, x, y):
+        """
+        Moves the camera so that the given world position is in the middle of the screen, without
+        showing anything past the edges of the map.
+
+        Parameters:
+            x (int): World x-coordinate in pixels.
+            y (int): World y-coordinate in pixels.
+        """
+        self.rect.x = max(0, min(x - self.rect.width // 2, self.world_width - self.rect.width))
+        self.rect.y = max(0, min(y - self.rect.height // 2, self.world_height - self.rect.height))
+
+    def follow(self, sprites):
+        """
+        Centers the camera on the middle of the given sprites, e.g. the living players.
+
+        Parameters:
+            sprites (iterable): Sprites with a `rect` attribute.
+        """
+        centers = [sprite.rect.center for sprite in sprites]
+        if centers:
+            self.center_on(sum(x for x, _ in centers) // len(centers), sum(y for _, y in centers) // len(centers))
+
+    def resize(self, screen_width, screen_height):
+        """
+        Changes the size of the visible area, e.g. after the window was resized.
+
+        Parameters:
+            screen_width (int): New width of the screen in pixels.
+            screen_height (int): New height of the screen in pixels.
+        """
+        center = self.rect.center
+        self.rect.size = (screen_width, screen_height)
+        self.center_on(*center)
+
+    def to_screen(self, rect):
+        """
+        Converts a world rect to the matching rect on the screen.
+
+        Parameters:
+            rect (pygame.Rect): A rect in world coordinates.
+
+        Returns:
+            pygame.Rect: The same rect in screen coordinates.
+        """
+        return rect.move(-self.rect.x, -self.rect.y)
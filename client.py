@@ -0,0 +1,175 @@
+import argparse
+import asyncio
+import json
+import time
+import pygame
+from game import ACTIONS
+from protocol import (HELLO, WELCOME, REJECT, INPUT, STATE, FRAME, HELLO_MESSAGE, WELCOME_HEADER, INPUT_MESSAGE, STATE_HEADER,
+                      encode, read_message)
+from replay import create_game
+from snapshot import patch, restore
+
+
+class GameClient:
+    """
+    Shows a game run by a GameServer and sends the actions of one player to it.
+
+    The client keeps the game the server describes but never steps it: every state the server sends is
+    restored into it before it is drawn, so the existing sprites render what the server simulated.
+
+    Attributes:
+        player_id (int): The id of the player the client controls, None before it joined.
+        game (Game): The game as last received, None before the client joined.
+        state (bytes): The latest state received from the server.
+        tick (int): The tick of the latest state.
+        dt (float): The length of a server tick in milliseconds.
+        sequence (int): The sequence number of the last input sent.
+        acked (int): The sequence number of the last input the server applied.
+        sent_times (dict): When each input that is not acknowledged yet was sent, by sequence number.
+        latencies (list): The time from sending an input to receiving the state it was applied in, in seconds.
+        bytes_received (int): The number of state bytes received, headers included.
+    """
+    def __init__(self):
+        self.player_id = None
+        self.game = None
+        self.state = b''
+        self.tick = 0
+        self.dt = None
+        self.sequence = 0
+        self.acked = 0
+        self.sent_times = {}
+        self.latencies = []
+        self.bytes_received = 0
+        self.synced = False
+        self.reader = None
+        self.writer = None
+
+    async def connect(self, host, port, player_id=0, screen=None, match_id=0):
+        """
+        Joins a game.
+
+        Parameters:
+            host (str): The server address.
+            port (int): The server port.
+            player_id (int): The player to control, 0 for any free one.
+            screen (pygame.Surface): The surface to render the game on, or None for a client that is not drawn.
+            match_id (int): The match to join on a MatchServer; a GameServer has a single one.
+
+        Raises:
+            ConnectionError: If the server has no place for the client.
+        """
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.writer.write(encode(HELLO, HELLO_MESSAGE.pack(player_id, match_id)))
+        message_type, payload = await read_message(self.reader)
+        if message_type == REJECT:
+            self.writer.close()
+            raise ConnectionError(payload.decode('utf-8'))
+        if message_type != WELCOME:
+            self.writer.close()
+            raise ConnectionError(f"Unexpected message {message_type} from the server")
+        self.player_id, self.dt, setup_length = WELCOME_HEADER.unpack_from(payload)
+        offset = WELCOME_HEADER.size
+        setup = json.loads(payload[offset:offset + setup_length])
+        self.game = create_game(setup, screen)
+        self.state = payload[offset + setup_length:]
+        self.synced = False
+        self.sync()
+
+    def send(self, action):
+        """
+        Sends an action of the client's player to the server.
+
+        Parameters:
+            action (str): One of ACTIONS.
+        """
+        self.sequence += 1
+        self.sent_times[self.sequence] = time.perf_counter()
+        self.writer.write(encode(INPUT, INPUT_MESSAGE.pack(self.sequence, ACTIONS.index(action))))
+
+    async def receive(self):
+        """
+        Waits for the next state from the server.
+
+        Returns:
+            int: The tick of the state.
+
+        Raises:
+            asyncio.IncompleteReadError: If the server closed the connection.
+        """
+        message_type, payload = await read_message(self.reader)
+        while message_type != STATE:
+            message_type, payload = await read_message(self.reader)
+        received = time.perf_counter()
+        self.bytes_received += FRAME.size + len(payload)
+        self.tick, acked = STATE_HEADER.unpack_from(payload)
+        self.state = patch(self.state, payload[STATE_HEADER.size:])
+        self.synced = False
+        for sequence in range(self.acked + 1, acked + 1):
+            sent = self.sent_times.pop(sequence, None)
+            if sent is not None:
+                self.latencies.append(received - sent)
+        self.acked = max(self.acked, acked)
+        return self.tick
+
+    def sync(self):
+        """Restores the latest state into the game, if it is not there yet."""
+        if not self.synced:
+            restore(self.game, self.state)
+            self.synced = True
+
+    def render(self):
+        """Draws the latest state."""
+        self.sync()
+        self.game.render()
+
+    async def close(self):
+        """Leaves the game."""
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def play(args):
+    pygame.init()
+    screen = pygame.display.set_mode((520, 440), pygame.RESIZABLE)
+    client = GameClient()
+    await client.connect(args.host, args.port, args.player, screen, args.match)
+    pygame.display.set_caption(f"Player {client.player_id}")
+    control_keys = client.game.roster[client.player_id].control_keys
+
+    async def receive_states():
+        while True:
+            await client.receive()
+
+    receiver = asyncio.create_task(receive_states())
+    try:
+        while not receiver.done() and client.game.winners is None:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+                if event.type == pygame.KEYDOWN and event.key in control_keys:
+                    client.send(ACTIONS[control_keys.index(event.key)])
+            client.render()
+            await asyncio.sleep(1 / 60)
+    finally:
+        receiver.cancel()
+        await client.close()
+        if client.latencies:
+            print(f"input to acknowledgement: {1000 * sum(client.latencies) / len(client.latencies):.1f} ms on average")
+        print(f"winners {client.game.winners}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Joins a game run by server.py.")
+    parser.add_argument('--host', default='127.0.0.1', help="Server address")
+    parser.add_argument('--port', type=int, default=5555, help="Server port")
+    parser.add_argument('--player', type=int, default=0, help="Player to control, 0 for any free one")
+    parser.add_argument('--match', type=int, default=0, help="Match to join when the server hosts several")
+    asyncio.run(play(parser.parse_args(argv)))
+
+
+if __name__ == '__main__':
+    main()
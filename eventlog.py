@@ -0,0 +1,168 @@
+import atexit
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Levels of an event, from the least to the most important
+DEBUG = 10
+INFO = 20
+WARNING = 30
+LEVEL_NAMES = {DEBUG: 'debug', INFO: 'info', WARNING: 'warning'}
+
+# A threshold above every level, for categories that are switched off
+OFF = 100
+
+# What the game logs about
+CATEGORIES = ('game', 'player', 'bomb', 'power_up', 'monster')
+
+
+class EventLog:
+    """
+    Collects what happens in a game without writing to the console in the frame loop.
+
+    Events are appended to a ring buffer as (time, level, category, message, args) and only formatted and
+    written by a background thread, every `interval` seconds or as soon as the buffer is half full. When
+    the writer falls behind, the oldest events are dropped instead of slowing the game down. Each category
+    has its own threshold, so an event below it, or of a category that is off, costs a dictionary lookup
+    and a comparison.
+
+    Attributes:
+        stream (file): Where events are written, or None for the current sys.stdout.
+        level (int): The threshold of the categories without one of their own.
+        thresholds (dict): The lowest level logged for each category.
+        buffer (deque): The events not written yet, at most `capacity` of them.
+        capacity (int): The number of events the buffer holds before it drops the oldest.
+        interval (float): How often the background thread writes the buffer, in seconds.
+        dropped (int): The number of events dropped because the buffer was full.
+    """
+    def __init__(self, stream=None, level=INFO, capacity=4096, interval=0.25):
+        self.stream = stream
+        self.level = level
+        self.thresholds = dict.fromkeys(CATEGORIES, level)
+        self.buffer = deque(maxlen=capacity)
+        self.capacity = capacity
+        self.interval = interval
+        self.dropped = 0
+        self.muted = 0
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.thread = None
+
+    def set_level(self, level):
+        """Sets the threshold of every category."""
+        self.level = level
+        for category in self.thresholds:
+            self.thresholds[category] = level
+
+    def enable(self, category, level=DEBUG):
+        """Logs the events of a category from the given level on."""
+        self.thresholds[category] = level
+
+    def disable(self, category):
+        """Stops logging the events of a category."""
+        self.thresholds[category] = OFF
+
+    def enabled(self, category, level):
+        """Returns whether an event of the category and level would be logged."""
+        return not self.muted and level >= self.thresholds.get(category, self.level)
+
+    def configure(self, spec):
+        """
+        Sets the thresholds from text such as 'info,bomb:debug,monster:off': a bare level applies to every
+        category and 'category:level' to one of them.
+
+        Raises:
+            ValueError: If a level is not one of LEVEL_NAMES or 'off'.
+        """
+        levels = {name: level for level, name in LEVEL_NAMES.items()}
+        levels['off'] = OFF
+        for part in filter(None, (part.strip() for part in spec.split(','))):
+            category, _, name = part.rpartition(':')
+            if name.lower() not in levels:
+                raise ValueError(f"Unknown log level {name!r}")
+            if category:
+                self.thresholds[category] = levels[name.lower()]
+            else:
+                self.set_level(levels[name.lower()])
+
+    def log(self, category, level, message, *args):
+        """
+        Logs an event. The message is only formatted with the arguments, as in `message % args`, when
+        it is written.
+
+        Parameters:
+            category (str): What the event is about, one of CATEGORIES.
+            level (int): DEBUG, INFO or WARNING.
+            message (str): The text of the event.
+            *args: Values for the placeholders in the message.
+        """
+        if self.muted or level < self.thresholds.get(category, self.level):
+            return
+        if len(self.buffer) == self.capacity:
+            self.dropped += 1
+        self.buffer.append((time.time(), level, category, message, args))
+        if self.thread is None:
+            self.start()
+        elif len(self.buffer) * 2 >= self.capacity:
+            self.wake.set()
+
+    # The shortcuts check the threshold themselves, so a dropped event costs a single call
+    def debug(self, category, message, *args):
+        if not self.muted and DEBUG >= self.thresholds.get(category, self.level):
+            self.log(category, DEBUG, message, *args)
+
+    def info(self, category, message, *args):
+        if not self.muted and INFO >= self.thresholds.get(category, self.level):
+            self.log(category, INFO, message, *args)
+
+    def warning(self, category, message, *args):
+        if not self.muted and WARNING >= self.thresholds.get(category, self.level):
+            self.log(category, WARNING, message, *args)
+
+    @contextmanager
+    def quiet(self):
+        """Drops every event logged during a `with` block, e.g. while matches are simulated in bulk."""
+        self.muted += 1
+        try:
+            yield self
+        finally:
+            self.muted -= 1
+
+    def format(self, event):
+        """Returns the line an event is written as."""
+        timestamp, level, category, message, args = event
+        if args:
+            message = message % args
+        return f"{time.strftime('%H:%M:%S', time.localtime(timestamp))} {LEVEL_NAMES.get(level, level)} {category}: {message}"
+
+    def flush(self):
+        """Writes every buffered event now."""
+        with self.lock:
+            if not self.buffer:
+                return
+            stream = self.stream if self.stream is not None else sys.stdout
+            lines = []
+            while self.buffer:
+                lines.append(self.format(self.buffer.popleft()))
+            try:
+                stream.write('\n'.join(lines) + '\n')
+                stream.flush()
+            except ValueError:
+                pass  # The stream was closed, e.g. while the interpreter shuts down
+
+    def start(self):
+        """Starts the background thread that writes the buffer."""
+        self.thread = threading.Thread(target=self.run, name='eventlog', daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            self.wake.wait(self.interval)
+            self.wake.clear()
+            self.flush()
+
+
+log = EventLog()
+atexit.register(log.flush)
@@ -1,254 +1,483 @@
-import pygame
-import random
-from map import Map
-from player import Player
-from gameField import GameField
-from monster import Monster, WallPassingMonster, PathfindingMonster, DecisionMakingMonster
-from bomb import Bomb
-from powerUp import PowerUp
-from explosion import Explosion
-
-class Game:
-   """
-    The main game class for managing game interactions, drawing, and game state.
-
-    Attributes:
-        screen (pygame.Surface): The display surface for rendering the game.
-        tile_size (int): Size of the tiles in pixels.
-        screen_width (int): Width of the game screen in pixels.
-        screen_height (int): Height of the game screen in pixels.
-        clock (pygame.time.Clock): Clock for managing frame rate.
-        game_map (Map): The game map containing tiles.
-        bombs (pygame.sprite.Group): Group of bomb sprites.
-        powerUps (pygame.sprite.Group): Group of power-up sprites.
-        explosions (pygame.sprite.Group): Group of explosion sprites.
-        explosion_tiles (list): List of explosion effect details.
-        players (pygame.sprite.Group): Group of player sprites.
-        monsters (pygame.sprite.Group): Group of monster sprites.
-
-    Parameters:
-        screen (pygame.Surface): The display surface where the game will be rendered.
-        map_number (int): The map number to load for this game session.
-        player_mode (int): The mode of the game determining the number of players.
-        num_of_rounds (int): Number of rounds to be played.
-    """ 
-   def __init__(self, screen, map_number, player_mode, num_of_rounds):
-        self.screen = screen
-        self.tile_size = 40
-        self.screen_width = self.tile_size * 13
-        self.screen_height = self.tile_size * 11
-        self.clock = pygame.time.Clock()
-
-        # Load the map
-        if map_number == 1:
-            map_filename = 'map1.txt'
-        elif map_number == 2:
-            map_filename = 'map2.txt'
-        else:
-            map_filename = 'map3.txt'
-
-        self.game_map = Map(map_filename, self.tile_size)
-        self.bombs = pygame.sprite.Group()
-        self.powerUps = pygame.sprite.Group()
-        self.explosions = pygame.sprite.Group()
-        self.explosion_tiles = []
-
-        # Initialize the game field
-        self.game_field = GameField(self.game_map)
-
-        # Player Group - Single for now
-        self.players = pygame.sprite.Group()
-        self.players.add(Player(1, 0, 0, 2, 2, [pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d,pygame.K_RETURN,pygame.K_o])) 
-        self.players.add(Player(2, 10, 12, 3, 3, [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,pygame.K_m,pygame.K_n]))
-        if player_mode == 3:
-            self.players.add(Player(3, 10, 0, 3, 3, [pygame.K_i, pygame.K_k, pygame.K_j, pygame.K_l,pygame.K_v,pygame.K_c]))
-
-        self.monsters = pygame.sprite.Group()
-        # Adding different types of monsters
-        monster_types = [Monster, WallPassingMonster, PathfindingMonster, DecisionMakingMonster]
-        for monster_class in monster_types:
-            row, col = self.get_random_position(self.game_map)
-            monster = monster_class(self.game_field, row, col, 1)  # Speed parameter is set to 1
-            self.monsters.add(monster)
-
-   def play(self, end_game_callback):
-       """
-        Handles the main game loop, processing events, updating game objects, and rendering them on the screen.
-
-        This method continuously processes events such as player input and system signals (e.g., quit events),
-        updates the positions and states of all game objects (players, monsters, bombs, etc.), and renders
-        the current state of the game to the display. The game loop runs until a stopping condition is met,
-        such as a player winning or all monsters being eliminated. Upon termination, it calls the provided
-        `end_game_callback` with the winner(s) as its argument.
-
-        Parameters:
-            end_game_callback (function): A callback function that is called with the list of winning player IDs
-                                        when the game ends, either through all other players being eliminated or all
-                                        monsters being killed.
-
-        Note:
-            This method is intended to be called once to start the game after all initial setup is completed.
-            It manages the game's frame rate, player interactions, and drawing the game state to the screen.
-        """
-       running = True
-       while running:
-           for event in pygame.event.get():
-               if event.type == pygame.QUIT:
-                   running = False
-               elif event.type == pygame.KEYDOWN:
-                   for player in self.players:
-                        if event.key in player.control_keys:
-                            player_coords = player.get_coordinates()
-                            if event.key == player.control_keys[0]:  # Move up
-                                if self.game_field.is_valid_move(player_coords, (-1, 0),player.ghost_mode,self.players):
-                                    player.move(-1, 0)
-                            elif event.key == player.control_keys[1]:  # Move down
-                                if self.game_field.is_valid_move(player_coords, (1, 0),player.ghost_mode,self.players):
-                                    player.move(1, 0)
-                            elif event.key == player.control_keys[2]:  # Move left
-                                if self.game_field.is_valid_move(player_coords, (0, -1),player.ghost_mode,self.players):
-                                    player.move(0, -1)
-                            elif event.key == player.control_keys[3]:  # Move right
-                                if self.game_field.is_valid_move(player_coords, (0, 1),player.ghost_mode,self.players):
-                                    player.move(0, 1) 
-                            elif event.key == player.control_keys[4]:  # If the Enter key is pressed
-                                if player.can_place_bomb():
-                                    #bomb = Bomb(game_field, row, col, 1)
-                                    bomb = Bomb(player,player.row, player.col, player.blast_range, 3000)
-                                    self.bombs.add(bomb)
-                                    self.game_map.mark_bomb_tile(bomb.row, bomb.col)
-                                    player.placed_bomb(bomb)
-                                elif (player.can_place_bomb()==False) and player.has_detonator:
-                                    for bomb in player.bomb_list:
-                                        bomb.explode(self.game_map,self.monsters,self.bombs,self.explosion_tiles,self.powerUps,self.players)
-                                    print('detonator should work')
-                                    player.has_detonator = False
-                                else:
-                                    print("Can't place bomb! Either you run out of bombs or there is a active bomb!")
-
-                            elif event.key == player.control_keys[5]: # place obstacle 
-                                placed = player.place_obstacle(self.game_map, player.row, player.col)
-
-           for monster in self.monsters:
-               monster.update(self.game_map, self.monsters, self.players)
-
-           for bomb in self.bombs:
-                bomb.update(self.game_map,self.monsters,self.bombs,self.explosion_tiles,self.powerUps,self.players)
-                
-           for event in pygame.event.get():
-                if event.type == pygame.USEREVENT + 1 and event.monster:
-                    event.monster.paused = False  # Unpause the monster
-
-           for effect in self.explosion_tiles:
-                current_time = pygame.time.get_ticks()
-                row, col , activation_time = effect
-                explosion = Explosion(self.game_field,row,col,activation_time)
-                self.explosions.add(explosion)
-                self.explosion_tiles.remove(effect)
-                #explosion.add(self.explosions,explosion_tiles,effect)
-                
-           if len(self.explosion_tiles)==0:
-                for explosion in list(self.explosions):  # Iterate over a copy to safely remove items
-                    if explosion.is_expired():
-                        self.explosions.remove(explosion)  # Remove the explosion if it has expired
-
-           for player in self.players:
-                player.update(self.game_map,self.players)
-                for power_up in self.powerUps:
-                    if pygame.sprite.collide_rect(player, power_up):
-                        print('tema bahalasdi')
-                        power_up.apply_effect(player,self.monsters)
-                        power_up.kill()  # This removes the power-up from all groups it belongs to
-
-                if player.is_invincible:
-                    remaining_time = max(0, player.invincibility_timer - pygame.time.get_ticks())
-                    if remaining_time < 1000:  # Less than 1 second remaining
-                        # Blink the player sprite or change color to indicate ending
-                        if (remaining_time // 200) % 2 == 0:
-                            player.image.set_alpha(128)  # Make player semi-transparent
-                        else:
-                            player.image.set_alpha(255)  # Normal visibility
-
-                if player.ghost_mode:
-                    remaining_time = max(0, player.ghost_timer - pygame.time.get_ticks())
-                    if remaining_time < 1000:  # Less than 1 second remaining
-                        # Blink the player sprite or change color to indicate ending
-                        if (remaining_time // 200) % 2 == 0:
-                            player.image.set_alpha(128)  # Make player semi-transparent
-                        else:
-                            player.image.set_alpha(255)  # Normal visibility
-
-            # Check for collisions between players and monsters
-           for player in self.players:
-                collisions = pygame.sprite.spritecollide(player, self.monsters, False)
-                if collisions:
-                    if(not player.is_invincible) :
-                        print("Player with id ", player.id, " was caught by a monster!")
-                        self.players.remove(player)
-                        player.kill()
-                    else:
-                        print("You are invincible!!!")
-
-            # Drawing
-           self.screen.fill((0, 0, 0))  # Clear the screen
-
-            # Render the map
-           self.game_map.draw(self.screen)
-
-            # Draw the monsters
-           self.monsters.draw(self.screen)
-
-            # Draw the player
-           self.players.draw(self.screen)
-
-            # draw the bombs
-
-           self.bombs.draw(self.screen)
-
-            # draw the explosions
-
-           self.explosions.draw(self.screen)
-
-            # draw the powerups 
-
-           self.powerUps.draw(self.screen)
-
-            # Update the display
-           pygame.display.update()
-
-            # Cap the frame rate
-           self.clock.tick(60)
-
-           if len(self.players) == 1:
-               winner = self.players.sprites()[0]
-               running = False
-               end_game_callback([winner.id])
-
-           # Check if all monsters are killed
-           if len(self.monsters) == 0:
-               print("All players were caught by monsters!")
-               winners = [player.id for player in self.players.sprites()]
-               running = False
-               end_game_callback(winners)
-
-   def get_random_position(self, game_map):
-       """
-        Generates a random position on the game map that is a floor tile.
-
-        This method randomly selects coordinates within the dimensions of the provided game map,
-        continuously retrying until it finds a position that corresponds to a floor tile. This ensures
-        that the position is suitable for placing game entities such as monsters or power-ups.
-
-        Parameters:
-            game_map (Map): The game map instance which contains tile information and dimensions.
-
-        Returns:
-            tuple: A tuple (row, col) representing a valid floor tile position on the map.
-        """
-       while True:
-           row = random.randint(0, game_map.height - 1)
-           col = random.randint(0, game_map.width - 1)
-           if game_map.isFloor(row, col):  # Checks if the tile is a floor
-               return row, col
-
-
+import pygame
+import random
+from map import Map
+from player import Player
+from gameField import GameField
+from monster import Monster, WallPassingMonster, PathfindingMonster, DecisionMakingMonster
+from bomb import Bomb, resolve_blasts
+from powerUp import PowerUp
+from explosion import Explosion
+from resources import images
+from renderer import DirtyRectRenderer
+from camera import Camera
+from timers import TimerService
+from timing import SimulationClock, STEP_MS, using_clock
+from rng import GameRandom
+from occupancy import GridGroup, occupants_at
+from eventlog import log
+from profiler import GROUP_SUBSYSTEMS, OVERLAY_KEY
+
+# Images that sprites spawn with or switch to in the middle of a round
+ROUND_IMAGES = [
+    "images/bomb_image.png",
+    "images/explosion_image.png",
+    "images/obstacle_image.png",
+    "images/ghost_player_image.png",
+    "images/invincible_player_image.png",
+    "images/powerup_image.png",
+    "images/range_powerup_image.png",
+    "images/detonator_powerup_image.png",
+    "images/ghost_powerup_image.png",
+    "images/invincibility_powerup_image.png",
+    "images/obstacle_powerup_image.png",
+    "images/monster_powerup_image.png",
+]
+
+# The monsters a game starts with, one of each kind
+MONSTER_TYPES = [Monster, WallPassingMonster, PathfindingMonster, DecisionMakingMonster]
+
+# What each of a player's control keys does, in the order of Player.control_keys
+ACTIONS = ('up', 'down', 'left', 'right', 'bomb', 'obstacle')
+MOVES = {'up': (-1, 0), 'down': (1, 0), 'left': (0, -1), 'right': (0, 1)}
+
+# The most wall-clock time Game.play catches up on in one frame, so a stalled frame cannot snowball
+MAX_FRAME_LAG = 250
+
+class Game:
+   """
+    The main game class for managing game interactions, drawing, and game state.
+
+    Attributes:
+        screen (pygame.Surface): The display surface for rendering the game.
+        tile_size (int): Size of the tiles in pixels.
+        screen_width (int): Width of the game screen in pixels.
+        screen_height (int): Height of the game screen in pixels.
+        clock (pygame.time.Clock): Clock for managing frame rate.
+        game_clock (SimulationClock): The clock game objects read the time from, advanced by `step`.
+        winners (list): The ids of the winning players once the game is over, None while it runs.
+        game_map (Map): The game map containing tiles.
+        camera (Camera): The part of the map that is visible on the screen.
+        bombs (GridGroup): Group of bomb sprites, indexed by cell.
+        powerUps (GridGroup): Group of power-up sprites, indexed by cell.
+        explosions (pygame.sprite.Group): Group of explosion sprites.
+        explosion_tiles (list): List of explosion effect details.
+        players (GridGroup): Group of player sprites, indexed by cell.
+        monsters (GridGroup): Group of monster sprites, indexed by cell.
+        renderer (DirtyRectRenderer): Renderer used when dirty-rect rendering is enabled, otherwise None.
+        seed (int): The seed of the game's random number generator.
+        rng (GameRandom): The game's random number generator, shared with the map and the monsters.
+        tick (int): The number of steps played.
+        roster (dict): Every player of the game by id, including the ones that died.
+        recorder (Recorder): Records the inputs of every step when the game is recorded for a replay, otherwise None.
+        profiler (FrameProfiler): Times the subsystems of every frame `play` runs when set, otherwise None.
+        timers (TimerService): Bomb fuses, explosion lifetimes and the end of player effects, drained every tick.
+        due_bombs (list): Bombs whose fuse burnt down this tick, exploded together once the timers are drained.
+        status_timers (dict): The pending effect expiry timer of each (player id, timer attribute).
+        deaths (list): A (game time, player id, cause) entry for every player that died. The cause is 'bomb',
+                       'ghost' for ending ghost mode inside a wall or brick, or the class name of the monster
+                       that caught the player.
+
+    Parameters:
+        screen (pygame.Surface): The display surface where the game will be rendered, or None for a game that
+                                 is only stepped and never rendered.
+        map_number (int or Map): The map number to load for this game session, or an already built Map,
+                                 e.g. one from Map.generate.
+        player_mode (int): The mode of the game determining the number of players.
+        num_of_rounds (int): Number of rounds to be played.
+        dirty_rects (bool): Whether to redraw and present only the changed parts of the screen each frame.
+        clock (SimulationClock): The clock game objects read the time from, a new one starting at 0 by default.
+                                 It must have `get_ticks()` and `advance(dt)`.
+        seed (int): Seed for the monster spawns, monster moves and power-up drops, or None for a random game.
+        monster_types (list): The monster classes to spawn, one monster per entry; MONSTER_TYPES by default.
+    """ 
+   def __init__(self, screen, map_number, player_mode, num_of_rounds, dirty_rects=False, clock=None, seed=None,
+                monster_types=None):
+        self.screen = screen
+        self.tile_size = 40
+        self.clock = pygame.time.Clock()
+        self.game_clock = clock if clock is not None else SimulationClock()
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.rng = GameRandom(self.seed)
+        self.player_mode = player_mode
+        self.monster_types = list(monster_types if monster_types is not None else MONSTER_TYPES)
+        self.tick = 0
+        self.recorder = None
+        self.profiler = None
+        self.winners = None
+        self.deaths = []
+
+        # Load the map
+        if isinstance(map_number, Map):
+            self.game_map = map_number
+        else:
+            if map_number == 1:
+                map_filename = 'map1.txt'
+            elif map_number == 2:
+                map_filename = 'map2.txt'
+            else:
+                map_filename = 'map3.txt'
+            self.game_map = Map(map_filename, self.tile_size)
+        self.game_map.rng = self.rng
+        if screen is not None:
+            self.screen_width, self.screen_height = screen.get_size()
+        else:
+            self.screen_width, self.screen_height = self.game_map.width * self.tile_size, self.game_map.height * self.tile_size
+        # Groups of sprites standing on a cell are indexed by cell, see occupancy.GridGroup
+        self.bombs = GridGroup()
+        self.powerUps = GridGroup()
+        self.explosions = pygame.sprite.Group()
+        self.explosion_tiles = []
+        self.timers = TimerService()
+        self.due_bombs = []
+        self.status_timers = {}
+
+        # Initialize the game field
+        self.game_field = GameField(self.game_map)
+
+        # Player Group - Single for now
+        self.players = GridGroup()
+        self.players.add(Player(1, 0, 0, 2, 2, [pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d,pygame.K_RETURN,pygame.K_o])) 
+        last_row, last_col = self.game_map.height - 1, self.game_map.width - 1
+        self.players.add(Player(2, last_row, last_col, 3, 3, [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,pygame.K_m,pygame.K_n]))
+        if player_mode == 3:
+            self.players.add(Player(3, last_row, 0, 3, 3, [pygame.K_i, pygame.K_k, pygame.K_j, pygame.K_l,pygame.K_v,pygame.K_c]))
+
+        self.roster = {player.id: player for player in self.players}
+
+        self.monsters = GridGroup()
+        # Adding different types of monsters
+        with using_clock(self.game_clock):
+            for monster_class in self.monster_types:
+                row, col = self.get_random_position(self.game_map)
+                monster = monster_class(self.game_field, row, col, 1)  # Speed parameter is set to 1
+                monster.rng = self.rng
+                self.monsters.add(monster)
+
+        # Decode everything the round can need now, so images.misses stays at 0 while it is played
+        images.preload(ROUND_IMAGES)
+        images.reset_stats()
+
+        # Scrolls over maps larger than the screen, keeping the players in view
+        self.camera = Camera(self.screen_width, self.screen_height,
+                             self.game_map.width * self.tile_size, self.game_map.height * self.tile_size)
+        self.camera.follow(self.players)
+
+        # Optional renderer that only redraws and presents the changed parts of the screen
+        self.renderer = DirtyRectRenderer(screen, self.game_map, self.camera) if dirty_rects and screen is not None else None
+
+   def play(self, end_game_callback):
+       """
+        Handles the main game loop, turning events into player inputs, advancing the game and rendering it.
+
+        The game is advanced in fixed steps of STEP_MS milliseconds, as many as the wall-clock time since the
+        previous frame covers, while frames are drawn at the display rate. Keypresses are applied in the first
+        step after they arrive. With a profiler set, every frame is timed per subsystem and OVERLAY_KEY shows
+        or hides the profiler's overlay. The loop runs until the game is over, i.e. one player is left or all monsters
+        were killed, and then calls the provided `end_game_callback` with the winner(s) as its argument.
+
+        Parameters:
+            end_game_callback (function): A callback function that is called with the list of winning player IDs
+                                        when the game ends, either through all other players being eliminated or all
+                                        monsters being killed.
+
+        Note:
+            This method is intended to be called once to start the game after all initial setup is completed.
+            It manages the game's frame rate, player interactions, and drawing the game state to the screen.
+        """
+       running = True
+       inputs = []
+       previous_time = pygame.time.get_ticks()
+       lag = 0
+       profiler = self.profiler
+       while running:
+           if profiler is not None:
+               profiler.begin_frame()
+           for event in pygame.event.get():
+               if event.type == pygame.QUIT:
+                   running = False
+               elif event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE):
+                   self.screen_width, self.screen_height = self.screen.get_size()
+                   self.camera.resize(self.screen_width, self.screen_height)
+                   if self.renderer is not None:
+                       self.renderer.invalidate()
+               elif event.type == pygame.KEYDOWN:
+                   if event.key == OVERLAY_KEY and profiler is not None:
+                       profiler.toggle()
+                       if self.renderer is not None:
+                           self.renderer.invalidate()
+                   for player in self.players:
+                        if event.key in player.control_keys:
+                            inputs.append((player.id, ACTIONS[player.control_keys.index(event.key)]))
+           if profiler is not None:
+               profiler.mark('events')
+
+           current_time = pygame.time.get_ticks()
+           lag = min(lag + current_time - previous_time, MAX_FRAME_LAG)
+           previous_time = current_time
+           while lag >= STEP_MS and self.winners is None:
+               self.step(inputs, STEP_MS)
+               inputs = []
+               lag -= STEP_MS
+
+            # Drawing
+           self.render(lag / STEP_MS)
+           if profiler is not None and profiler.visible:
+               pygame.display.update(profiler.draw(self.screen))
+               profiler.mark('overlay')
+
+            # Cap the frame rate
+           self.clock.tick(60)
+           if profiler is not None:
+               profiler.skip()
+               profiler.end_frame()
+
+           if self.winners is not None:
+               running = False
+               end_game_callback(self.winners)
+
+   def step(self, inputs=(), dt=STEP_MS):
+       """
+        Advances the game by one step: moves the game clock forward by `dt`, applies the players' inputs and
+        updates monsters, bombs, explosions and power-ups. Nothing is drawn and no events are read, so the
+        game can be stepped at any rate, or without a display.
+
+        Parameters:
+            inputs (iterable): (player id, action) pairs to apply, with actions from ACTIONS.
+            dt (float): The number of milliseconds the step covers.
+
+        Returns:
+            list: The ids of the winning players if the game is over, otherwise None.
+        """
+       if self.winners is not None:
+           return self.winners
+       if self.recorder is not None:
+           self.recorder.record(self, inputs, dt)
+       self.tick += 1
+       profiler = self.profiler
+       with using_clock(self.game_clock):
+           self.game_clock.advance(dt)
+           for player_id, action in inputs:
+               for player in self.players:
+                   if player.id == player_id:
+                       self.apply_input(player, action)
+           if profiler is not None:
+               profiler.mark('input')
+
+           # Chasing monsters share one distance field, computed only when the map or a player changed
+           for monster in self.monsters:
+               monster.update(self.game_map, self.monsters, self.players)
+           if profiler is not None:
+               profiler.mark('monsters')
+
+           # Fire the timers that are due; bombs whose fuse burnt down and the bombs they set off explode together
+           current_time = self.game_clock.get_ticks()
+           self.timers.run_due(current_time)
+           if self.due_bombs:
+                self.detonate([bomb for bomb in self.due_bombs if bomb.is_due(current_time)])
+                self.due_bombs = []
+           if profiler is not None:
+               profiler.mark('bombs')
+
+           while self.explosion_tiles:
+                row, col , activation_time = self.explosion_tiles.pop()
+                explosion = Explosion(self.game_field,row,col,activation_time)
+                self.explosions.add(explosion)
+                self.timers.schedule(explosion.creation_time + explosion.duration, explosion.kill)
+           if profiler is not None:
+               profiler.mark('explosions')
+
+           for player in self.players:
+                for power_up in occupants_at(self.powerUps, player.row, player.col):
+                    log.debug('power_up', "Player %d picked up a %s", player.id, type(power_up).__name__)
+                    power_up.apply_effect(player,self.monsters)
+                    power_up.kill()  # This removes the power-up from all groups it belongs to
+                    self.schedule_status_expiry(player)
+
+            # Check for collisions between players and monsters
+           for player in self.players:
+                # Sprites are at most one tile in size, so a monster catches a player on the same tile
+                collisions = occupants_at(self.monsters, player.row, player.col)
+                if collisions:
+                    if(not player.is_invincible) :
+                        log.info('player', "Player %d was caught by a monster!", player.id)
+                        self.players.remove(player)
+                        player.kill()
+                        self.deaths.append((self.game_clock.get_ticks(), player.id, type(collisions[0]).__name__))
+                    else:
+                        log.debug('player', "Player %d is invincible to a monster", player.id)
+           if profiler is not None:
+               profiler.mark('power_ups')
+
+       if len(self.players) <= 1:
+           self.winners = [player.id for player in self.players]  # Nobody wins if the last players died together
+       # Check if all monsters are killed
+       elif len(self.monsters) == 0:
+           log.info('game', "All monsters were killed!")
+           self.winners = [player.id for player in self.players.sprites()]
+       return self.winners
+
+   def apply_input(self, player, action):
+       """
+        Carries out one of a player's actions.
+
+        Parameters:
+            player (Player): The player acting.
+            action (str): One of ACTIONS.
+        """
+       if action in MOVES:
+           movement = MOVES[action]
+           if self.game_field.is_valid_move(player.get_coordinates(), movement,player.ghost_mode,self.players):
+               player.move(*movement)
+       elif action == 'bomb':
+           if player.can_place_bomb():
+               #bomb = Bomb(game_field, row, col, 1)
+               bomb = Bomb(player,player.row, player.col, player.blast_range, 3000)
+               self.bombs.add(bomb)
+               self.game_map.mark_bomb_tile(bomb.row, bomb.col)
+               bomb.fuse = self.timers.schedule(bomb.explodeTime, self.fuse_burnt, bomb)
+               player.placed_bomb(bomb)
+           elif (player.can_place_bomb()==False) and player.has_detonator:
+               self.detonate(list(player.bomb_list))
+               log.debug('bomb', "Player %d detonated their bombs", player.id)
+               player.has_detonator = False
+           else:
+               log.debug('bomb', "Player %d can't place a bomb, none left or in ghost mode", player.id)
+       elif action == 'obstacle':
+           player.place_obstacle(self.game_map, player.row, player.col)
+
+   def render(self, alpha=1.0):
+       """
+        Draws the current game state, independently of how often the game is stepped.
+
+        Parameters:
+            alpha (float): How far the game clock is between the last step and the next one, from 0 to 1.
+                           Sprites move from tile to tile, so they are drawn where they are; the value is
+                           there for drawing code that interpolates.
+        """
+       current_time = self.game_clock.get_ticks()
+       for player in self.players:
+           for active, timer in ((player.is_invincible, player.invincibility_timer), (player.ghost_mode, player.ghost_timer)):
+               if active:
+                   remaining_time = max(0, timer - current_time)
+                   if remaining_time < 1000:  # Less than 1 second remaining
+                       # Blink the player sprite or change color to indicate ending
+                       if (remaining_time // 200) % 2 == 0:
+                           player.image.set_alpha(128)  # Make player semi-transparent
+                       else:
+                           player.image.set_alpha(255)  # Normal visibility
+       self.draw()
+
+   def draw(self):
+       """
+        Draws the current game state and updates the display.
+
+        With dirty-rect rendering enabled only the areas that changed since the previous frame are redrawn
+        and pushed to the display; otherwise the whole window is repainted every frame.
+        """
+       groups = [self.monsters, self.players, self.bombs, self.explosions, self.powerUps]
+       profiler = self.profiler
+       self.camera.follow(self.players)
+       if self.renderer is not None:
+           self.renderer.draw(groups, profiler)
+           return
+
+       self.screen.fill((0, 0, 0))  # Clear the screen
+
+       # Render the visible part of the map
+       self.game_map.draw(self.screen, self.camera)
+       if profiler is not None:
+           profiler.mark('draw_map')
+
+       # Draw the monsters, players, bombs, explosions and power-ups that are in view
+       view = self.camera.rect
+       for group, subsystem in zip(groups, GROUP_SUBSYSTEMS):
+           for sprite in group:
+               if sprite.rect.colliderect(view):
+                   self.screen.blit(sprite.image, self.camera.to_screen(sprite.rect))
+           if profiler is not None:
+               profiler.mark(subsystem)
+
+       # Update the display
+       pygame.display.update()
+       if profiler is not None:
+           profiler.mark('display')
+
+   def fuse_burnt(self, bomb):
+       """
+        Called by a bomb's fuse timer; the bomb explodes together with the other bombs due in the same step.
+
+        Parameters:
+            bomb (Bomb): The bomb whose fuse burnt down.
+        """
+       self.due_bombs.append(bomb)
+
+   def detonate(self, bombs):
+       """
+        Explodes the given bombs together with every bomb their blasts reach, and cancels the fuses of
+        the bombs that exploded before their time.
+
+        Parameters:
+            bombs (list): The bombs to explode.
+
+        Returns:
+            BlastReport: What the explosions did.
+        """
+       report = resolve_blasts(bombs,self.game_map,self.monsters,self.bombs,self.explosion_tiles,self.powerUps,self.players)
+       for bomb in report.bombs:
+           self.timers.cancel(bomb.fuse)
+       for player in report.players:
+           self.deaths.append((self.game_clock.get_ticks(), player.id, 'bomb'))
+       return report
+
+   def schedule_status_expiry(self, player):
+       """
+        Schedules the end of the player's ghost mode and invincibility after a power-up was applied.
+        A pending expiry is replaced when picking up the same power-up again extended the effect.
+
+        Parameters:
+            player (Player): The player who picked up a power-up.
+        """
+       current_time = self.game_clock.get_ticks()
+       for attribute in ('ghost_timer', 'invincibility_timer'):
+           # Player.update ends an effect once the current time is past its timer
+           due = getattr(player, attribute) + 1
+           key = (player.id, attribute)
+           timer = self.status_timers.get(key)
+           if due > current_time and (timer is None or not timer.active or timer.due != due):
+               self.timers.cancel(timer)
+               self.status_timers[key] = self.timers.schedule(due, self.expire_status, player)
+
+   def expire_status(self, player):
+       """
+        Ends the player's effects that ran out. A player whose ghost mode ends inside a wall or brick dies.
+
+        Parameters:
+            player (Player): The player whose effect timer fired.
+        """
+       if player not in self.players:
+           return
+       player.update(self.game_map, self.players)
+       if player not in self.players:
+           self.deaths.append((self.game_clock.get_ticks(), player.id, 'ghost'))
+
+   def get_random_position(self, game_map):
+       """
+        Generates a random position on the game map that is a floor tile.
+
+        This method randomly selects coordinates within the dimensions of the provided game map,
+        continuously retrying until it finds a position that corresponds to a floor tile. This ensures
+        that the position is suitable for placing game entities such as monsters or power-ups.
+
+        Parameters:
+            game_map (Map): The game map instance which contains tile information and dimensions.
+
+        Returns:
+            tuple: A tuple (row, col) representing a valid floor tile position on the map.
+        """
+       while True:
+           row = self.rng.randint(0, game_map.height - 1)
+           col = self.rng.randint(0, game_map.width - 1)
+           if game_map.isFloor(row, col):  # Checks if the tile is a floor
+               return row, col
+
+
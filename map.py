@@ -1,117 +1,239 @@
-import pygame
-from pygame.sprite import Group
-from brick import Brick, Obstacle
-from wall import Wall
-from floor import Floor
-from powerUp import BombPowerUp, RangePowerUp,DetonatorPowerUp,GhostPowerUp, InvincibilityPowerUp, ObstaclePowerUp, MonsterPowerUp
-import random 
-
-class Map:
-    def __init__(self, filename, tile_size):
-        self.tile_size = tile_size
-        self.tiles_group = pygame.sprite.Group()  # Assuming use of pygame for sprite management
-        self.bomb_tiles = set()
-        self.load_map(filename)
-
-    def load_map(self, filename):
-        with open(f'maps/{filename}', 'r') as file:
-            lines = file.readlines()
-            self.width = len(lines[0].strip())
-            self.height = len(lines)
-            self.tile_matrix = [[None for _ in range(self.width)] for _ in range(self.height)]
-
-            for row, line in enumerate(lines):
-                for col, char in enumerate(line.strip()):
-                    if char == '0':
-                        tile = Floor()
-                    elif char == '1':
-                        tile = Wall()
-                    elif char == '2':
-                        tile = Brick()
-                    self.set_tile(row, col, tile)
-
-    def set_tile(self, row, col, tile):
-        self.tile_matrix[row][col] = tile
-        tile.rect.x = col * self.tile_size
-        tile.rect.y = row * self.tile_size
-        self.tiles_group.add(tile)
-
-    def is_passable(self, row, col):
-        if 0 <= row < self.height and 0 <= col < self.width:
-            tile = self.tile_matrix[row][col]
-            return tile.is_passable
-        return False
-
-    def can_pass(self, row, col, ignore_walls=False):
-        """Checks if the specified tile can be passed, optionally ignoring walls."""
-        if 0 <= row < self.height and 0 <= col < self.width:
-            tile = self.tile_matrix[row][col]
-            if isinstance(tile, Floor):
-                return True
-            elif ignore_walls and isinstance(tile, Wall):
-                return True
-            elif isinstance(tile, Brick):
-                return tile.is_passable  # assuming Brick might sometimes be passable
-            return False
-        return False
-
-    def mark_occupied(self, row, col, occupant):
-        if 0 <= row < self.height and 0 <= col < self.width:
-            self.occupancy_grid[row][col] = occupant
-
-    def mark_unoccupied(self, row, col):
-        if 0 <= row < self.height and 0 <= col < self.width:
-            self.occupancy_grid[row][col] = None
-
-    def is_tile_type(self, row, col, tile_type):
-        if 0 <= row < len(self.tile_matrix) and 0 <= col < len(self.tile_matrix[row]):
-            return isinstance(self.tile_matrix[row][col], tile_type)
-        return False
-    def destroy_brick(self, row, col,power_ups,player):
-        # Replace the brick tile with a floor tile, or simply remove the brick.
-        # Make sure you have a way to update the visual representation as well.
-            # Assuming you have a way to set a floor tile in place of a brick
-        if self.isObstacle(row,col):
-            player.active_obstacles-= 1  # Remove from the player's list
-        else:
-            if random.random() < 0.3:
-                power_up_type = random.choice([MonsterPowerUp,ObstaclePowerUp,DetonatorPowerUp,BombPowerUp, RangePowerUp,GhostPowerUp,InvincibilityPowerUp])#
-                power_up = power_up_type(col, row)
-                power_ups.add(power_up)
-        self.set_tile(row, col, Floor())
-            
-
-    def mark_bomb_tile(self, x, y):
-        """ Mark the tile at (x, y) as containing a bomb. """
-        self.bomb_tiles.add((x, y))
-
-    def unmark_bomb_tile(self, x, y):
-        """ Remove the mark from the tile at (x, y) after a bomb has exploded. """
-        self.bomb_tiles.discard((x, y))  # Safe to call even if the tile is not in the set
-
-    def isBomb(self, row, col):
-        """ Check if the tile at (x, y) has a bomb on it. """
-        return (row, col) in self.bomb_tiles
-
-
-    def isBrick(self, row, col):
-        return isinstance(self.tile_matrix[row][col], Brick) 
-    
-    def isObstacle(self, row, col):
-        return isinstance(self.tile_matrix[row][col], Obstacle) 
-    
-    def isFloor(self, row, col):
-        return isinstance(self.tile_matrix[row][col], Floor) 
-
-    def isWall(self, row, col):
-        return self.is_tile_type(row, col, Wall)
-
-    def isBrick(self, row, col):
-        return self.is_tile_type(row, col, Brick)
-
-    def isFloor(self, row, col):
-        return self.is_tile_type(row, col, Floor)
-
-
-    def draw(self, screen):
-        self.tiles_group.draw(screen)
\ No newline at end of file
+import pygame
+from pygame.sprite import Group
+from brick import Brick, Obstacle
+from wall import Wall
+from floor import Floor
+from powerUp import BombPowerUp, RangePowerUp,DetonatorPowerUp,GhostPowerUp, InvincibilityPowerUp, ObstaclePowerUp, MonsterPowerUp
+from resources import load_image
+import random 
+
+# Tile codes stored in Map.tiles, the same digits the map files use
+FLOOR = Floor.code
+WALL = Wall.code
+BRICK = Brick.code
+OBSTACLE = Obstacle.code
+
+TILE_IMAGES = {
+    FLOOR: "images/floor_image.png",
+    WALL: "images/wall_image.png",
+    BRICK: "images/brick_image.png",
+    OBSTACLE: "images/obstacle_image.png",
+}
+
+# The background is cached in square chunks of this many tiles, each rendered the first time it becomes visible
+CHUNK_TILES = 32
+
+# Lookup tables indexed by tile code
+PASSABLE = (True, False, False, False)
+BRICK_LIKE = (False, False, True, True)  # Obstacles are bricks that were placed by a player
+PASSABLE_MASK = bytes.maketrans(bytes((FLOOR, WALL, BRICK, OBSTACLE)), bytes(PASSABLE))
+
+# Turns the map file digits into tile codes and back
+MAP_DIGITS = bytes.maketrans(b'0123', bytes((FLOOR, WALL, BRICK, OBSTACLE)))
+TILE_DIGITS = bytes.maketrans(bytes((FLOOR, WALL, BRICK, OBSTACLE)), b'0123')
+
+TILE_CODES = {Floor: (FLOOR,), Wall: (WALL,), Brick: (BRICK, OBSTACLE), Obstacle: (OBSTACLE,)}
+
+class Map:
+    def __init__(self, filename, tile_size, lines=None):
+        self.tile_size = tile_size
+        self.bomb_tiles = set()
+        self.background_chunks = {}  # Pre-rendered tile layer by (chunk_row, chunk_col), built when first drawn
+        self.changed_tiles = []  # World rects of tiles changed since the background was last presented
+        self.version = 0  # Bumped on every change to the tiles or bombs, so cached paths know when they are stale
+        self.rng = random  # Decides the power-up drops, replaced by a game that runs on its own seed
+        if lines is None:
+            self.load_map(filename)
+        else:
+            self.load_lines(lines)
+
+    @classmethod
+    def generate(cls, width, height, tile_size, brick_density=0.3, seed=None):
+        """Creates a map with a generated layout, see `generate_layout`."""
+        return cls(None, tile_size, generate_layout(width, height, brick_density, seed))
+
+    def load_map(self, filename):
+        with open(f'maps/{filename}', 'r') as file:
+            self.load_lines(file.readlines())
+
+    def load_lines(self, lines):
+        """Loads the map from rows of tile digits, as found in the map files."""
+        lines = [line.strip() for line in lines if line.strip()]
+        self.width = len(lines[0])
+        self.height = len(lines)
+        # One byte per cell, row-major; cell (row, col) lives at row * width + col
+        self.tiles = bytearray(b''.join(line.encode('ascii') for line in lines).translate(MAP_DIGITS))
+        self.background_chunks = {}
+        self.version += 1
+
+    def layout(self):
+        """Returns the current tiles as rows of tile digits, the format `load_lines` reads."""
+        digits = self.tiles.translate(TILE_DIGITS).decode('ascii')
+        return [digits[row * self.width:(row + 1) * self.width] for row in range(self.height)]
+
+    def tile_at(self, row, col):
+        """Returns the tile code at the given cell, or None if it is outside the map."""
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self.tiles[row * self.width + col]
+        return None
+
+    def set_tile(self, row, col, tile):
+        """Sets the tile at the given cell. `tile` is a tile code, or a Floor/Wall/Brick/Obstacle instance."""
+        code = getattr(tile, 'code', tile)
+        self.tiles[row * self.width + col] = code
+        self.version += 1
+        chunk = self.background_chunks.get((row // CHUNK_TILES, col // CHUNK_TILES))
+        if chunk is not None:
+            self.draw_tile(chunk, row, col, (col % CHUNK_TILES) * self.tile_size, (row % CHUNK_TILES) * self.tile_size)
+            self.changed_tiles.append(pygame.Rect(col * self.tile_size, row * self.tile_size, self.tile_size, self.tile_size))
+
+    def draw_tile(self, surface, row, col, x, y):
+        """Draws a single tile at (x, y) on the given surface, over a floor so transparent tiles like obstacles look right."""
+        code = self.tiles[row * self.width + col]
+        if code != FLOOR:
+            surface.blit(load_image(TILE_IMAGES[FLOOR], alpha=False), (x, y))
+        surface.blit(load_image(TILE_IMAGES[code], alpha=code != OBSTACLE), (x, y))
+
+    def background_chunk(self, chunk_row, chunk_col):
+        """Returns the cached background of a chunk of tiles, rendering it on first use."""
+        chunk = self.background_chunks.get((chunk_row, chunk_col))
+        if chunk is None:
+            first_row, first_col = chunk_row * CHUNK_TILES, chunk_col * CHUNK_TILES
+            rows = min(CHUNK_TILES, self.height - first_row)
+            cols = min(CHUNK_TILES, self.width - first_col)
+            chunk = pygame.Surface((cols * self.tile_size, rows * self.tile_size))
+            if pygame.display.get_surface() is not None:
+                chunk = chunk.convert()
+            for row in range(first_row, first_row + rows):
+                for col in range(first_col, first_col + cols):
+                    self.draw_tile(chunk, row, col, (col - first_col) * self.tile_size, (row - first_row) * self.tile_size)
+            self.background_chunks[(chunk_row, chunk_col)] = chunk
+        return chunk
+
+    def is_passable(self, row, col):
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return PASSABLE[self.tiles[row * self.width + col]]
+        return False
+
+    def passability(self):
+        """Returns one byte per cell in the same layout as `tiles`, 1 where the tile is passable and 0 elsewhere."""
+        return self.tiles.translate(PASSABLE_MASK)
+
+    def can_pass(self, row, col, ignore_walls=False):
+        """Checks if the specified tile can be passed, optionally ignoring walls."""
+        if 0 <= row < self.height and 0 <= col < self.width:
+            code = self.tiles[row * self.width + col]
+            return PASSABLE[code] or (ignore_walls and code == WALL)
+        return False
+
+    def is_tile_type(self, row, col, tile_type):
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self.tiles[row * self.width + col] in TILE_CODES[tile_type]
+        return False
+
+    def destroy_brick(self, row, col,power_ups,player):
+        # Replace the brick tile with a floor tile, or simply remove the brick.
+        # Make sure you have a way to update the visual representation as well.
+            # Assuming you have a way to set a floor tile in place of a brick
+        # Returns the power-up dropped by the brick, or None
+        power_up = None
+        if self.isObstacle(row,col):
+            player.active_obstacles-= 1  # Remove from the player's list
+        else:
+            if self.rng.random() < 0.3:
+                power_up_type = self.rng.choice([MonsterPowerUp,ObstaclePowerUp,DetonatorPowerUp,BombPowerUp, RangePowerUp,GhostPowerUp,InvincibilityPowerUp])#
+                power_up = power_up_type(col, row)
+                power_ups.add(power_up)
+        self.set_tile(row, col, FLOOR)
+        return power_up
+            
+
+    def mark_bomb_tile(self, x, y):
+        """ Mark the tile at (x, y) as containing a bomb. """
+        self.bomb_tiles.add((x, y))
+        self.version += 1
+
+    def unmark_bomb_tile(self, x, y):
+        """ Remove the mark from the tile at (x, y) after a bomb has exploded. """
+        if (x, y) in self.bomb_tiles:  # Safe to call even if the tile is not in the set
+            self.bomb_tiles.discard((x, y))
+            self.version += 1
+
+    def isBomb(self, row, col):
+        """ Check if the tile at (x, y) has a bomb on it. """
+        return (row, col) in self.bomb_tiles
+
+
+    def isBrick(self, row, col):
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return BRICK_LIKE[self.tiles[row * self.width + col]]
+        return False
+
+    def isObstacle(self, row, col):
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self.tiles[row * self.width + col] == OBSTACLE
+        return False
+
+    def isFloor(self, row, col):
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self.tiles[row * self.width + col] == FLOOR
+        return False
+
+    def isWall(self, row, col):
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self.tiles[row * self.width + col] == WALL
+        return False
+
+    def draw(self, screen, camera=None):
+        """Draws the part of the map the camera sees, or the top-left of the map without a camera."""
+        view = camera.rect if camera is not None else screen.get_rect()
+        self.draw_area(screen, view, view.topleft)
+
+    def draw_area(self, screen, area, offset=(0, 0)):
+        """Draws the world rect `area` of the map at its position on the screen, given the world `offset` of the screen."""
+        chunk_size = CHUNK_TILES * self.tile_size
+        area = area.clip(pygame.Rect(0, 0, self.width * self.tile_size, self.height * self.tile_size))
+        if not area:
+            return
+        for chunk_row in range(area.top // chunk_size, (area.bottom - 1) // chunk_size + 1):
+            for chunk_col in range(area.left // chunk_size, (area.right - 1) // chunk_size + 1):
+                chunk = self.background_chunk(chunk_row, chunk_col)
+                chunk_rect = chunk.get_rect(topleft=(chunk_col * chunk_size, chunk_row * chunk_size))
+                part = area.clip(chunk_rect)
+                screen.blit(chunk, (part.x - offset[0], part.y - offset[1]), part.move(-chunk_rect.x, -chunk_rect.y))
+
+
+def generate_layout(width, height, brick_density=0.3, seed=None):
+    """
+    Generates the rows of a map in the style of the shipped maps: walls on every odd row and column,
+    bricks scattered over the remaining cells and the corners kept free for the players to spawn, also
+    on maps with an even width or height, whose last row or column falls on the walls.
+
+    Args:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        brick_density (float): The chance of a free cell being a brick.
+        seed (int): Seed for the random layout, or None.
+
+    Returns:
+        list: One string of tile digits per row.
+    """
+    rng = random.Random(seed)
+    spawn_cells = set()
+    for corner_row, corner_col in [(0, 0), (0, width - 1), (height - 1, 0), (height - 1, width - 1)]:
+        for drow, dcol in [(0, 0), (0, 1), (1, 0), (0, -1), (-1, 0)]:
+            spawn_cells.add((corner_row + drow, corner_col + dcol))
+    lines = []
+    for row in range(height):
+        line = []
+        for col in range(width):
+            if (row, col) in spawn_cells:
+                line.append('0')
+            elif row % 2 == 1 and col % 2 == 1:
+                line.append('1')
+            elif rng.random() < brick_density:
+                line.append('2')
+            else:
+                line.append('0')
+        lines.append(''.join(line))
+    return lines
\ No newline at end of file
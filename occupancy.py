@@ -0,0 +1,113 @@
+import pygame
+
+
+class GridOccupant:
+    """
+    Mixin for sprites that stand on a map cell. Changing `row` or `col` keeps every GridGroup the sprite
+    belongs to up to date, so the groups always know which sprites are on which cell.
+
+    Must come before pygame's Sprite in the list of base classes, and the position may only be set after
+    `Sprite.__init__` ran.
+    """
+    @property
+    def row(self):
+        return self._row
+
+    @row.setter
+    def row(self, value):
+        self.set_cell(value, getattr(self, '_col', None))
+
+    @property
+    def col(self):
+        return self._col
+
+    @col.setter
+    def col(self, value):
+        self.set_cell(getattr(self, '_row', None), value)
+
+    def set_cell(self, row, col):
+        """
+        Moves the sprite to a cell, updating its groups once instead of once per coordinate.
+
+        Args:
+            row (int): The new row.
+            col (int): The new column.
+        """
+        old_cell = (getattr(self, '_row', None), getattr(self, '_col', None))
+        if old_cell == (row, col):
+            return
+        self._row = row
+        self._col = col
+        for group in self.groups():
+            if isinstance(group, GridGroup):
+                group.moved(self, old_cell)
+
+
+class GridGroup(pygame.sprite.Group):
+    """
+    A sprite group that also indexes its sprites by the cell they stand on, so looking up who is at a
+    cell does not depend on how many sprites the group holds.
+
+    Attributes:
+        cells (dict): Maps a (row, col) cell to the list of sprites on it.
+    """
+    def __init__(self, *sprites):
+        self.cells = {}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.cells.setdefault((sprite.row, sprite.col), []).append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._unindex(sprite, (sprite.row, sprite.col))
+
+    def moved(self, sprite, old_cell):
+        """
+        Moves a sprite of this group from its old cell to the one it stands on now.
+
+        Args:
+            sprite (GridOccupant): The sprite that moved.
+            old_cell (tuple): The (row, col) the sprite stood on before.
+        """
+        self._unindex(sprite, old_cell)
+        self.cells.setdefault((sprite.row, sprite.col), []).append(sprite)
+
+    def at(self, row, col):
+        """
+        Returns the sprites of this group standing on a cell.
+
+        Args:
+            row (int): The row of the cell.
+            col (int): The column of the cell.
+
+        Returns:
+            list: A new list, so the group can be changed while iterating over it.
+        """
+        return list(self.cells.get((row, col), ()))
+
+    def _unindex(self, sprite, cell):
+        occupants = self.cells.get(cell)
+        if occupants is not None and sprite in occupants:
+            occupants.remove(sprite)
+            if not occupants:
+                del self.cells[cell]
+
+
+def occupants_at(sprites, row, col):
+    """
+    Returns the sprites standing on a cell, from the cell index if `sprites` is a GridGroup and by
+    checking every sprite otherwise.
+
+    Args:
+        sprites (iterable): A GridGroup, or any group or list of sprites with `row` and `col`.
+        row (int): The row of the cell.
+        col (int): The column of the cell.
+
+    Returns:
+        list: The sprites on the cell.
+    """
+    if isinstance(sprites, GridGroup):
+        return sprites.at(row, col)
+    return [sprite for sprite in sprites if sprite.row == row and sprite.col == col]
@@ -0,0 +1,154 @@
+import csv
+import time
+from collections import deque
+import pygame
+
+# The parts of a frame that are timed, in the order they run. Each sprite group is drawn by its own call.
+SUBSYSTEMS = (
+    'events',           # reading the pygame event queue
+    'input',            # recording and applying the players' inputs
+    'monsters',         # monster updates, including the pathfinding searches
+    'bombs',            # due timers and bomb explosions with their chain reactions
+    'explosions',       # creating the explosion sprites
+    'power_ups',        # power-up pickups and player/monster collisions
+    'draw_map',         # clearing and drawing the map, or finding and restoring the dirty areas
+    'draw_monsters',
+    'draw_players',
+    'draw_bombs',
+    'draw_explosions',
+    'draw_power_ups',
+    'display',          # presenting the frame
+    'overlay',          # drawing the profiler overlay itself
+)
+
+# The subsystems drawing the sprite groups, in the order Game.draw passes the groups
+GROUP_SUBSYSTEMS = ('draw_monsters', 'draw_players', 'draw_bombs', 'draw_explosions', 'draw_power_ups')
+
+# Key that shows and hides the overlay while a game is played
+OVERLAY_KEY = pygame.K_F3
+
+
+class FrameProfiler:
+    """
+    Times the subsystems of every frame Game.play runs, keeps the last frames for a rolling p50/p99 per
+    subsystem that can be drawn over the game, and optionally writes every frame's timings to a CSV file.
+
+    Frames are timed by marks instead of nested timers: `mark(name)` adds the time since the previous mark to
+    `name`, so each boundary costs a single clock read. Time spent between `skip()` and the next mark is not
+    counted, e.g. waiting for the frame rate cap.
+
+    Attributes:
+        window (int): The number of frames the percentiles cover.
+        samples (dict): The last `window` timings of each subsystem in milliseconds.
+        totals (deque): The last `window` frame times in milliseconds, without skipped time.
+        current (dict): The timings of the frame being measured, in seconds.
+        frame (int): The number of frames measured.
+        visible (bool): Whether the overlay is drawn.
+        refresh (int): How many frames the overlay shows the same numbers before they are computed again.
+        csv_file (file): Where every frame's timings are written, None if they are not.
+    """
+    def __init__(self, window=120, csv_path=None, visible=False, refresh=15):
+        self.window = window
+        self.samples = {name: deque(maxlen=window) for name in SUBSYSTEMS}
+        self.totals = deque(maxlen=window)
+        self.current = dict.fromkeys(SUBSYSTEMS, 0.0)
+        self.frame = 0
+        self.visible = visible
+        self.refresh = refresh
+        self.last = time.perf_counter()
+        self.overlay = None
+        self.font = None
+        self.csv_file = None
+        self.writer = None
+        if csv_path is not None:
+            self.csv_file = open(csv_path, 'w', newline='')
+            self.writer = csv.writer(self.csv_file)
+            self.writer.writerow(('frame',) + SUBSYSTEMS + ('total',))
+
+    def begin_frame(self):
+        """Starts measuring a frame."""
+        for name in self.current:
+            self.current[name] = 0.0
+        self.last = time.perf_counter()
+
+    def mark(self, name):
+        """Adds the time since the previous mark to a subsystem of the current frame."""
+        now = time.perf_counter()
+        self.current[name] += now - self.last
+        self.last = now
+
+    def skip(self):
+        """Leaves the time until the next mark out of the frame."""
+        self.last = time.perf_counter()
+
+    def end_frame(self):
+        """Stores the timings of the current frame and writes them to the CSV file."""
+        total = 0.0
+        for name, seconds in self.current.items():
+            self.samples[name].append(seconds * 1000)
+            total += seconds
+        self.totals.append(total * 1000)
+        self.frame += 1
+        if self.writer is not None:
+            self.writer.writerow([self.frame] + [f'{self.current[name] * 1000:.3f}' for name in SUBSYSTEMS]
+                                 + [f'{total * 1000:.3f}'])
+        if self.frame % self.refresh == 0:
+            self.overlay = None
+
+    def percentiles(self, name):
+        """
+        Returns the rolling p50 and p99 of a subsystem in milliseconds, or of whole frames for 'total'.
+        Both are 0 before the first frame.
+        """
+        samples = sorted(self.totals if name == 'total' else self.samples[name])
+        if not samples:
+            return 0.0, 0.0
+        return samples[len(samples) // 2], samples[min(len(samples) - 1, len(samples) * 99 // 100)]
+
+    def summary(self):
+        """Returns the rolling (p50, p99) of every subsystem and of whole frames, by name."""
+        return {name: self.percentiles(name) for name in SUBSYSTEMS + ('total',)}
+
+    def toggle(self):
+        """Shows or hides the overlay."""
+        self.visible = not self.visible
+        self.overlay = None
+
+    def draw(self, screen):
+        """
+        Draws the rolling p50/p99 of every subsystem in the top-left corner of the screen.
+
+        Parameters:
+            screen (pygame.Surface): The surface to draw on.
+
+        Returns:
+            pygame.Rect: The area drawn on, to be presented.
+        """
+        if self.overlay is None:
+            self.overlay = self.render_overlay()
+        return screen.blit(self.overlay, (0, 0))
+
+    def render_overlay(self):
+        """Renders the overlay text on a translucent background."""
+        if self.font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.font = pygame.font.Font('assets/font.ttf', 8)
+        lines = [f"{'ms':<16}{'p50':>7}{'p99':>7}"]
+        for name, (p50, p99) in self.summary().items():
+            lines.append(f"{name:<16}{p50:>7.2f}{p99:>7.2f}")
+        rendered = [self.font.render(line, True, (255, 255, 255)) for line in lines]
+        line_height = self.font.get_linesize()
+        overlay = pygame.Surface((max(text.get_width() for text in rendered) + 8, line_height * len(lines) + 8),
+                                 pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        for index, text in enumerate(rendered):
+            overlay.blit(text, (4, 4 + index * line_height))
+        return overlay
+
+    def close(self):
+        """Closes the CSV file."""
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+            self.writer = None
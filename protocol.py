@@ -0,0 +1,36 @@
+import struct
+
+# Messages between a game server and its clients, each a FRAME header followed by the payload
+HELLO = 1    # client: the match to join and the id of the player to control, 0 for any free one
+WELCOME = 2  # server: the client's player id, the game setup as JSON and the full current state
+REJECT = 3   # server: why the client cannot join, as text
+INPUT = 4    # client: an action of its player
+STATE = 5    # server: a tick's state as a delta from the previous one, see snapshot.diff
+
+FRAME = struct.Struct('<BI')            # message type, payload length
+HELLO_MESSAGE = struct.Struct('<BI')    # requested player id, match id (0 on a single game server)
+WELCOME_HEADER = struct.Struct('<BdI')  # player id, step length, setup length; setup and state follow
+INPUT_MESSAGE = struct.Struct('<IB')    # sequence number, action index into ACTIONS
+STATE_HEADER = struct.Struct('<II')     # tick, sequence number of the client's last applied input; delta follows
+
+
+def encode(message_type, payload=b''):
+    """Returns a message ready to be written to a stream."""
+    return FRAME.pack(message_type, len(payload)) + payload
+
+
+async def read_message(reader):
+    """
+    Reads the next message from a stream.
+
+    Parameters:
+        reader (asyncio.StreamReader): The stream to read from.
+
+    Returns:
+        tuple: The message type and its payload.
+
+    Raises:
+        asyncio.IncompleteReadError: If the stream ended.
+    """
+    message_type, length = FRAME.unpack(await reader.readexactly(FRAME.size))
+    return message_type, await reader.readexactly(length)
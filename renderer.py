@@ -0,0 +1,133 @@
+import pygame
+from profiler import GROUP_SUBSYSTEMS
+
+
+class DirtyRectRenderer:
+    """
+    Renders a game frame by redrawing and presenting only the screen areas that changed.
+
+    The renderer remembers where every sprite was drawn in the previous frame and with which image. A sprite
+    that moved, changed its image or alpha, appeared or disappeared marks its old and new rect as dirty, and
+    so does every map tile changed through `Map.set_tile`. Dirty areas are restored from the map's background
+    layer, the sprites overlapping them are drawn again and only those rects are pushed to the display.
+    Scrolling the camera repaints the whole window.
+
+    Attributes:
+        screen (pygame.Surface): The display surface.
+        game_map (Map): The map providing the background layer.
+        camera (Camera): The visible part of the world.
+        sprite_states (dict): The rect, image and alpha each sprite was drawn with in the last frame.
+        full_redraw (bool): Whether the next frame repaints and presents the whole window.
+        background_color (tuple): The color used to clear the window on full redraws.
+    """
+    def __init__(self, screen, game_map, camera, background_color=(0, 0, 0)):
+        """
+        Initializes the renderer. The first frame is always a full redraw.
+
+        Parameters:
+            screen (pygame.Surface): The display surface.
+            game_map (Map): The map providing the background layer.
+            camera (Camera): The visible part of the world.
+            background_color (tuple): The color used to clear the window on full redraws.
+        """
+        self.screen = screen
+        self.game_map = game_map
+        self.camera = camera
+        self.sprite_states = {}
+        self.full_redraw = True
+        self.background_color = background_color
+        self.view = camera.rect.copy()
+
+    def invalidate(self):
+        """
+        Requests a full redraw on the next frame, e.g. after the window was resized or exposed.
+        """
+        self.full_redraw = True
+
+    def draw(self, groups, profiler=None):
+        """
+        Draws one frame and updates the changed parts of the display.
+
+        Parameters:
+            groups (list): Sprite groups in the order they are drawn, after the map.
+            profiler (FrameProfiler): Times the map, every group and the display update when given.
+
+        Returns:
+            list: The screen rects pushed to the display this frame.
+        """
+        view = self.camera.rect
+        if self.full_redraw or view != self.view:
+            return self.draw_full(groups, profiler)
+
+        # Dirty areas are collected in world coordinates
+        dirty = self.game_map.changed_tiles
+        self.game_map.changed_tiles = []
+        states = {}
+        for group in groups:
+            for sprite in group:
+                state = (sprite.rect.copy(), sprite.image, sprite.image.get_alpha())
+                states[sprite] = state
+                previous = self.sprite_states.pop(sprite, None)
+                if previous != state:
+                    dirty.append(state[0])
+                    if previous is not None:
+                        dirty.append(previous[0])
+        # Whatever is left was drawn last frame but is gone now
+        for rect, _, _ in self.sprite_states.values():
+            dirty.append(rect)
+        self.sprite_states = states
+
+        dirty = [rect.clip(view) for rect in dirty if rect.colliderect(view)]
+        if not dirty:
+            if profiler is not None:
+                profiler.mark('draw_map')
+            return dirty
+
+        offset = view.topleft
+        for rect in dirty:
+            self.game_map.draw_area(self.screen, rect, offset)
+        if profiler is not None:
+            profiler.mark('draw_map')
+        for group, subsystem in zip(groups, GROUP_SUBSYSTEMS):
+            for sprite in group:
+                if sprite.rect.collidelist(dirty) != -1:
+                    self.screen.blit(sprite.image, self.camera.to_screen(sprite.rect))
+            if profiler is not None:
+                profiler.mark(subsystem)
+        screen_rects = [self.camera.to_screen(rect) for rect in dirty]
+        pygame.display.update(screen_rects)
+        if profiler is not None:
+            profiler.mark('display')
+        return screen_rects
+
+    def draw_full(self, groups, profiler=None):
+        """
+        Repaints the whole window and presents it.
+
+        Parameters:
+            groups (list): Sprite groups in the order they are drawn, after the map.
+            profiler (FrameProfiler): Times the map, every group and the display update when given.
+
+        Returns:
+            list: A single rect covering the window.
+        """
+        view = self.camera.rect
+        self.screen.fill(self.background_color)
+        self.game_map.draw(self.screen, self.camera)
+        self.game_map.changed_tiles = []
+        self.sprite_states = {}
+        if profiler is not None:
+            profiler.mark('draw_map')
+        for group, subsystem in zip(groups, GROUP_SUBSYSTEMS):
+            for sprite in group:
+                if sprite.rect.colliderect(view):
+                    self.screen.blit(sprite.image, self.camera.to_screen(sprite.rect))
+                self.sprite_states[sprite] = (sprite.rect.copy(), sprite.image, sprite.image.get_alpha())
+            if profiler is not None:
+                profiler.mark(subsystem)
+        pygame.display.update()
+        if profiler is not None:
+            profiler.mark('display')
+        self.view = view.copy()
+        self.full_redraw = False
+        return [self.screen.get_rect()]
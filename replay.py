@@ -0,0 +1,229 @@
+import argparse
+import base64
+import json
+import zlib
+import pygame
+from game import Game, ACTIONS, MONSTER_TYPES
+from map import Map
+from snapshot import capture, restore
+from timing import SimulationClock, STEP_MS
+
+# A recorder saves a snapshot every this many ticks, 10 seconds of game time at the default step
+SNAPSHOT_INTERVAL = 600
+
+REPLAY_FORMAT = 2
+
+MONSTER_CLASSES = {monster_class.__name__: monster_class for monster_class in MONSTER_TYPES}
+
+
+def game_setup(game):
+    """
+    Returns what is needed to create a game again before its first step: its seed, players, monster types
+    and map, as plain values.
+    """
+    return {
+        'seed': game.seed,
+        'player_mode': game.player_mode,
+        'monster_types': [monster_class.__name__ for monster_class in game.monster_types],
+        'map': game.game_map.layout(),
+    }
+
+
+def create_game(setup, screen=None):
+    """
+    Creates a game from a setup returned by `game_setup`.
+
+    Parameters:
+        setup (dict): The seed, players, monster types and map of the game.
+        screen (pygame.Surface): The surface to render the game on, or None for a game that is not drawn.
+
+    Returns:
+        Game: The new game, driven by its own simulation clock.
+    """
+    game_map = Map(None, 40, lines=setup['map'])
+    return Game(screen, game_map, setup['player_mode'], 1, clock=SimulationClock(), seed=setup['seed'],
+                monster_types=[MONSTER_CLASSES[name] for name in setup['monster_types']])
+
+
+class Recorder:
+    """
+    Records a game for a replay: its seed, map and players, the inputs of every step and a snapshot of the
+    whole game every `snapshot_interval` ticks, so a replay can be watched from any point without
+    simulating it from the start.
+
+    Create the recorder right after the game, before it is stepped; it attaches itself to the game and is
+    called by `Game.step`.
+
+    Attributes:
+        header (dict): What is needed to create the game again.
+        inputs (list): A (tick, player id, action index) entry per input, action indices into ACTIONS.
+        snapshots (dict): The state captured before the step of each snapshot tick.
+        snapshot_interval (int): The number of ticks between two snapshots.
+        ticks (int): The number of steps recorded.
+    """
+    def __init__(self, game, snapshot_interval=SNAPSHOT_INTERVAL):
+        self.header = dict(game_setup(game), format=REPLAY_FORMAT, dt=None)
+        self.inputs = []
+        self.snapshots = {}
+        self.snapshot_interval = snapshot_interval
+        self.ticks = 0
+        game.recorder = self
+
+    def record(self, game, inputs, dt):
+        """
+        Records the inputs of the step the game is about to play.
+
+        Parameters:
+            game (Game): The recorded game.
+            inputs (iterable): (player id, action) pairs applied in the step.
+            dt (float): The length of the step in milliseconds.
+        """
+        if self.header['dt'] is None:
+            self.header['dt'] = dt
+        elif dt != self.header['dt']:
+            raise ValueError(f"Replays need steps of the same length, got {dt} after {self.header['dt']}")
+        if game.tick % self.snapshot_interval == 0:
+            self.snapshots[game.tick] = capture(game)
+        for player_id, action in inputs:
+            self.inputs.append((game.tick, player_id, ACTIONS.index(action)))
+        self.ticks = game.tick + 1
+
+    def save(self, path, winners=None):
+        """
+        Writes the replay to a file as zlib-compressed JSON, with the snapshots in base64.
+
+        Parameters:
+            path (str): The replay file.
+            winners (list): The outcome of the game, stored so playback can be checked against it.
+        """
+        with open(path, 'wb') as file:
+            file.write(zlib.compress(json.dumps(self.data(winners), separators=(',', ':')).encode('utf-8'), 9))
+
+    def data(self, winners=None):
+        """
+        Returns the recording as a dict of plain values, as written by `save` and read by `Replay`.
+        """
+        return dict(self.header, ticks=self.ticks, winners=winners, inputs=self.inputs,
+                    snapshots={str(tick): base64.b64encode(state).decode('ascii') for tick, state in self.snapshots.items()})
+
+
+class Replay:
+    """
+    A recorded game that can be played back from any tick.
+
+    Attributes:
+        header (dict): The seed, map, players and step length of the game.
+        ticks (int): The number of recorded steps.
+        winners (list): The recorded outcome, or None if it was not saved.
+        inputs (dict): The (player id, action) inputs of each tick that had any.
+        snapshots (dict): The captured states by tick.
+    """
+    def __init__(self, data):
+        if data.get('format') != REPLAY_FORMAT:
+            raise ValueError(f"Unsupported replay format {data.get('format')!r}")
+        self.header = {key: data[key] for key in ('seed', 'player_mode', 'monster_types', 'map', 'dt')}
+        self.ticks = data['ticks']
+        self.winners = data['winners']
+        self.inputs = {}
+        for tick, player_id, action in data['inputs']:
+            self.inputs.setdefault(tick, []).append((player_id, ACTIONS[action]))
+        self.snapshots = {int(tick): base64.b64decode(state) for tick, state in data['snapshots'].items()}
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a replay written by `Recorder.save`.
+
+        Parameters:
+            path (str): The replay file.
+
+        Returns:
+            Replay: The loaded replay.
+        """
+        with open(path, 'rb') as file:
+            return cls(json.loads(zlib.decompress(file.read())))
+
+    @property
+    def dt(self):
+        """The length of a step in milliseconds."""
+        return self.header['dt'] if self.header['dt'] is not None else STEP_MS
+
+    def new_game(self, screen=None):
+        """
+        Creates the recorded game as it was before its first step.
+
+        Parameters:
+            screen (pygame.Surface): The surface to render the game on, or None for a game that is not drawn.
+
+        Returns:
+            Game: The new game.
+        """
+        return create_game(self.header, screen)
+
+    def seek(self, tick, game=None):
+        """
+        Brings a game to the state it had before the step of the given tick: the nearest snapshot at or before
+        the tick is restored and the game is stepped forward from there with the recorded inputs.
+
+        Parameters:
+            tick (int): The tick to go to, from 0 to `ticks`.
+            game (Game): The game to move, usually the one returned by an earlier `seek` or `new_game`.
+                         A new game is created when None.
+
+        Returns:
+            Game: The game at the given tick.
+        """
+        tick = max(0, min(tick, self.ticks))
+        if game is None:
+            game = self.new_game()
+        start = max((snapshot_tick for snapshot_tick in self.snapshots if snapshot_tick <= tick), default=None)
+        # Stepping forward is only worth it when no snapshot is closer to the tick
+        if game.tick > tick or (start is not None and start > game.tick):
+            if start is not None:
+                restore(game, self.snapshots[start])
+            else:
+                game = self.new_game(game.screen)
+        while game.tick < tick and game.winners is None:
+            self.step(game)
+        return game
+
+    def step(self, game):
+        """
+        Plays the next recorded step of a game.
+
+        Parameters:
+            game (Game): A game created by `new_game` or `seek`.
+
+        Returns:
+            list: The winners if the game is over, otherwise None.
+        """
+        return game.step(self.inputs.get(game.tick, ()), self.dt)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plays back a recorded game.")
+    parser.add_argument('path', help="The replay file")
+    parser.add_argument('--seek', type=float, default=0, help="Second of game time to start watching at")
+    parser.add_argument('--speed', type=float, default=1, help="Playback speed")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    pygame.init()
+    layout = replay.header['map']
+    screen = pygame.display.set_mode((min(len(layout[0]), 13) * 40, min(len(layout), 11) * 40), pygame.RESIZABLE)
+    game = replay.seek(int(args.seek * 1000 / replay.dt), replay.new_game(screen))
+    clock = pygame.time.Clock()
+    lag = 0
+    while game.tick < replay.ticks and game.winners is None:
+        if any(event.type == pygame.QUIT for event in pygame.event.get()):
+            break
+        lag += clock.tick(60) * args.speed
+        while lag >= replay.dt and game.winners is None:
+            replay.step(game)
+            lag -= replay.dt
+        game.render(lag / replay.dt)
+    print(f"winners {game.winners}, recorded {replay.winners}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+import pygame
+
+
+class ImageCache:
+    """
+    Central registry for sprite images.
+
+    Every image is read from disk once, converted to the display pixel format as soon as a display
+    mode exists, and the same Surface is handed out to every sprite that asks for it. Surfaces returned
+    by `load` are shared, so callers that need to modify an image (alpha, colour key, ...) must copy it.
+
+    Attributes:
+        surfaces (dict): Maps an image path to its shared Surface.
+        hits (int): Number of `load` calls served from the cache.
+        misses (int): Number of `load` calls that had to decode the file from disk.
+        headless (bool): Whether images are never decoded; every path then gets the same blank tile-sized
+                         Surface, for simulations that are not drawn.
+    """
+    def __init__(self):
+        self.surfaces = {}
+        self.hits = 0
+        self.misses = 0
+        self.headless = False
+        self._converted = set()
+        self._placeholder = None
+
+    def load(self, path, alpha=True):
+        """
+        Returns the shared Surface for the given image path, loading it on first use.
+
+        Args:
+            path (str): The path to the image file.
+            alpha (bool): Whether the image keeps per-pixel transparency. Opaque images such as floor and
+                          wall tiles should pass False so they are converted to the faster opaque format.
+
+        Returns:
+            pygame.Surface: The shared image surface.
+        """
+        if self.headless:
+            if self._placeholder is None:
+                self._placeholder = pygame.Surface((40, 40))
+            return self._placeholder
+        surface = self.surfaces.get(path)
+        if surface is None:
+            self.misses += 1
+            surface = pygame.image.load(path)
+            self.surfaces[path] = surface
+        else:
+            self.hits += 1
+        if path not in self._converted and pygame.display.get_surface() is not None:
+            # Images loaded before the display mode was set are converted the first time they are requested afterwards
+            surface = surface.convert_alpha() if alpha else surface.convert()
+            self.surfaces[path] = surface
+            self._converted.add(path)
+        return surface
+
+    def preload(self, paths, alpha=True):
+        """
+        Loads a batch of images up front so that no disk reads happen later, e.g. during a round.
+
+        Args:
+            paths (iterable): The image paths to load.
+            alpha (bool): Whether the images keep per-pixel transparency.
+        """
+        for path in paths:
+            self.load(path, alpha)
+
+    def reset_stats(self):
+        """
+        Resets the hit and miss counters without dropping any cached surfaces.
+        """
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """
+        Drops every cached surface and resets the counters.
+        """
+        self.surfaces.clear()
+        self._converted.clear()
+        self.reset_stats()
+
+
+images = ImageCache()
+
+# The Press-Start-2P font every menu and label uses
+FONT_PATH = "assets/font.ttf"
+
+
+class TextCache:
+    """
+    Central registry for fonts and rendered text.
+
+    A font is opened once per size and a text is rendered once per (text, size, color), so screens that
+    are drawn every frame only blit surfaces. Rendered surfaces are shared like images.
+
+    Attributes:
+        path (str): The font file.
+        fonts (dict): Maps a size to its Font.
+        surfaces (dict): Maps (text, size, color) to the rendered Surface.
+    """
+    def __init__(self, path=FONT_PATH):
+        self.path = path
+        self.fonts = {}
+        self.surfaces = {}
+
+    def font(self, size):
+        """Returns the font in the given size, opening the font file on first use."""
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(self.path, size)
+        return font
+
+    def render(self, text, size, color):
+        """
+        Returns the shared Surface of an antialiased text.
+
+        Args:
+            text (str): The text to render.
+            size (int): The font size.
+            color: The text color, anything pygame.Color accepts.
+
+        Returns:
+            pygame.Surface: The shared text surface.
+        """
+        key = (text, size, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = self.font(size).render(text, True, color)
+        return surface
+
+    def clear(self):
+        """Drops every font and rendered text."""
+        self.fonts.clear()
+        self.surfaces.clear()
+
+
+texts = TextCache()
+
+
+def load_image(path, alpha=True):
+    """
+    Returns the shared Surface for an image from the global cache.
+
+    Args:
+        path (str): The path to the image file.
+        alpha (bool): Whether the image keeps per-pixel transparency.
+
+    Returns:
+        pygame.Surface: The shared image surface.
+    """
+    return images.load(path, alpha)
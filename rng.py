@@ -0,0 +1,57 @@
+import hashlib
+import os
+import random
+
+MASK64 = (1 << 64) - 1
+
+
+class GameRandom(random.Random):
+    """
+    The random number generator of a game: a SplitMix64 generator behind the `random.Random` interface.
+
+    Its whole state is one 64-bit integer, so it can be saved with every snapshot of a game, where the
+    state of the standard Mersenne Twister takes a few kilobytes. `shuffle`, `choice`, `randint` and the
+    other methods of `random.Random` all draw from `random` and `getrandbits` below.
+
+    Attributes:
+        state (int): The current state.
+    """
+    def __init__(self, seed=None):
+        self.state = 0
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        """
+        Sets the state from an int, from any other value through its repr, or from the OS when None.
+        """
+        if a is None:
+            a = int.from_bytes(os.urandom(8), 'little')
+        elif not isinstance(a, int):
+            a = int.from_bytes(hashlib.sha256(repr(a).encode()).digest()[:8], 'little')
+        self.state = a & MASK64
+        self.gauss_next = None
+
+    def getstate(self):
+        return self.state
+
+    def setstate(self, state):
+        self.state = state
+        self.gauss_next = None
+
+    def _next(self):
+        self.state = (self.state + 0x9E3779B97F4A7C15) & MASK64
+        z = self.state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        return z ^ (z >> 31)
+
+    def random(self):
+        return (self._next() >> 11) * (1.0 / 9007199254740992.0)
+
+    def getrandbits(self, k):
+        if k <= 64:
+            return self._next() >> (64 - k)
+        bits = 0
+        for shift in range(0, k, 64):
+            bits |= self._next() << shift
+        return bits & ((1 << k) - 1)
@@ -0,0 +1,287 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import heapq
+import random
+import time
+from collections import Counter
+from eventlog import log
+from game import Game
+from simulation import setup_headless, RandomPolicy
+from snapshot import capture, restore
+from timing import STEP_MS
+
+# How many ticks a session may run ahead of the last tick it has every player's inputs for
+MAX_PREDICTION = 15
+
+
+class RollbackSession:
+    """
+    Runs one peer of a game played over the network with rollback: every peer simulates the whole game,
+    the inputs of its own players are applied at once and sent to the other peers, and the inputs of remote
+    players are predicted until they arrive.
+
+    The prediction is that a remote player does nothing, which holds for most ticks since every action is a
+    single key press. When an action arrives for a tick that was already simulated, the session restores
+    the snapshot taken before that tick and simulates the ticks since then again with the real inputs.
+
+    Attributes:
+        game (Game): The local copy of the game.
+        local_players (set): The ids of the players controlled on this peer.
+        remote_players (set): The ids of the players controlled on other peers.
+        dt (float): The length of a tick in milliseconds, the same on every peer.
+        max_prediction (int): How many ticks the session runs ahead of the confirmed inputs before it waits.
+        inputs (dict): The actions of every player by tick, as {tick: {player id: actions}}.
+        received (dict): For each remote player, the last tick up to which all of its inputs arrived.
+        snapshots (dict): The state before the step of every tick that may still be rolled back to.
+        rollback_tick (int): The earliest simulated tick whose inputs changed, None if the prediction held.
+        frames (int): The number of ticks advanced.
+        stalls (int): The number of times the session waited for remote inputs instead of advancing.
+        rollbacks (int): The number of rollbacks.
+        depths (Counter): How many rollbacks went back how many ticks.
+        resimulated (int): The number of ticks simulated again.
+        resimulation_time (float): The time spent restoring and simulating again, in seconds.
+    """
+    def __init__(self, game, local_players, dt=STEP_MS, max_prediction=MAX_PREDICTION):
+        self.game = game
+        self.local_players = set(local_players)
+        self.remote_players = set(game.roster) - self.local_players
+        self.dt = dt
+        self.max_prediction = max_prediction
+        self.inputs = {}
+        self.received = {player_id: game.tick - 1 for player_id in self.remote_players}
+        self.snapshots = {}
+        self.rollback_tick = None
+        self.frames = 0
+        self.stalls = 0
+        self.rollbacks = 0
+        self.depths = Counter()
+        self.resimulated = 0
+        self.resimulation_time = 0.0
+
+    @property
+    def tick(self):
+        """The next tick to simulate."""
+        return self.game.tick
+
+    @property
+    def confirmed_tick(self):
+        """The last tick for which the inputs of every player are known."""
+        return min(self.received.values(), default=self.game.tick - 1)
+
+    def add_local_input(self, player_id, actions):
+        """
+        Sets what a local player does in the next tick.
+
+        Parameters:
+            player_id (int): One of the local players.
+            actions (iterable): The player's actions, from ACTIONS; empty if the player does nothing.
+
+        Returns:
+            tuple: The (player id, tick, actions) message to send to the other peers.
+        """
+        actions = tuple(actions)
+        self.inputs.setdefault(self.tick, {})[player_id] = actions
+        return player_id, self.tick, actions
+
+    def add_remote_input(self, player_id, tick, actions):
+        """
+        Takes the inputs of a remote player for a tick, in any order. A tick that was simulated with a
+        different prediction is simulated again at the next `advance` or `synchronize`.
+
+        Parameters:
+            player_id (int): One of the remote players.
+            tick (int): The tick the inputs are for.
+            actions (iterable): The player's actions in that tick.
+        """
+        actions = tuple(actions)
+        self.inputs.setdefault(tick, {})[player_id] = actions
+        received = self.received[player_id]
+        while player_id in self.inputs.get(received + 1, ()):
+            received += 1
+        self.received[player_id] = received
+        # Nothing was predicted, so only actions make the simulated ticks wrong
+        if actions and tick < self.tick:
+            self.rollback_tick = tick if self.rollback_tick is None else min(self.rollback_tick, tick)
+
+    def tick_inputs(self, tick):
+        """Returns the (player id, action) inputs of a tick, in the same order on every peer."""
+        actions = self.inputs.get(tick, {})
+        return [(player_id, action) for player_id in sorted(actions) for action in actions[player_id]]
+
+    def step(self):
+        """Snapshots the game and simulates the next tick with the inputs known so far."""
+        self.snapshots[self.tick] = capture(self.game)
+        return self.game.step(self.tick_inputs(self.tick), self.dt)
+
+    def synchronize(self):
+        """
+        Rolls back to the earliest tick whose inputs changed and simulates up to the current tick again.
+        """
+        if self.rollback_tick is None:
+            return
+        started = time.perf_counter()
+        target = self.tick
+        self.depths[target - self.rollback_tick] += 1
+        restore(self.game, self.snapshots[self.rollback_tick])
+        self.rollback_tick = None
+        # The game may now end before the tick it had reached
+        while self.tick < target and self.game.winners is None:
+            self.step()
+            self.resimulated += 1
+        self.rollbacks += 1
+        self.resimulation_time += time.perf_counter() - started
+
+    def advance(self):
+        """
+        Simulates the next tick, after rolling back if late inputs changed the past. Does nothing when the
+        session is `max_prediction` ticks ahead of the confirmed inputs or the game is over.
+
+        Returns:
+            bool: Whether the session advanced.
+        """
+        self.synchronize()
+        if self.tick - self.confirmed_tick > self.max_prediction:
+            self.stalls += 1
+            return False
+        if self.game.winners is not None:
+            return False
+        self.step()
+        self.frames += 1
+        # Ticks up to the confirmed one can no longer be rolled back to
+        for tick in [tick for tick in self.snapshots if tick <= self.confirmed_tick]:
+            del self.snapshots[tick]
+        return True
+
+    @property
+    def resimulated_per_frame(self):
+        """The average number of ticks simulated again per tick advanced."""
+        return self.resimulated / self.frames if self.frames else 0.0
+
+    @property
+    def resimulation_ms_per_frame(self):
+        """The average time spent rolling back per tick advanced, in milliseconds."""
+        return self.resimulation_time * 1000 / self.frames if self.frames else 0.0
+
+
+class LatencyLink:
+    """
+    Carries messages between peers in one process, each delivered after half the round-trip time plus a
+    random jitter, so messages can overtake each other like datagrams.
+
+    Attributes:
+        rtt (float): The round-trip time in milliseconds.
+        jitter (float): The most a delivery is early or late compared to rtt / 2, in milliseconds.
+        rng (random.Random): The source of the jitter.
+        queue (list): A heap of (delivery time, sequence number, recipient, message).
+    """
+    def __init__(self, rtt, jitter=0, seed=None):
+        self.rtt = rtt
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.queue = []
+        self.sequence = 0
+
+    def send(self, now, recipient, message):
+        """Sends a message at the given time in milliseconds."""
+        delay = max(0.0, self.rtt / 2 + self.rng.uniform(-self.jitter, self.jitter))
+        self.sequence += 1
+        heapq.heappush(self.queue, (now + delay, self.sequence, recipient, message))
+
+    def receive(self, now):
+        """Returns the (recipient, message) of every message delivered by the given time, in delivery order."""
+        delivered = []
+        while self.queue and self.queue[0][0] <= now:
+            _, _, recipient, message = heapq.heappop(self.queue)
+            delivered.append((recipient, message))
+        return delivered
+
+    def flush(self):
+        """Returns every message still on its way."""
+        return self.receive(float('inf'))
+
+
+def run_loopback(ticks=1800, rtt=100, jitter=20, seed=1, map_number=1, actions_per_second=4):
+    """
+    Plays a two player game between two rollback sessions in this process, one player on each, with
+    random inputs and a LatencyLink between them. Afterwards both sessions must hold the state of a game
+    that was played with every input on time.
+
+    Parameters:
+        ticks (int): The number of ticks to play, unless the game ends first.
+        rtt (float): The round-trip time between the peers in milliseconds.
+        jitter (float): The jitter of every delivery in milliseconds.
+        seed (int): Seed for the game, the inputs and the jitter.
+        map_number (int): The map to play on.
+        actions_per_second (float): How often each player acts.
+
+    Returns:
+        tuple: The two sessions and whether their final states match the game played without latency.
+    """
+    setup_headless()
+    sessions = [RollbackSession(Game(None, map_number, 2, 1, seed=seed), [player_id]) for player_id in (1, 2)]
+    policies = [RandomPolicy(seed * 10 + player_id, actions_per_second, players=[player_id]) for player_id in (1, 2)]
+    link = LatencyLink(rtt, jitter, seed)
+    played = {}
+
+    def deliver(messages):
+        for recipient, (player_id, tick, actions) in messages:
+            sessions[recipient].add_remote_input(player_id, tick, actions)
+
+    with log.quiet():
+        for frame in range(ticks):
+            now = frame * STEP_MS
+            deliver(link.receive(now))
+            # A game over can still be rolled back until every input before it arrived
+            if all(session.game.winners is not None and session.confirmed_tick >= session.tick - 1 for session in sessions):
+                break
+            for index, (session, policy) in enumerate(zip(sessions, policies)):
+                player_id = index + 1
+                if session.tick - session.confirmed_tick > session.max_prediction:
+                    session.advance()
+                    continue
+                actions = [action for _, action in policy(session.game, session.dt)]
+                message = session.add_local_input(player_id, actions)
+                played.setdefault(message[1], {})[player_id] = message[2]
+                link.send(now, 1 - index, message)
+                session.advance()
+
+        # Let every input arrive, then bring both peers to the same tick
+        deliver(link.flush())
+        end = max(session.tick for session in sessions)
+        for session in sessions:
+            session.synchronize()
+            while session.tick < end and session.game.winners is None:
+                session.advance()
+
+        reference = Game(None, map_number, 2, 1, seed=seed)
+        while reference.tick < end:
+            actions = played.get(reference.tick, {})
+            reference.step([(player_id, action) for player_id in sorted(actions) for action in actions[player_id]],
+                           STEP_MS)
+        expected = capture(reference)
+        return sessions, all(capture(session.game) == expected for session in sessions)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plays a game between two rollback peers with artificial latency.")
+    parser.add_argument('--ticks', type=int, default=1800, help="Ticks to play, unless the game ends first")
+    parser.add_argument('--rtt', type=float, default=100, help="Round-trip time in milliseconds")
+    parser.add_argument('--jitter', type=float, default=20, help="Jitter of every message in milliseconds")
+    parser.add_argument('--seed', type=int, default=1, help="Seed for the game, the inputs and the jitter")
+    args = parser.parse_args(argv)
+
+    sessions, consistent = run_loopback(args.ticks, args.rtt, args.jitter, args.seed)
+    for index, session in enumerate(sessions):
+        depth = sum(depth * count for depth, count in session.depths.items()) / session.rollbacks if session.rollbacks else 0
+        print(f"peer {index + 1}: {session.frames} ticks, {session.stalls} stalls, {session.rollbacks} rollbacks "
+              f"of {depth:.1f} ticks on average and {max(session.depths, default=0)} at most, "
+              f"{session.resimulated_per_frame:.2f} ticks resimulated per tick, "
+              f"{session.resimulation_ms_per_frame:.3f} ms per tick")
+    print("states match a game without latency" if consistent else "states DIVERGED")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,476 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import heapq
+import json
+import signal
+import sys
+import time
+from eventlog import log
+from game import Game, ACTIONS
+from protocol import (HELLO, WELCOME, REJECT, INPUT, STATE, HELLO_MESSAGE, WELCOME_HEADER, INPUT_MESSAGE, STATE_HEADER,
+                      encode, read_message)
+from replay import game_setup
+from simulation import setup_headless
+from snapshot import capture, diff
+from timing import STEP_MS
+
+# A client whose stream holds more unsent bytes than this skips ticks until it caught up
+BUFFER_LIMIT = 64 * 1024
+
+# Tick rates a MatchServer falls back to, in order, when it cannot keep up with the faster ones
+TICK_RATES = (20, 15, 10, 5)
+# Share of the wall-clock time spent busy above which the tick rate is lowered; it is raised again when
+# the higher rate would keep the load below LOAD_LOW
+LOAD_HIGH = 0.9
+LOAD_LOW = 0.6
+# Seconds over which the load is measured
+LOAD_WINDOW = 1.0
+
+
+class Connection:
+    """
+    A client connected to a game server.
+
+    Attributes:
+        player_id (int): The id of the player the client controls.
+        writer (asyncio.StreamWriter): The stream to the client.
+        last_input (int): The sequence number of the client's last input applied to the game, 0 if none was.
+        state (bytes): The last state sent to the client, which the next delta is computed from.
+        bytes_sent (int): The number of state bytes sent to the client, headers included.
+    """
+    def __init__(self, player_id, writer, state):
+        self.player_id = player_id
+        self.writer = writer
+        self.last_input = 0
+        self.state = state
+        self.bytes_sent = 0
+
+
+class GameServer:
+    """
+    Runs a game authoritatively for players connected over TCP.
+
+    Clients send the actions of their player; the server applies them at the next tick, steps the game and
+    sends every client the difference between the new state and the last one it was sent, see
+    `snapshot.diff`, together with the sequence number of the client's last applied input. Clients never
+    simulate. A client that does not read its states fast enough skips ticks instead of piling them up.
+
+    Attributes:
+        game (Game): The game being played.
+        dt (float): The length of a tick in milliseconds.
+        policy (callable): Called with the game and dt before every tick, returns inputs for players without
+                           a client, e.g. a RandomPolicy for bots. None if only clients play.
+        clients (dict): The connection of each player that has a client.
+        state (bytes): The state of the last tick, None if no client was there to be sent it.
+        setup (dict): What clients need to create the game for rendering, see `replay.game_setup`.
+        pending (list): The (player id, sequence number, action index) of inputs received since the last tick.
+        ticks (int): The number of ticks played.
+        cpu_time (float): The CPU time spent ticking the game and sending its states, in seconds.
+        bytes_sent (int): The number of state bytes sent to all clients.
+        ticks_sent (int): The number of ticks sent to all clients, counting every client separately.
+    """
+    def __init__(self, game, dt=STEP_MS, policy=None):
+        self.game = game
+        self.dt = dt
+        self.policy = policy
+        self.clients = {}
+        self.state = capture(game)
+        self.setup = game_setup(game)
+        self.pending = []
+        self.ticks = 0
+        self.cpu_time = 0.0
+        self.bytes_sent = 0
+        self.ticks_sent = 0
+        self.server = None
+        self.handlers = set()
+
+    async def start(self, host='127.0.0.1', port=0):
+        """
+        Starts accepting clients.
+
+        Parameters:
+            host (str): The address to listen on.
+            port (int): The port to listen on, 0 for any free one.
+
+        Returns:
+            int: The port the server listens on.
+        """
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """Disconnects every client and stops accepting new ones."""
+        if self.server is not None:
+            self.server.close()
+        for connection in list(self.clients.values()):
+            connection.writer.close()
+        # Closing the streams ends the handlers, which would be cancelled if they were still running at exit
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        """
+        Serves a client that connected to this server.
+        """
+        try:
+            message_type, payload = await read_message(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+        if message_type != HELLO:
+            writer.close()
+            return
+        requested, _ = HELLO_MESSAGE.unpack(payload)
+        await self.serve(reader, writer, requested)
+
+    async def serve(self, reader, writer, requested=0):
+        """
+        Serves one client that said hello: gives it a free player, then queues the inputs it sends until it
+        disconnects.
+
+        Parameters:
+            reader (asyncio.StreamReader): The stream from the client.
+            writer (asyncio.StreamWriter): The stream to the client.
+            requested (int): The player the client asked for, 0 for any free one.
+        """
+        connection = None
+        self.handlers.add(asyncio.current_task())
+        try:
+            free = [player_id for player_id in self.game.roster if player_id not in self.clients]
+            if requested:
+                free = [player_id for player_id in free if player_id == requested]
+            if not free:
+                writer.write(encode(REJECT, f"player {requested or 'slot'} is not available".encode('utf-8')))
+                return
+            if self.state is None:
+                self.state = capture(self.game)
+            connection = Connection(free[0], writer, self.state)
+            self.clients[connection.player_id] = connection
+            setup = json.dumps(self.setup, separators=(',', ':')).encode('utf-8')
+            writer.write(encode(WELCOME, WELCOME_HEADER.pack(connection.player_id, self.dt, len(setup)) + setup + self.state))
+
+            while True:
+                message_type, payload = await read_message(reader)
+                if message_type == INPUT:
+                    sequence, action = INPUT_MESSAGE.unpack(payload)
+                    if action < len(ACTIONS):
+                        self.pending.append((connection.player_id, sequence, action))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if connection is not None and self.clients.get(connection.player_id) is connection:
+                del self.clients[connection.player_id]
+            writer.close()
+            self.handlers.discard(asyncio.current_task())
+
+    def tick(self):
+        """
+        Applies the pending inputs, steps the game and sends the new state to every client.
+
+        Returns:
+            list: The winners if the game is over, otherwise None.
+        """
+        started = time.thread_time()
+        inputs = []
+        for player_id, sequence, action in self.pending:
+            inputs.append((player_id, ACTIONS[action]))
+            connection = self.clients.get(player_id)
+            if connection is not None:
+                connection.last_input = max(connection.last_input, sequence)
+        self.pending = []
+        if self.policy is not None:
+            inputs.extend(self.policy(self.game, self.dt))
+        winners = self.game.step(inputs, self.dt)
+        self.ticks += 1
+        if not self.clients:
+            # Bots need no states; the next client to join gets a fresh one
+            self.state = None
+            self.cpu_time += time.thread_time() - started
+            return winners
+
+        state = capture(self.game)
+        # Clients that are up to date share one delta; ones that skipped ticks get their own
+        deltas = {}
+        for connection in list(self.clients.values()):
+            if connection.writer.transport.get_write_buffer_size() > BUFFER_LIMIT:
+                continue
+            delta = deltas.get(id(connection.state))
+            if delta is None:
+                delta = deltas[id(connection.state)] = diff(connection.state, state)
+            message = encode(STATE, STATE_HEADER.pack(self.game.tick, connection.last_input) + delta)
+            try:
+                connection.writer.write(message)
+            except ConnectionError:
+                del self.clients[connection.player_id]
+                continue
+            connection.state = state
+            connection.bytes_sent += len(message)
+            self.bytes_sent += len(message)
+            self.ticks_sent += 1
+        self.state = state
+        self.cpu_time += time.thread_time() - started
+        return winners
+
+    async def run(self, realtime=True, max_ticks=None):
+        """
+        Ticks the game until it is over.
+
+        Parameters:
+            realtime (bool): Whether to tick at the pace of the wall clock, or as fast as the clients are sent
+                             their states, e.g. in tests.
+            max_ticks (int): Stops after this many ticks even if the game is not over.
+
+        Returns:
+            list: The winners, or None if the game was stopped before it ended.
+        """
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        ticks = 0
+        winners = None
+        while winners is None and (max_ticks is None or ticks < max_ticks):
+            if realtime:
+                next_tick += self.dt / 1000
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            winners = self.tick()
+            ticks += 1
+            for connection in list(self.clients.values()):
+                with contextlib.suppress(ConnectionError):
+                    await connection.writer.drain()
+        return winners
+
+    @property
+    def bytes_per_tick(self):
+        """The average number of bytes a client is sent per tick."""
+        return self.bytes_sent / self.ticks_sent if self.ticks_sent else 0.0
+
+
+class MatchServer:
+    """
+    Hosts many matches in one process and ticks them all on one event loop.
+
+    Every match is a GameServer with its own tick schedule. The schedules are spread over the tick period,
+    so the matches do not all tick at once. A match whose tick comes late skips the ticks it missed instead
+    of ticking several times in a row, which keeps a busy loop from falling further behind.
+
+    The load, the share of wall-clock time the loop was not waiting for the next tick, is measured every
+    LOAD_WINDOW seconds. Above LOAD_HIGH every match drops to the next rate in TICK_RATES and takes longer
+    steps, so game time still follows the wall clock; the rate goes back up once the load allows it.
+
+    Attributes:
+        matches (dict): The running matches by id.
+        schedule (list): A heap of (due time, match id), one entry per running match.
+        rate_index (int): The index of the current tick rate in TICK_RATES.
+        load (float): The load measured over the last window, from 0 to 1.
+        late_ticks (int): The number of ticks that came later than a whole period and skipped the missed ones.
+        on_finished (callable): Called with the id and GameServer of every match that ended.
+    """
+    def __init__(self, on_finished=None):
+        self.matches = {}
+        self.schedule = []
+        self.rate_index = 0
+        self.load = 0.0
+        self.late_ticks = 0
+        self.on_finished = on_finished
+        self.next_match_id = 1
+        self.running = False
+        self.server = None
+        self.closing = set()
+
+    @property
+    def tick_rate(self):
+        """The number of ticks per second every match currently gets."""
+        return TICK_RATES[self.rate_index]
+
+    @property
+    def full(self):
+        """Whether the server is overloaded even at its lowest tick rate, so it should not get more matches."""
+        return self.rate_index == len(TICK_RATES) - 1 and self.load > LOAD_HIGH
+
+    def add_match(self, game, policy=None):
+        """
+        Starts hosting a match.
+
+        Parameters:
+            game (Game): The game to run.
+            policy (callable): Inputs for players without a client, see GameServer.
+
+        Returns:
+            int: The id clients join the match with.
+        """
+        match_id = self.next_match_id
+        self.next_match_id += 1
+        self.matches[match_id] = GameServer(game, 1000 / self.tick_rate, policy)
+        # Consecutive ids land far apart in the period, wherever the matches before them ended
+        phase = (match_id * 0.6180339887) % 1
+        heapq.heappush(self.schedule, (time.monotonic() + phase / self.tick_rate, match_id))
+        return match_id
+
+    def finish(self, match_id):
+        """Stops hosting a match; its clients are disconnected once they were sent the final state."""
+        match = self.matches.pop(match_id)
+        task = asyncio.ensure_future(match.close())
+        self.closing.add(task)
+        task.add_done_callback(self.closing.discard)
+        if self.on_finished is not None:
+            self.on_finished(match_id, match)
+
+    async def start(self, host='127.0.0.1', port=0):
+        """
+        Starts accepting clients for the hosted matches.
+
+        Returns:
+            int: The port the server listens on.
+        """
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle(self, reader, writer):
+        """
+        Hands a client over to the match it asked for.
+        """
+        try:
+            message_type, payload = await read_message(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+        if message_type != HELLO:
+            writer.close()
+            return
+        requested, match_id = HELLO_MESSAGE.unpack(payload)
+        match = self.matches.get(match_id)
+        if match is None:
+            writer.write(encode(REJECT, f"match {match_id} is not running".encode('utf-8')))
+            writer.close()
+            return
+        await match.serve(reader, writer, requested)
+
+    def adjust(self, load):
+        """Lowers or raises the tick rate of every match after measuring the load."""
+        self.load = load
+        if load > LOAD_HIGH and self.rate_index < len(TICK_RATES) - 1:
+            self.rate_index += 1
+        elif self.rate_index > 0 and load * TICK_RATES[self.rate_index - 1] / self.tick_rate < LOAD_LOW:
+            self.rate_index -= 1
+        else:
+            return
+        for match in self.matches.values():
+            match.dt = 1000 / self.tick_rate
+
+    async def run(self, duration=None):
+        """
+        Ticks the matches until `stop` is called or the given time has passed.
+
+        Parameters:
+            duration (float): How many seconds to run, None to run until stopped.
+        """
+        self.running = True
+        started = window_start = time.monotonic()
+        idle = 0.0
+        while self.running and (duration is None or time.monotonic() - started < duration):
+            now = time.monotonic()
+            if now - window_start >= LOAD_WINDOW:
+                self.adjust(1 - idle / (now - window_start))
+                window_start = now
+                idle = 0.0
+            if not self.schedule or self.schedule[0][0] > now:
+                wait = self.schedule[0][0] - now if self.schedule else LOAD_WINDOW / 10
+                await asyncio.sleep(wait)
+                idle += time.monotonic() - now
+                continue
+
+            # Every match that is due ticks before the streams get their turn
+            while self.schedule and self.schedule[0][0] <= now:
+                due, match_id = heapq.heappop(self.schedule)
+                match = self.matches.get(match_id)
+                if match is None:
+                    continue
+                if match.tick() is not None:
+                    self.finish(match_id)
+                    continue
+                due += 1 / self.tick_rate
+                if due < now:
+                    self.late_ticks += 1
+                    due = now + 1 / self.tick_rate
+                heapq.heappush(self.schedule, (due, match_id))
+            await asyncio.sleep(0)
+
+    def stop(self):
+        """Makes `run` return after the current tick."""
+        self.running = False
+
+    async def close(self):
+        """Disconnects every client and stops accepting new ones."""
+        if self.server is not None:
+            self.server.close()
+        matches = list(self.matches.values())
+        self.matches = {}
+        self.schedule = []
+        await asyncio.gather(*[match.close() for match in matches], *self.closing, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+
+
+def setup_server():
+    """Prepares pygame for a server, which should stop on SIGINT and SIGTERM like any other process."""
+    setup_headless()
+    # SDL turns both signals into quit events, which a server never reads
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+async def serve(args):
+    setup_server()
+    game = Game(None, args.map, args.players, 1, seed=args.seed)
+    server = GameServer(game)
+    port = await server.start(args.host, args.port)
+    print(f"serving map {args.map} for {args.players} players on {args.host}:{port}")
+    # Wait for every player before starting, so nobody misses the first ticks
+    while len(server.clients) < args.players:
+        await asyncio.sleep(0.1)
+    # The game logs what happens in it, which a server has no use for
+    with log.quiet():
+        winners = await server.run()
+    print(f"winners {winners}, {server.bytes_per_tick:.1f} bytes per tick per client")
+    await server.close()
+
+
+async def host(args):
+    setup_server()
+    report = functools.partial(print, file=sys.stderr)
+    server = MatchServer(on_finished=lambda match_id, match: report(f"match {match_id} ended, winners {match.game.winners}"))
+    for index in range(args.matches):
+        seed = args.seed + index if args.seed is not None else None
+        server.add_match(Game(None, args.map, args.players, 1, seed=seed))
+    port = await server.start(args.host, args.port)
+    print(f"hosting matches 1 to {args.matches} on {args.host}:{port}")
+    with log.quiet():
+        run = asyncio.create_task(server.run())
+        while server.matches:
+            await asyncio.sleep(LOAD_WINDOW)
+            report(f"{len(server.matches)} matches at {server.tick_rate} Hz, load {server.load:.0%}")
+        server.stop()
+        await run
+    await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Runs a game for players connecting with client.py.")
+    parser.add_argument('--host', default='127.0.0.1', help="Address to listen on")
+    parser.add_argument('--port', type=int, default=5555, help="Port to listen on")
+    parser.add_argument('--map', type=int, default=1, choices=[1, 2, 3], help="Map to play on")
+    parser.add_argument('--players', type=int, default=2, choices=[2, 3], help="Number of players")
+    parser.add_argument('--seed', type=int, default=None, help="Seed of the game, or of the first match")
+    parser.add_argument('--matches', type=int, default=1, help="Number of matches to host, joined with client.py --match")
+    args = parser.parse_args(argv)
+    asyncio.run(serve(args) if args.matches == 1 else host(args))
+
+
+if __name__ == '__main__':
+    main()
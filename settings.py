@@ -1,299 +1,396 @@
-import pygame, sys
-from button import Button
-from game import Game
-
-pygame.init()
-
-SCREEN_WIDTH = 13*40
-SCREEN_HEIGHT = 11*40
-
-SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Menu")
-
-BG = pygame.image.load("./assets/Background.png")
-
-chosen_map = 1
-player_mode = 2
-chosen_round = 3
-current_round = 1
-
-scoreboard = {
-    "player1": 0,
-    "player2": 0,
-    "player3": 0,
-}
-
-def get_font(size): # Returns Press-Start-2P in the desired size
-    """
-    Returns the Press-Start-2P font in the desired size.
-
-    :param size: The size of the font.
-    :return: The font object.
-    """
-    return pygame.font.Font("assets/font.ttf", size)
-
-def reset_scoreboard():
-    """
-    Resets the scoreboard for all players.
-    """
-    global scoreboard
-    for key in scoreboard.keys():
-        scoreboard[key] = 0
-
-def end_game(winners):
-    """
-    Handles the end game logic, updates scores, and displays the results.
-
-    :param winners: A list of winner player indices.
-    """
-    global current_round
-    global chosen_round
-
-    for winner in winners:
-        player_key = f"player{winner}"  
-        if player_key in scoreboard:
-            scoreboard[player_key] += 1
-    
-    while True:
-        SCREEN.blit(BG, (0, 0))
-
-        OPTIONS_MOUSE_POS = pygame.mouse.get_pos()
-
-        OPTIONS_BACK = Button(image=None, pos=(SCREEN_WIDTH * 7/8 - 30, SCREEN_HEIGHT * 1/8), 
-                            text_input="Settings", font=get_font(20), base_color="Gray", hovering_color="Green")
-
-        OPTIONS_BACK.changeColor(OPTIONS_MOUSE_POS)
-        OPTIONS_BACK.update(SCREEN)
-
-        if(current_round != chosen_round):
-            CONTINUE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH * 1/8 + 30, SCREEN_HEIGHT * 1/8), 
-                            text_input="Continue", font=get_font(20), base_color="Gray", hovering_color="Green")
-            CONTINUE_BUTTON.changeColor(OPTIONS_MOUSE_POS)
-            CONTINUE_BUTTON.update(SCREEN)
-
-        WINNER_TEXT = get_font(20).render("Round "+ str(current_round) +" results ", True, "White")
-        WINNER_RECT = WINNER_TEXT.get_rect(center=(SCREEN_WIDTH * 1/2, SCREEN_HEIGHT * 3/8))
-        SCREEN.blit(WINNER_TEXT, WINNER_RECT)
-
-        SCORE1_TEXT = get_font(15).render("Player 1: " + str(scoreboard["player1"]) + "p", True, "White")
-        SCORE1_RECT = SCORE1_TEXT.get_rect(center=(SCREEN_WIDTH * 2/8, SCREEN_HEIGHT * 6/10))
-        SCREEN.blit(SCORE1_TEXT, SCORE1_RECT)
-
-        SCORE2_TEXT = get_font(15).render("Player 2: " + str(scoreboard["player2"]) + "p", True, "White")
-        SCORE2_RECT = SCORE2_TEXT.get_rect(center=(SCREEN_WIDTH * 2/8, SCREEN_HEIGHT * 7/10))
-        SCREEN.blit(SCORE2_TEXT, SCORE2_RECT)
-
-        if(player_mode == 3):
-            SCORE3_TEXT = get_font(15).render("Player 3: " + str(scoreboard["player3"]) + "p", True, "White")
-            SCORE3_RECT = SCORE3_TEXT.get_rect(center=(SCREEN_WIDTH * 2/8, SCREEN_HEIGHT * 8/10))
-            SCREEN.blit(SCORE3_TEXT, SCORE3_RECT)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if OPTIONS_BACK.checkForInput(OPTIONS_MOUSE_POS):
-                    current_round = 1
-                    reset_scoreboard()
-                    main_menu()
-                if current_round != chosen_round :
-                    if CONTINUE_BUTTON.checkForInput(OPTIONS_MOUSE_POS):
-                        current_round = current_round + 1
-                        game = Game(SCREEN, chosen_map, player_mode, chosen_round)
-                        game.play(end_game)
-
-        pygame.display.update()
-
-def play():
-    """
-    Starts the game after choosing the number of rounds.
-    """
-    choose_rounds()
-    game = Game(SCREEN, chosen_map, player_mode, chosen_round)
-    game.play(end_game)
-    current_round = current_round + 1
-
-def choose_rounds():
-    """
-    Displays the screen for choosing the number of rounds.
-    """
-    global chosen_round
-    while True:
-        OPTIONS_MOUSE_POS = pygame.mouse.get_pos()
-
-        SCREEN.blit(BG, (0, 0))
-
-        OPTIONS_TEXT = get_font(20).render("CHOOSE ROUNDS: ", True, "White")
-        OPTIONS_RECT = OPTIONS_TEXT.get_rect(center=(SCREEN_WIDTH * 2/7 + 30, SCREEN_HEIGHT * 1/6))
-        SCREEN.blit(OPTIONS_TEXT, OPTIONS_RECT)
-
-        MAP1_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 2/6), 
-                            text_input="3", font=get_font(20), base_color="White", hovering_color="GREEN")
-        MAP2_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 3/6), 
-                            text_input="5", font=get_font(20), base_color="White", hovering_color="GREEN")
-        MAP3_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 4/6), 
-                            text_input="7", font=get_font(20), base_color="White", hovering_color="GREEN")
-        
-        for button in [MAP1_BUTTON, MAP2_BUTTON, MAP3_BUTTON]:
-            button.changeColor(OPTIONS_MOUSE_POS)
-            button.update(SCREEN)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if MAP1_BUTTON.checkForInput(OPTIONS_MOUSE_POS):
-                    chosen_round = 3
-                    return
-                if MAP2_BUTTON.checkForInput(OPTIONS_MOUSE_POS):
-                    chosen_round = 5
-                    return
-                if MAP3_BUTTON.checkForInput(OPTIONS_MOUSE_POS):
-                    chosen_round = 7
-                    return
-
-        pygame.display.update()
-    
-def choose_map():
-    """
-    Displays the screen for choosing the map.
-    """
-    global chosen_map
-    while True:
-        OPTIONS_MOUSE_POS = pygame.mouse.get_pos()
-
-        SCREEN.fill("GREY")
-
-        OPTIONS_TEXT = get_font(20).render("CHOOSE MAP: ", True, "Black")
-        OPTIONS_RECT = OPTIONS_TEXT.get_rect(center=(SCREEN_WIDTH * 1/4, SCREEN_HEIGHT * 1/6))
-        SCREEN.blit(OPTIONS_TEXT, OPTIONS_RECT)
-
-        OPTIONS_BACK = Button(image=None, pos=(SCREEN_WIDTH * 7/8, SCREEN_HEIGHT * 1/6), 
-                            text_input="BACK", font=get_font(20), base_color="Black", hovering_color="Green")
-
-        OPTIONS_BACK.changeColor(OPTIONS_MOUSE_POS)
-        OPTIONS_BACK.update(SCREEN)
-
-        MAP1_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 2/6), 
-                            text_input="MAP 1", font=get_font(20), base_color="BLACK", hovering_color="GREEN")
-        MAP2_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 3/6), 
-                            text_input="MAP 2", font=get_font(20), base_color="BLACK", hovering_color="GREEN")
-        MAP3_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 4/6), 
-                            text_input="MAP 3", font=get_font(20), base_color="BLACK", hovering_color="GREEN")
-        
-        for button in [MAP1_BUTTON, MAP2_BUTTON, MAP3_BUTTON]:
-            button.changeColor(OPTIONS_MOUSE_POS)
-            button.update(SCREEN)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if OPTIONS_BACK.checkForInput(OPTIONS_MOUSE_POS):
-                    main_menu()
-                if MAP1_BUTTON.checkForInput(OPTIONS_MOUSE_POS):
-                    chosen_map = 1
-                    main_menu()
-                if MAP2_BUTTON.checkForInput(OPTIONS_MOUSE_POS):
-                    chosen_map = 2
-                    main_menu()
-                if MAP3_BUTTON.checkForInput(OPTIONS_MOUSE_POS):
-                    chosen_map = 3
-                    main_menu()
-
-        pygame.display.update()
-
-def choose_player_number():
-    """
-    Displays the screen for choosing the number of players.
-    """
-    global player_mode
-    while True:
-        PLAYERS_MOUSE_POS = pygame.mouse.get_pos()
-
-        SCREEN.fill("GREY")
-
-        OPTIONS_TEXT = get_font(20).render("PLAYER NUMBER: ", True, "Black")
-        OPTIONS_RECT = OPTIONS_TEXT.get_rect(center=(SCREEN_WIDTH * 1/3, SCREEN_HEIGHT * 1/6))
-        SCREEN.blit(OPTIONS_TEXT, OPTIONS_RECT)
-
-        OPTIONS_BACK = Button(image=None, pos=(SCREEN_WIDTH * 7/8, SCREEN_HEIGHT * 1/6), 
-                            text_input="BACK", font=get_font(20), base_color="Black", hovering_color="Green")
-
-        OPTIONS_BACK.changeColor(PLAYERS_MOUSE_POS)
-        OPTIONS_BACK.update(SCREEN)
-
-        SINGLEPLAYER_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 2/6), 
-                            text_input="2-PLAYER", font=get_font(20), base_color="BLACK", hovering_color="GREEN")
-        MULTIPLAYER_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 3/6), 
-                            text_input="3-PLAYER", font=get_font(20), base_color="BLACK", hovering_color="GREEN")
-        
-        for button in [SINGLEPLAYER_BUTTON, MULTIPLAYER_BUTTON]:
-            button.changeColor(PLAYERS_MOUSE_POS)
-            button.update(SCREEN)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if OPTIONS_BACK.checkForInput(PLAYERS_MOUSE_POS):
-                    main_menu()
-                if SINGLEPLAYER_BUTTON.checkForInput(PLAYERS_MOUSE_POS):
-                    player_mode = 2
-                    main_menu()
-                if MULTIPLAYER_BUTTON.checkForInput(PLAYERS_MOUSE_POS):
-                    player_mode = 3
-                    main_menu()
-
-        pygame.display.update()
-
-def main_menu():
-    """
-    Displays the main menu of the game, with options to Play, Choose Map, Choose Players, or Quit the game.
-    Handles user interactions with the menu buttons.
-    """
-    while True:
-        SCREEN.blit(BG, (0, 0))
-
-        MENU_MOUSE_POS = pygame.mouse.get_pos()
-
-        MENU_TEXT = get_font(50).render("MAIN MENU", True, "#b68f40")
-        MENU_RECT = MENU_TEXT.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 1/6))
-
-        PLAY_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 2/6), 
-                            text_input="PLAY", font=get_font(20), base_color="White", hovering_color="#d7fcd4")
-        MAP_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 3/6), 
-                            text_input="CHOOSE MAP", font=get_font(20), base_color="White", hovering_color="#d7fcd4")
-        PLAYER_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 4/6), 
-                            text_input="PLAYERS", font=get_font(20), base_color="White", hovering_color="#d7fcd4")
-        QUIT_BUTTON = Button(image=pygame.image.load("assets/Options Rect1.png"), pos=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 5/6), 
-                            text_input="QUIT", font=get_font(20), base_color="White", hovering_color="#d7fcd4")
-
-        SCREEN.blit(MENU_TEXT, MENU_RECT)
-
-        for button in [PLAY_BUTTON, QUIT_BUTTON, MAP_BUTTON, PLAYER_BUTTON]:
-            button.changeColor(MENU_MOUSE_POS)
-            button.update(SCREEN)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if PLAY_BUTTON.checkForInput(MENU_MOUSE_POS):
-                    play()
-                if MAP_BUTTON.checkForInput(MENU_MOUSE_POS):
-                    choose_map()
-                if PLAYER_BUTTON.checkForInput(MENU_MOUSE_POS):
-                    choose_player_number()
-                if QUIT_BUTTON.checkForInput(MENU_MOUSE_POS):
-                    pygame.quit()
-                    sys.exit()
-
-        pygame.display.update()
-
+import pygame, sys
+import argparse
+import atexit
+import os
+from button import Button
+from eventlog import log
+from game import Game
+from profiler import FrameProfiler
+from replay import Recorder
+from resources import load_image, texts
+
+pygame.init()
+
+SCREEN_WIDTH = 13*40
+SCREEN_HEIGHT = 11*40
+
+SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+pygame.display.set_caption("Menu")
+
+BG = load_image("./assets/Background.png", alpha=False)
+
+# The background of the buttons in the menus
+OPTIONS_RECT = "assets/Options Rect1.png"
+
+chosen_map = 1
+player_mode = 2
+chosen_round = 3
+current_round = 1
+
+scoreboard = {
+    "player1": 0,
+    "player2": 0,
+    "player3": 0,
+}
+
+# How long a menu waits for input before it checks the mouse again, in milliseconds
+IDLE_TIMEOUT = 500
+
+# The most frames a menu draws per second while it changes
+MENU_FPS = 30
+
+# Events after which a menu is drawn again even though no button changed
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+
+menu_clock = pygame.time.Clock()
+
+# Times every frame of every round when the game is started with --profile or --profile-csv, otherwise None
+profiler = None
+
+# Where the replay of every round is saved when the game is started with --record, otherwise None
+record_path = None
+
+def get_font(size): # Returns Press-Start-2P in the desired size
+    """
+    Returns the Press-Start-2P font in the desired size, opened once per size.
+
+    :param size: The size of the font.
+    :return: The font object.
+    """
+    return texts.font(size)
+
+def options_button(text_input, pos, base_color, hovering_color):
+    """
+    Creates a button on the options rectangle, shared by every menu.
+
+    :param text_input: The text of the button.
+    :param pos: The center of the button.
+    :param base_color: The color of the text.
+    :param hovering_color: The color of the text while the mouse is over the button.
+    :return: The button.
+    """
+    return Button(image=load_image(OPTIONS_RECT), pos=pos, text_input=text_input, font=get_font(20),
+                  base_color=base_color, hovering_color=hovering_color)
+
+def wait_for_events():
+    """
+    Waits for input instead of polling, so a menu left open does not keep a core busy.
+
+    :return: The pending events, or an empty list if none came within IDLE_TIMEOUT milliseconds.
+    """
+    event = pygame.event.wait(IDLE_TIMEOUT)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+def present():
+    """
+    Shows a redrawn menu frame, at most MENU_FPS times a second while the mouse keeps changing the hover state.
+    """
+    pygame.display.update()
+    menu_clock.tick(MENU_FPS)
+
+def replay_path(round_number):
+    """
+    Returns the file the replay of a round is saved to: the --record path with the round number added.
+
+    :param round_number: The round of the match.
+    :return: The path of the replay.
+    """
+    root, extension = os.path.splitext(record_path)
+    return f"{root}-round{round_number}{extension}"
+
+def start_round():
+    """
+    Creates the game of the current round and plays it, with the profiler attached, and records it for a
+    replay when the game was started with --record.
+    """
+    game = Game(SCREEN, chosen_map, player_mode, chosen_round)
+    game.profiler = profiler
+    if record_path is not None:
+        Recorder(game)
+
+    def round_over(winners):
+        if game.recorder is not None:
+            path = replay_path(current_round)
+            game.recorder.save(path, winners)
+            log.info('game', "Saved the replay of round %d to %s", current_round, path)
+        end_game(winners)
+
+    game.play(round_over)
+
+def reset_scoreboard():
+    """
+    Resets the scoreboard for all players.
+    """
+    global scoreboard
+    for key in scoreboard.keys():
+        scoreboard[key] = 0
+
+def end_game(winners):
+    """
+    Handles the end game logic, updates scores, and displays the results.
+
+    :param winners: A list of winner player indices.
+    """
+    global current_round
+    global chosen_round
+
+    for winner in winners:
+        player_key = f"player{winner}"  
+        if player_key in scoreboard:
+            scoreboard[player_key] += 1
+
+    # The screen does not change while it is shown, so everything on it is built once
+    OPTIONS_BACK = Button(image=None, pos=(SCREEN_WIDTH * 7/8 - 30, SCREEN_HEIGHT * 1/8), 
+                        text_input="Settings", font=get_font(20), base_color="Gray", hovering_color="Green")
+    buttons = [OPTIONS_BACK]
+    if(current_round != chosen_round):
+        CONTINUE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH * 1/8 + 30, SCREEN_HEIGHT * 1/8), 
+                        text_input="Continue", font=get_font(20), base_color="Gray", hovering_color="Green")
+        buttons.append(CONTINUE_BUTTON)
+
+    WINNER_TEXT = texts.render("Round "+ str(current_round) +" results ", 20, "White")
+    labels = [(WINNER_TEXT, WINNER_TEXT.get_rect(center=(SCREEN_WIDTH * 1/2, SCREEN_HEIGHT * 3/8)))]
+    for player in range(1, player_mode + 1):
+        SCORE_TEXT = texts.render(f"Player {player}: " + str(scoreboard[f"player{player}"]) + "p", 15, "White")
+        labels.append((SCORE_TEXT, SCORE_TEXT.get_rect(center=(SCREEN_WIDTH * 2/8, SCREEN_HEIGHT * (5 + player)/10))))
+    
+    redraw = True
+    while True:
+        OPTIONS_MOUSE_POS = pygame.mouse.get_pos()
+
+        for button in buttons:
+            redraw = button.changeColor(OPTIONS_MOUSE_POS) or redraw
+
+        if redraw:
+            SCREEN.blit(BG, (0, 0))
+            for button in buttons:
+                button.update(SCREEN)
+            for text, rect in labels:
+                SCREEN.blit(text, rect)
+            present()
+            redraw = False
+
+        for event in wait_for_events():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type in REDRAW_EVENTS:
+                redraw = True
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if OPTIONS_BACK.checkForInput(event.pos):
+                    current_round = 1
+                    reset_scoreboard()
+                    main_menu()
+                if current_round != chosen_round :
+                    if CONTINUE_BUTTON.checkForInput(event.pos):
+                        current_round = current_round + 1
+                        start_round()
+
+def play():
+    """
+    Starts the game after choosing the number of rounds.
+    """
+    choose_rounds()
+    start_round()
+    current_round = current_round + 1
+
+def choose_rounds():
+    """
+    Displays the screen for choosing the number of rounds.
+    """
+    global chosen_round
+    OPTIONS_TEXT = texts.render("CHOOSE ROUNDS: ", 20, "White")
+    OPTIONS_RECT = OPTIONS_TEXT.get_rect(center=(SCREEN_WIDTH * 2/7 + 30, SCREEN_HEIGHT * 1/6))
+
+    MAP1_BUTTON = options_button("3", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 2/6), "White", "GREEN")
+    MAP2_BUTTON = options_button("5", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 3/6), "White", "GREEN")
+    MAP3_BUTTON = options_button("7", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 4/6), "White", "GREEN")
+
+    redraw = True
+    while True:
+        OPTIONS_MOUSE_POS = pygame.mouse.get_pos()
+
+        for button in [MAP1_BUTTON, MAP2_BUTTON, MAP3_BUTTON]:
+            redraw = button.changeColor(OPTIONS_MOUSE_POS) or redraw
+
+        if redraw:
+            SCREEN.blit(BG, (0, 0))
+            SCREEN.blit(OPTIONS_TEXT, OPTIONS_RECT)
+            for button in [MAP1_BUTTON, MAP2_BUTTON, MAP3_BUTTON]:
+                button.update(SCREEN)
+            present()
+            redraw = False
+
+        for event in wait_for_events():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type in REDRAW_EVENTS:
+                redraw = True
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if MAP1_BUTTON.checkForInput(event.pos):
+                    chosen_round = 3
+                    return
+                if MAP2_BUTTON.checkForInput(event.pos):
+                    chosen_round = 5
+                    return
+                if MAP3_BUTTON.checkForInput(event.pos):
+                    chosen_round = 7
+                    return
+    
+def choose_map():
+    """
+    Displays the screen for choosing the map.
+    """
+    global chosen_map
+    OPTIONS_TEXT = texts.render("CHOOSE MAP: ", 20, "Black")
+    OPTIONS_RECT = OPTIONS_TEXT.get_rect(center=(SCREEN_WIDTH * 1/4, SCREEN_HEIGHT * 1/6))
+
+    OPTIONS_BACK = Button(image=None, pos=(SCREEN_WIDTH * 7/8, SCREEN_HEIGHT * 1/6), 
+                        text_input="BACK", font=get_font(20), base_color="Black", hovering_color="Green")
+
+    MAP1_BUTTON = options_button("MAP 1", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 2/6), "BLACK", "GREEN")
+    MAP2_BUTTON = options_button("MAP 2", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 3/6), "BLACK", "GREEN")
+    MAP3_BUTTON = options_button("MAP 3", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 4/6), "BLACK", "GREEN")
+
+    redraw = True
+    while True:
+        OPTIONS_MOUSE_POS = pygame.mouse.get_pos()
+
+        for button in [OPTIONS_BACK, MAP1_BUTTON, MAP2_BUTTON, MAP3_BUTTON]:
+            redraw = button.changeColor(OPTIONS_MOUSE_POS) or redraw
+
+        if redraw:
+            SCREEN.fill("GREY")
+            SCREEN.blit(OPTIONS_TEXT, OPTIONS_RECT)
+            for button in [OPTIONS_BACK, MAP1_BUTTON, MAP2_BUTTON, MAP3_BUTTON]:
+                button.update(SCREEN)
+            present()
+            redraw = False
+
+        for event in wait_for_events():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type in REDRAW_EVENTS:
+                redraw = True
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if OPTIONS_BACK.checkForInput(event.pos):
+                    main_menu()
+                if MAP1_BUTTON.checkForInput(event.pos):
+                    chosen_map = 1
+                    main_menu()
+                if MAP2_BUTTON.checkForInput(event.pos):
+                    chosen_map = 2
+                    main_menu()
+                if MAP3_BUTTON.checkForInput(event.pos):
+                    chosen_map = 3
+                    main_menu()
+
+def choose_player_number():
+    """
+    Displays the screen for choosing the number of players.
+    """
+    global player_mode
+    OPTIONS_TEXT = texts.render("PLAYER NUMBER: ", 20, "Black")
+    OPTIONS_RECT = OPTIONS_TEXT.get_rect(center=(SCREEN_WIDTH * 1/3, SCREEN_HEIGHT * 1/6))
+
+    OPTIONS_BACK = Button(image=None, pos=(SCREEN_WIDTH * 7/8, SCREEN_HEIGHT * 1/6), 
+                        text_input="BACK", font=get_font(20), base_color="Black", hovering_color="Green")
+
+    SINGLEPLAYER_BUTTON = options_button("2-PLAYER", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 2/6), "BLACK", "GREEN")
+    MULTIPLAYER_BUTTON = options_button("3-PLAYER", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 3/6), "BLACK", "GREEN")
+
+    redraw = True
+    while True:
+        PLAYERS_MOUSE_POS = pygame.mouse.get_pos()
+
+        for button in [OPTIONS_BACK, SINGLEPLAYER_BUTTON, MULTIPLAYER_BUTTON]:
+            redraw = button.changeColor(PLAYERS_MOUSE_POS) or redraw
+
+        if redraw:
+            SCREEN.fill("GREY")
+            SCREEN.blit(OPTIONS_TEXT, OPTIONS_RECT)
+            for button in [OPTIONS_BACK, SINGLEPLAYER_BUTTON, MULTIPLAYER_BUTTON]:
+                button.update(SCREEN)
+            present()
+            redraw = False
+
+        for event in wait_for_events():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type in REDRAW_EVENTS:
+                redraw = True
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if OPTIONS_BACK.checkForInput(event.pos):
+                    main_menu()
+                if SINGLEPLAYER_BUTTON.checkForInput(event.pos):
+                    player_mode = 2
+                    main_menu()
+                if MULTIPLAYER_BUTTON.checkForInput(event.pos):
+                    player_mode = 3
+                    main_menu()
+
+def main_menu():
+    """
+    Displays the main menu of the game, with options to Play, Choose Map, Choose Players, or Quit the game.
+    Handles user interactions with the menu buttons.
+    """
+    MENU_TEXT = texts.render("MAIN MENU", 50, "#b68f40")
+    MENU_RECT = MENU_TEXT.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT * 1/6))
+
+    PLAY_BUTTON = options_button("PLAY", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 2/6), "White", "#d7fcd4")
+    MAP_BUTTON = options_button("CHOOSE MAP", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 3/6), "White", "#d7fcd4")
+    PLAYER_BUTTON = options_button("PLAYERS", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 4/6), "White", "#d7fcd4")
+    QUIT_BUTTON = options_button("QUIT", (SCREEN_WIDTH/2, SCREEN_HEIGHT * 5/6), "White", "#d7fcd4")
+
+    redraw = True
+    while True:
+        MENU_MOUSE_POS = pygame.mouse.get_pos()
+
+        for button in [PLAY_BUTTON, QUIT_BUTTON, MAP_BUTTON, PLAYER_BUTTON]:
+            redraw = button.changeColor(MENU_MOUSE_POS) or redraw
+
+        if redraw:
+            SCREEN.blit(BG, (0, 0))
+            SCREEN.blit(MENU_TEXT, MENU_RECT)
+            for button in [PLAY_BUTTON, QUIT_BUTTON, MAP_BUTTON, PLAYER_BUTTON]:
+                button.update(SCREEN)
+            present()
+            redraw = False
+
+        for event in wait_for_events():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type in REDRAW_EVENTS:
+                redraw = True
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if PLAY_BUTTON.checkForInput(event.pos):
+                    play()
+                if MAP_BUTTON.checkForInput(event.pos):
+                    choose_map()
+                if PLAYER_BUTTON.checkForInput(event.pos):
+                    choose_player_number()
+                if QUIT_BUTTON.checkForInput(event.pos):
+                    pygame.quit()
+                    sys.exit()
+
+parser = argparse.ArgumentParser(description="Bomberman")
+parser.add_argument('--profile', action='store_true', help="Show the frame profiler overlay, toggled with F3")
+parser.add_argument('--profile-csv', metavar='PATH', help="Write the timings of every frame to a CSV file")
+parser.add_argument('--log', metavar='SPEC', help="What the game logs, e.g. 'info,bomb:debug,monster:off'")
+parser.add_argument('--record', metavar='PATH',
+                    help="Save a replay of every round, to PATH with the round number added, e.g. match-round1.replay")
+args, _ = parser.parse_known_args()
+if args.log:
+    log.configure(args.log)
+record_path = args.record
+if args.profile or args.profile_csv:
+    profiler = FrameProfiler(csv_path=args.profile_csv, visible=args.profile)
+    atexit.register(profiler.close)
+
 main_menu()
\ No newline at end of file
@@ -0,0 +1,165 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import contextlib
+import random
+import time
+import pygame
+from eventlog import log
+from game import Game, ACTIONS
+from resources import images
+from timing import STEP_MS
+
+# Matches that are still running after this much game time end without a winner
+DEFAULT_TIME_LIMIT = 5 * 60 * 1000
+
+
+class RandomPolicy:
+    """
+    A stand-in for human players: every living player it controls picks a random action now and then.
+
+    Attributes:
+        rng (random.Random): The source of the decisions.
+        actions_per_second (float): How many actions each player takes per second of game time on average.
+        players (set): The ids of the players controlled by the policy, or None for all of them.
+    """
+    def __init__(self, seed=None, actions_per_second=4, players=None):
+        self.rng = random.Random(seed)
+        self.actions_per_second = actions_per_second
+        self.players = set(players) if players is not None else None
+
+    def __call__(self, game, dt):
+        """
+        Returns the inputs for the next step.
+
+        Parameters:
+            game (Game): The game being simulated.
+            dt (float): The length of the step in milliseconds.
+
+        Returns:
+            list: (player id, action) pairs.
+        """
+        chance = self.actions_per_second * dt / 1000
+        return [(player.id, self.rng.choice(ACTIONS)) for player in game.players
+                if (self.players is None or player.id in self.players) and self.rng.random() < chance]
+
+
+class CombinedPolicy:
+    """
+    Lets several policies play together, e.g. one per player; players no policy controls stand still.
+
+    Attributes:
+        policies (list): The policies whose inputs are combined.
+    """
+    def __init__(self, policies):
+        self.policies = list(policies)
+
+    def __call__(self, game, dt):
+        inputs = []
+        for policy in self.policies:
+            inputs.extend(policy(game, dt))
+        return inputs
+
+
+class MatchResult:
+    """
+    The outcome of a simulated match.
+
+    Attributes:
+        seed (int): The seed the match was played with.
+        winners (list): The ids of the winning players, or None if the time limit was reached.
+        ticks (int): The number of steps simulated.
+        game_time (float): The game time simulated, in milliseconds.
+        wall_time (float): The time the simulation took, in seconds.
+        deaths (list): The (game time, player id, cause) of every player death, see `Game.deaths`.
+    """
+    def __init__(self, seed, winners, ticks, game_time, wall_time, deaths=()):
+        self.seed = seed
+        self.winners = winners
+        self.ticks = ticks
+        self.game_time = game_time
+        self.wall_time = wall_time
+        self.deaths = list(deaths)
+
+    @property
+    def ticks_per_second(self):
+        """Steps simulated per second of wall-clock time."""
+        return self.ticks / self.wall_time if self.wall_time else 0.0
+
+    @property
+    def speedup(self):
+        """Seconds of game time simulated per second of wall-clock time."""
+        return self.game_time / 1000 / self.wall_time if self.wall_time else 0.0
+
+
+def setup_headless():
+    """
+    Prepares pygame for simulations without a window: the dummy video driver is used, which the module
+    selects on import unless SDL_VIDEODRIVER is set, and images are no longer decoded.
+    """
+    pygame.init()
+    images.headless = True
+
+
+def run_match(map_number=1, player_mode=2, seed=None, dt=STEP_MS, time_limit=DEFAULT_TIME_LIMIT, policy=None, quiet=True,
+              monster_types=None):
+    """
+    Plays one match as fast as possible: the game is stepped in a loop with nothing drawn, no events read
+    and no frame rate cap.
+
+    Parameters:
+        map_number (int or Map): The map to play on, as accepted by Game.
+        player_mode (int): The number of players.
+        seed (int): Seed for the game and the default policy, or None for a random match.
+        dt (float): The length of each step in milliseconds.
+        time_limit (float): The game time after which the match ends without a winner, in milliseconds.
+        policy (callable): Called with the game and dt before every step, returns the inputs for the step.
+                           Defaults to a RandomPolicy with the same seed.
+        quiet (bool): Whether to drop what the game logs while it is played.
+        monster_types (list): The monster classes to spawn, see Game.
+
+    Returns:
+        MatchResult: The outcome of the match.
+    """
+    setup_headless()
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    if policy is None:
+        policy = RandomPolicy(seed)
+    game = Game(None, map_number, player_mode, 1, seed=seed, monster_types=monster_types)
+    winners = None
+    ticks = 0
+    started = time.perf_counter()
+    with log.quiet() if quiet else contextlib.nullcontext():
+        while winners is None and game.game_clock.get_ticks() < time_limit:
+            winners = game.step(policy(game, dt), dt)
+            ticks += 1
+    wall_time = time.perf_counter() - started
+    return MatchResult(seed, winners, ticks, game.game_clock.get_ticks(), wall_time, game.deaths)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plays matches without a window, as fast as the CPU allows.")
+    parser.add_argument('--matches', type=int, default=10, help="Number of matches to play")
+    parser.add_argument('--map', type=int, default=1, choices=[1, 2, 3], help="Map to play on")
+    parser.add_argument('--players', type=int, default=2, choices=[2, 3], help="Number of players")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the first match, the others follow it")
+    parser.add_argument('--dt', type=float, default=STEP_MS, help="Length of a step in milliseconds")
+    args = parser.parse_args(argv)
+
+    total_ticks = total_game_time = total_wall_time = 0
+    for index in range(args.matches):
+        result = run_match(args.map, args.players, args.seed + index, args.dt)
+        total_ticks += result.ticks
+        total_game_time += result.game_time
+        total_wall_time += result.wall_time
+        print(f"seed {result.seed}: winners {result.winners}, {result.game_time / 1000:.1f}s of game time "
+              f"in {result.ticks} ticks, {result.ticks_per_second:.0f} ticks/s")
+    print(f"total: {total_ticks / total_wall_time:.0f} ticks/s, "
+          f"{total_game_time / 1000 / total_wall_time:.0f} game seconds per second")
+
+
+if __name__ == '__main__':
+    main()
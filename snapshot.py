@@ -0,0 +1,336 @@
+import struct
+from bomb import Bomb
+from explosion import Explosion
+from game import MONSTER_TYPES
+from powerUp import PowerUp
+from resources import load_image
+from timing import using_clock
+
+# Classes are stored as their index in these tuples
+POWER_UP_CLASSES = tuple(sorted(PowerUp.__subclasses__(), key=lambda power_up_class: power_up_class.__name__))
+MONSTER_CLASSES = tuple(MONSTER_TYPES)
+
+# Player fields saved in a snapshot after the player's cell, in the order of PLAYER
+PLAYER_FIELDS = ('bombs_limit', 'active_bombs', 'blast_range', 'has_detonator', 'ghost_mode',
+                 'ghost_timer', 'is_invincible', 'invincibility_timer', 'obstacles_limit', 'active_obstacles', 'alive')
+
+# Little-endian records: a header with the counts of every section, then the sections in this order
+HEADER = struct.Struct('<IdQBHIHBHHHHHH')  # tick, time, rng, winner count (255 for None), death count, tile count,
+                                           # bomb tile, player, bomb, explosion, explosion tile, power-up, monster, timer counts
+DEATH = struct.Struct('<dBB')              # time, player id, length of the cause that follows
+CELL = struct.Struct('<HH')                # row, col
+PLAYER = struct.Struct('<B?HHhhh??d?dhh?')  # id, in the game, row, col, then PLAYER_FIELDS, the counters signed
+BOMB = struct.Struct('<BHHHd')             # owner id, row, col, blast range, explode time
+EXPLOSION = struct.Struct('<HHdd')         # row, col, delay, creation time
+EXPLOSION_TILE = struct.Struct('<HHd')     # row, col, delay
+POWER_UP = struct.Struct('<BHH')           # class index, row, col
+MONSTER = struct.Struct('<BHHddd?d')       # class index, row, col, move delay, next move time, move timer, paused, pause timer
+TIMER = struct.Struct('<dBH')              # due, kind, index of the bomb or explosion or id of the player
+
+NO_WINNERS = 255
+
+# Timer kinds; status timers end the effect named by STATUS_ATTRIBUTES[kind - STATUS]
+FUSE, EXPLOSION_END, STATUS = 0, 1, 2
+STATUS_ATTRIBUTES = ('ghost_timer', 'invincibility_timer')
+
+
+def capture(game):
+    """
+    Captures the whole state of a game between two steps in a compact byte string. Images and other
+    derived data, like cached paths, are not part of it.
+
+    Sprites are stored in the order of their groups, since that is the order the game updates them in.
+    Pending timers are stored in the order they fire, each pointing to what it belongs to.
+
+    Parameters:
+        game (Game): The game to capture.
+
+    Returns:
+        bytes: The state, as accepted by `restore`.
+
+    Raises:
+        ValueError: If the game has a monster or power-up of a class a snapshot cannot store.
+    """
+    game_map = game.game_map
+    bombs = game.bombs.sprites()
+    explosions = game.explosions.sprites()
+    bomb_index = {bomb: index for index, bomb in enumerate(bombs)}
+    explosion_index = {explosion: index for index, explosion in enumerate(explosions)}
+    status_keys = {timer: key for key, timer in game.status_timers.items()}
+    fuse_burnt = type(game).fuse_burnt
+    kill = Explosion.kill
+
+    timers = []
+    for due, _, timer in sorted(game.timers.queue, key=lambda entry: entry[:2]):
+        if not timer.active:
+            continue
+        callback = getattr(timer.callback, '__func__', None)
+        if callback is fuse_burnt and timer.args[0] in bomb_index:
+            timers.append(TIMER.pack(due, FUSE, bomb_index[timer.args[0]]))
+        elif callback is kill and timer.callback.__self__ in explosion_index:
+            timers.append(TIMER.pack(due, EXPLOSION_END, explosion_index[timer.callback.__self__]))
+        elif timer in status_keys:
+            player_id, attribute = status_keys[timer]
+            timers.append(TIMER.pack(due, STATUS + STATUS_ATTRIBUTES.index(attribute), player_id))
+
+    deaths = []
+    for death_time, player_id, cause in game.deaths:
+        cause = cause.encode('utf-8')
+        deaths.append(DEATH.pack(death_time, player_id, len(cause)) + cause)
+
+    players = game.players
+    winners = game.winners
+    parts = [
+        HEADER.pack(game.tick, game.game_clock.get_ticks(), game.rng.getstate(),
+                    NO_WINNERS if winners is None else len(winners), len(deaths), len(game_map.tiles),
+                    len(game_map.bomb_tiles), len(game.roster), len(bombs), len(explosions), len(game.explosion_tiles),
+                    len(game.powerUps), len(game.monsters), len(timers)),
+        bytes(winners or ()),
+        *deaths,
+        bytes(game_map.tiles),
+        *[CELL.pack(row, col) for row, col in sorted(game_map.bomb_tiles)],
+        *[PLAYER.pack(player.id, player in players, player.row, player.col, *[getattr(player, field) for field in PLAYER_FIELDS])
+          for player in game.roster.values()],
+        *[BOMB.pack(bomb.player.id, bomb.row, bomb.col, bomb.blast_range, bomb.explodeTime) for bomb in bombs],
+        *[EXPLOSION.pack(explosion.row, explosion.col, explosion.delay, explosion.creation_time) for explosion in explosions],
+        *[EXPLOSION_TILE.pack(*effect) for effect in game.explosion_tiles],
+        *[POWER_UP.pack(class_index(POWER_UP_CLASSES, power_up), power_up.row, power_up.col) for power_up in game.powerUps],
+        *[MONSTER.pack(class_index(MONSTER_CLASSES, monster), monster.row, monster.col, monster.move_delay,
+                       monster.next_move_time, getattr(monster, 'move_timer', 0), getattr(monster, 'paused', False),
+                       getattr(monster, 'pause_timer', 0)) for monster in game.monsters],
+        *timers,
+    ]
+    return b''.join(parts)
+
+
+def class_index(classes, sprite):
+    """
+    Returns the index a sprite's class is stored as.
+
+    Raises:
+        ValueError: If the class is not one of `classes`, e.g. a monster class missing from MONSTER_TYPES.
+    """
+    try:
+        return classes.index(type(sprite))
+    except ValueError:
+        names = ', '.join(sprite_class.__name__ for sprite_class in classes)
+        raise ValueError(f"{type(sprite).__name__} cannot be stored in a snapshot, only {names}") from None
+
+
+def unpack_records(record, data, offset, count):
+    """Returns `count` records of the given struct starting at `offset`, and the offset after them."""
+    end = offset + record.size * count
+    return list(record.iter_unpack(data[offset:end])), end
+
+
+def player_image(player):
+    """Returns the image path matching the player's effects."""
+    if player.is_invincible:
+        return "images/invincible_player_image.png"
+    if player.ghost_mode:
+        return "images/ghost_player_image.png"
+    return "images/player_image.png"
+
+
+def restore(game, data):
+    """
+    Puts a game back into a captured state. The game must have been created with the same players and
+    map size as the one the state was captured from, e.g. from the same replay.
+
+    Sprites already in the game are reused when the state has the same kinds of them, which is the common
+    case when going back a few steps, so restoring stays cheap enough to do every frame.
+
+    Parameters:
+        game (Game): The game to restore.
+        data (bytes): A state returned by `capture`.
+    """
+    (tick, time, rng_state, winner_count, death_count, tile_count, bomb_tile_count, player_count, bomb_count,
+     explosion_count, explosion_tile_count, power_up_count, monster_count, timer_count) = HEADER.unpack_from(data)
+    offset = HEADER.size
+
+    game.tick = tick
+    game.game_clock.time = time
+    game.rng.setstate(rng_state)
+    if winner_count == NO_WINNERS:
+        game.winners = None
+    else:
+        game.winners = list(data[offset:offset + winner_count])
+        offset += winner_count
+    game.deaths = []
+    for _ in range(death_count):
+        death_time, player_id, length = DEATH.unpack_from(data, offset)
+        offset += DEATH.size
+        game.deaths.append((death_time, player_id, data[offset:offset + length].decode('utf-8')))
+        offset += length
+
+    game_map = game.game_map
+    tiles = data[offset:offset + tile_count]
+    offset += tile_count
+    bomb_tiles, offset = unpack_records(CELL, data, offset, bomb_tile_count)
+    bomb_tiles = set(bomb_tiles)
+    # A new map version makes cached paths and the distance field stale; the background only needs a redraw for new tiles
+    if game_map.tiles != tiles:
+        game_map.tiles[:] = tiles
+        game_map.background_chunks = {}
+        game_map.changed_tiles = []
+        game_map.version += 1
+    if game_map.bomb_tiles != bomb_tiles:
+        game_map.bomb_tiles = bomb_tiles
+        game_map.version += 1
+    if game.renderer is not None:
+        game.renderer.invalidate()
+
+    records, offset = unpack_records(PLAYER, data, offset, player_count)
+    living = []
+    for player_id, in_game, row, col, *fields in records:
+        player = game.roster[player_id]
+        image = player_image(player)
+        for field, value in zip(PLAYER_FIELDS, fields):
+            setattr(player, field, value)
+        player.set_cell(row, col)
+        player.rect.topleft = (col * 40, row * 40)
+        player.bomb_list = []
+        if player_image(player) != image:
+            player.image = load_image(player_image(player)).copy()
+        if in_game:
+            living.append(player)
+    if set(living) != set(game.players):
+        game.players.empty()
+        game.players.add(*living)
+
+    game.timers.clear()
+    game.due_bombs = []
+    game.status_timers = {}
+    with using_clock(game.game_clock):
+        records, offset = unpack_records(BOMB, data, offset, bomb_count)
+        bombs = game.bombs.sprites()
+        if len(bombs) != bomb_count:
+            game.bombs.empty()
+            bombs = [Bomb(game.roster[player_id], row, col, blast_range, 0) for player_id, row, col, blast_range, _ in records]
+            game.bombs.add(*bombs)
+        for bomb, (player_id, row, col, blast_range, explode_time) in zip(bombs, records):
+            bomb.player = game.roster[player_id]
+            bomb.set_cell(row, col)
+            bomb.rect.topleft = (col * 40, row * 40)
+            bomb.blast_range = blast_range
+            bomb.explodeTime = explode_time
+            bomb.is_exploding = False
+            bomb.fuse = None
+            bomb.player.bomb_list.append(bomb)
+
+        records, offset = unpack_records(EXPLOSION, data, offset, explosion_count)
+        explosions = game.explosions.sprites()
+        if len(explosions) != explosion_count:
+            game.explosions.empty()
+            explosions = [Explosion(game.game_field, row, col, delay) for row, col, delay, _ in records]
+            game.explosions.add(*explosions)
+        for explosion, (row, col, delay, creation_time) in zip(explosions, records):
+            explosion.row, explosion.col = row, col
+            explosion.rect.topleft = (col * 40, row * 40)
+            explosion.delay = delay
+            explosion.creation_time = creation_time
+
+        records, offset = unpack_records(EXPLOSION_TILE, data, offset, explosion_tile_count)
+        game.explosion_tiles = records
+
+        records, offset = unpack_records(POWER_UP, data, offset, power_up_count)
+        power_ups = game.powerUps.sprites()
+        if [class_index(POWER_UP_CLASSES, power_up) for power_up in power_ups] != [record[0] for record in records]:
+            game.powerUps.empty()
+            power_ups = [POWER_UP_CLASSES[index](col, row) for index, row, col in records]
+            game.powerUps.add(*power_ups)
+        for power_up, (_, row, col) in zip(power_ups, records):
+            power_up.set_cell(row, col)
+            power_up.rect.topleft = (col * 40, row * 40)
+
+        records, offset = unpack_records(MONSTER, data, offset, monster_count)
+        monsters = game.monsters.sprites()
+        if [class_index(MONSTER_CLASSES, monster) for monster in monsters] != [record[0] for record in records]:
+            game.monsters.empty()
+            monsters = [MONSTER_CLASSES[index](game.game_field, row, col, 1) for index, row, col, *_ in records]
+            for monster in monsters:
+                monster.rng = game.rng
+            game.monsters.add(*monsters)
+        for monster, (_, row, col, move_delay, next_move_time, move_timer, paused, pause_timer) in zip(monsters, records):
+            monster.set_cell(row, col)
+            monster.rect.topleft = (col * 40, row * 40)
+            monster.move_delay = move_delay
+            monster.next_move_time = next_move_time
+            if hasattr(monster, 'move_timer'):
+                monster.move_timer = move_timer
+            if hasattr(monster, 'paused'):
+                monster.paused = paused
+                monster.pause_timer = pause_timer
+
+    # Scheduling in firing order keeps timers that are due at the same time in their original order
+    records, offset = unpack_records(TIMER, data, offset, timer_count)
+    for due, kind, reference in records:
+        if kind == FUSE:
+            bombs[reference].fuse = game.timers.schedule(due, game.fuse_burnt, bombs[reference])
+        elif kind == EXPLOSION_END:
+            game.timers.schedule(due, explosions[reference].kill)
+        else:
+            attribute = STATUS_ATTRIBUTES[kind - STATUS]
+            game.status_timers[(reference, attribute)] = game.timers.schedule(due, game.expire_status, game.roster[reference])
+
+
+# A delta is the length of the new state, then runs of changed bytes as (offset, length) followed by the bytes
+DELTA_HEADER = struct.Struct('<I')
+DELTA_RUN = struct.Struct('<II')
+# Unchanged gaps shorter than a run header are sent along instead of starting a new run
+MIN_GAP = DELTA_RUN.size
+
+
+def diff(old, new):
+    """
+    Returns the bytes that turn one captured state into another, with `patch`. Consecutive states of a
+    game differ in a few fields, so the delta is much smaller than the state.
+
+    Parameters:
+        old (bytes): The state the receiver already has.
+        new (bytes): The state to send.
+
+    Returns:
+        bytes: The delta.
+    """
+    parts = [DELTA_HEADER.pack(len(new))]
+    size = min(len(old), len(new))
+    changed = [index for index in range(size) if old[index] != new[index]]
+    if len(new) > size:
+        changed.append(size)
+    start = end = None
+    for index in changed:
+        if start is not None and index - end > MIN_GAP:
+            parts.append(DELTA_RUN.pack(start, end - start) + new[start:end])
+            start = None
+        if start is None:
+            start = index
+        end = index + 1
+    if start is not None:
+        if len(new) > size:
+            end = len(new)
+        parts.append(DELTA_RUN.pack(start, end - start) + new[start:end])
+    return b''.join(parts)
+
+
+def patch(old, delta):
+    """
+    Applies a delta returned by `diff` to the state it was computed from.
+
+    Parameters:
+        old (bytes): The state the delta was computed from.
+        delta (bytes): The delta.
+
+    Returns:
+        bytes: The new state.
+    """
+    length, = DELTA_HEADER.unpack_from(delta)
+    state = bytearray(old[:length])
+    state.extend(bytes(length - len(state)))
+    offset = DELTA_HEADER.size
+    while offset < len(delta):
+        start, run = DELTA_RUN.unpack_from(delta, offset)
+        offset += DELTA_RUN.size
+        state[start:start + run] = delta[offset:offset + run]
+        offset += run
+    return bytes(state)
@@ -0,0 +1,188 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import time
+from bomb import Bomb
+from eventlog import log
+from game import Game, MONSTER_TYPES
+from map import Map
+from player import Player
+from powerUp import BombPowerUp, RangePowerUp, DetonatorPowerUp, GhostPowerUp, InvincibilityPowerUp, ObstaclePowerUp, MonsterPowerUp
+from profiler import FrameProfiler
+from simulation import setup_headless, RandomPolicy
+from timing import STEP_MS, using_clock
+
+# The power-ups a scenario drops, the same kinds bricks drop
+POWER_UP_TYPES = [BombPowerUp, RangePowerUp, DetonatorPowerUp, GhostPowerUp, InvincibilityPowerUp, ObstaclePowerUp,
+                  MonsterPowerUp]
+
+# The largest arena a scenario builds, in tiles per side
+MAX_SIZE = 512
+
+# Subsystems of a step, as timed by FrameProfiler
+STEP_SUBSYSTEMS = ('input', 'monsters', 'bombs', 'explosions', 'power_ups')
+
+
+def build_scenario(size=128, brick_density=0.3, monsters_per_type=100, players=3, bombs=200, power_ups=200,
+                   fuse=3000, invincible=True, seed=1):
+    """
+    Builds a crowded game for scale testing: a generated arena with many monsters of every kind, bombs
+    that go off together and power-ups lying around. The same arguments always build the same game.
+
+    Parameters:
+        size (int): The width and height of the arena in tiles, at most MAX_SIZE.
+        brick_density (float): The chance of a free cell being a brick, see `Map.generate`.
+        monsters_per_type (int): How many monsters of each class in MONSTER_TYPES to spawn.
+        players (int): The number of players; beyond the three a game has, players without control keys
+                       are added on random floor cells.
+        bombs (int): The number of bombs placed on random floor cells by random players.
+        power_ups (int): The number of power-ups dropped on random floor cells.
+        fuse (int): The fuse of every bomb in milliseconds, so they all explode in the same tick.
+        invincible (bool): Whether the players start invincible, so the scene is not cut short by monsters
+                           and blasts; an invincibility power-up they pick up still runs out.
+        seed (int): Seed for the arena and the game.
+
+    Returns:
+        Game: The game, not rendered, at tick 0.
+
+    Raises:
+        ValueError: If the arena is larger than MAX_SIZE.
+    """
+    if size > MAX_SIZE:
+        raise ValueError(f"Arenas are at most {MAX_SIZE} tiles wide, not {size}")
+    setup_headless()
+    game_map = Map.generate(size, size, 40, brick_density, seed)
+    game = Game(None, game_map, 3 if players >= 3 else 2, 1, seed=seed,
+                monster_types=[monster_type for monster_type in MONSTER_TYPES for _ in range(monsters_per_type)])
+    with using_clock(game.game_clock):
+        for player_id in range(4, players + 1):
+            row, col = game.get_random_position(game_map)
+            player = Player(player_id, row, col, 3, 3, [])
+            game.players.add(player)
+            game.roster[player_id] = player
+        roster = sorted(game.roster.values(), key=lambda player: player.id)
+        if invincible:
+            for player in roster:
+                player.is_invincible = True
+                player.invincibility_timer = float('inf')
+
+        for _ in range(bombs):
+            row, col = game.get_random_position(game_map)
+            if game_map.isBomb(row, col):
+                continue
+            player = roster[game.rng.randrange(len(roster))]
+            bomb = Bomb(player, row, col, player.blast_range, fuse)
+            game.bombs.add(bomb)
+            game_map.mark_bomb_tile(row, col)
+            bomb.fuse = game.timers.schedule(bomb.explodeTime, game.fuse_burnt, bomb)
+            player.placed_bomb(bomb)
+
+        for _ in range(power_ups):
+            row, col = game.get_random_position(game_map)
+            power_up_type = POWER_UP_TYPES[game.rng.randrange(len(POWER_UP_TYPES))]
+            game.powerUps.add(power_up_type(col, row))
+    return game
+
+
+class StressResult:
+    """
+    What running a scenario cost.
+
+    Attributes:
+        ticks (int): The number of ticks run; fewer than asked if the game ended.
+        tick_ms (list): The time of every tick in milliseconds.
+        subsystems (dict): The (p50, p99, worst) milliseconds of each step subsystem, see FrameProfiler.
+        monsters (int): The monsters left at the end.
+        bombs (int): The bombs left at the end.
+    """
+    def __init__(self, ticks, tick_ms, subsystems, monsters, bombs):
+        self.ticks = ticks
+        self.tick_ms = tick_ms
+        self.subsystems = subsystems
+        self.monsters = monsters
+        self.bombs = bombs
+
+    def percentile(self, fraction):
+        """Returns the tick time below which the given fraction of the ticks fall, in milliseconds."""
+        if not self.tick_ms:
+            return 0.0
+        ordered = sorted(self.tick_ms)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    @property
+    def mean(self):
+        """The mean tick time in milliseconds."""
+        return sum(self.tick_ms) / len(self.tick_ms) if self.tick_ms else 0.0
+
+    @property
+    def worst(self):
+        """The slowest tick in milliseconds."""
+        return max(self.tick_ms, default=0.0)
+
+
+def run_scenario(game, ticks=600, dt=STEP_MS, policy=None):
+    """
+    Steps a game for a number of ticks with the same update loop Game.play uses, timing every tick.
+
+    Parameters:
+        game (Game): The game to run, e.g. from `build_scenario`.
+        ticks (int): The number of ticks to run, unless the game ends first.
+        dt (float): The length of a tick in milliseconds.
+        policy (callable): Returns the inputs of each tick, see RandomPolicy; a RandomPolicy on the game's
+                           seed by default.
+
+    Returns:
+        StressResult: The cost of the ticks.
+    """
+    if policy is None:
+        policy = RandomPolicy(game.seed)
+    profiler = FrameProfiler(window=ticks)
+    game.profiler = profiler
+    tick_ms = []
+    try:
+        with log.quiet():
+            for _ in range(ticks):
+                inputs = policy(game, dt)
+                profiler.begin_frame()
+                started = time.perf_counter()
+                winners = game.step(inputs, dt)
+                tick_ms.append((time.perf_counter() - started) * 1000)
+                profiler.end_frame()
+                if winners is not None:
+                    break
+    finally:
+        game.profiler = None
+    subsystems = {name: profiler.percentiles(name) + (max(profiler.samples[name], default=0.0),)
+                  for name in STEP_SUBSYSTEMS}
+    return StressResult(len(tick_ms), tick_ms, subsystems, len(game.monsters), len(game.bombs))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Runs crowded generated scenes and reports what a tick costs.")
+    parser.add_argument('--size', type=int, default=128, help=f"Arena width and height in tiles, at most {MAX_SIZE}")
+    parser.add_argument('--bricks', type=float, default=0.3, help="Brick density of the arena")
+    parser.add_argument('--monsters', default='25,100,400',
+                        help="Comma separated monsters per class; one scene is run for each")
+    parser.add_argument('--players', type=int, default=3, help="Number of players")
+    parser.add_argument('--bombs', type=int, default=200, help="Bombs exploding together")
+    parser.add_argument('--power-ups', type=int, default=200, help="Power-ups lying around")
+    parser.add_argument('--ticks', type=int, default=600, help="Ticks to run each scene")
+    parser.add_argument('--seed', type=int, default=1, help="Seed of the scenes")
+    args = parser.parse_args(argv)
+
+    print(f"{'monsters':>9} {'ticks':>6} {'mean ms':>8} {'p50':>7} {'p95':>7} {'p99':>7} {'worst':>7}  "
+          + ' '.join(f'{name + " worst":>16}' for name in STEP_SUBSYSTEMS) + f" {'bombs left':>11}")
+    for count in (int(count) for count in args.monsters.split(',')):
+        with log.quiet():
+            game = build_scenario(args.size, args.bricks, count, args.players, args.bombs, args.power_ups,
+                                  seed=args.seed)
+        result = run_scenario(game, args.ticks)
+        print(f"{count * len(MONSTER_TYPES):>9} {result.ticks:>6} {result.mean:>8.2f} {result.percentile(0.5):>7.2f} "
+              f"{result.percentile(0.95):>7.2f} {result.percentile(0.99):>7.2f} {result.worst:>7.2f}  "
+              + ' '.join(f'{result.subsystems[name][2]:>16.2f}' for name in STEP_SUBSYSTEMS) + f" {result.bombs:>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+import unittest
+import gzip
+import json
+import os
+import tempfile
+from batch import run_batch, play, BatchStats, MATCH_COLUMNS
+from resources import images
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        images.clear()
+        self.addCleanup(images.clear)
+        self.addCleanup(setattr, images, 'headless', False)
+        self.jobs = [(seed, '1', 2, ['Monster', 'PathfindingMonster'], ['random', 'idle'], 50, 60000) for seed in range(6)]
+
+    def test_results_are_aggregated(self):
+        seen = []
+        stats = run_batch(self.jobs, 1, seen.append)
+        self.assertEqual(sorted(row['seed'] for row in seen), list(range(6)))
+        summary = stats.summary()
+        self.assertEqual(summary['matches'], 6)
+        self.assertGreaterEqual(sum(summary['win_rates'].values()), 1.0, "Every match should have a winner, a draw or a timeout")
+        self.assertEqual(sum(summary['kill_causes'].values()), len(stats.deaths['cause']))
+        self.assertTrue(set(summary['kill_causes']) <= {'bomb', 'ghost', 'Monster', 'PathfindingMonster'})
+
+    def test_play_is_deterministic(self):
+        first, second = play(self.jobs[2]), play(self.jobs[2])
+        self.assertEqual((first['winners'], first['ticks'], first['deaths']), (second['winners'], second['ticks'], second['deaths']))
+
+    def test_generated_map(self):
+        row = play((1, '15x15', 3, ['Monster'], ['busy'], 50, 10000))
+        self.assertLessEqual(row['game_time'], 10050)
+
+    def test_columnar_output(self):
+        stats = BatchStats()
+        stats.add({'seed': 4, 'winners': [2], 'ticks': 10, 'game_time': 500, 'wall_time': 0.01, 'deaths': [(480, 1, 'bomb')]})
+        stats.add({'seed': 5, 'winners': None, 'ticks': 20, 'game_time': 1000, 'wall_time': 0.02, 'deaths': []})
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.json.gz')
+            stats.write(path, {'matches': 2})
+            with gzip.open(path, 'rt') as file:
+                data = json.load(file)
+        self.assertEqual(list(data['matches']), list(MATCH_COLUMNS))
+        self.assertEqual(data['matches']['seed'], [4, 5])
+        self.assertEqual(data['deaths'], {'match': [0], 'time': [480], 'player': [1], 'cause': ['bomb']})
+        self.assertEqual(stats.summary()['win_rates'], {'player2': 0.5, 'timeout': 0.5})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import tempfile
+import unittest
+from unittest.mock import patch
+import pygame
+from benchmarks.suite import build_cases, compare, measure
+from eventlog import log
+from resources import images
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        images.clear()
+        self.addCleanup(images.clear)
+        # The display is never opened in tests
+        patcher = patch('pygame.display.update')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_every_case_runs(self):
+        with tempfile.TemporaryDirectory() as directory, log.quiet():
+            cases = build_cases(directory, pygame.Surface((13 * 40, 11 * 40)))
+            self.assertEqual(len({case.name for case in cases}), len(cases), "Case names should be unique")
+            for case in cases:
+                with self.subTest(case=case.name):
+                    result = measure(case, 1)
+                    self.assertGreater(result['min_us'], 0)
+                    self.assertEqual(result['min_us'], result['median_us'])
+
+    def test_compare_uses_fastest_sample(self):
+        baseline = {'min_us': 100.0, 'median_us': 100.0, 'mean_us': 100.0}
+        self.assertFalse(compare({'min_us': 110.0, 'median_us': 300.0, 'mean_us': 900.0}, baseline, 0.25)[1])
+        self.assertTrue(compare({'min_us': 130.0, 'median_us': 130.0, 'mean_us': 130.0}, baseline, 0.25)[1])
+        self.assertEqual(compare({'min_us': 100.0}, None, 0.25), ('', False))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+from unittest.mock import Mock
+import pygame
+from button import Button
+
+class TestButton(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.font = Mock()
+        self.font.render.side_effect = lambda text, antialias, color: pygame.Surface((len(text) * 10, 20))
+        self.button = Button(image=None, pos=(100, 50), text_input="PLAY", font=self.font,
+                             base_color="White", hovering_color="Green")
+
+    def test_text_rendered_once_per_color(self):
+        for position in [(100, 50), (100, 50), (0, 0), (100, 50)]:
+            self.button.changeColor(position)
+        self.assertEqual([call.args[2] for call in self.font.render.call_args_list], ["White", "Green"])
+        self.assertIs(self.button.text, self.button.hovering_text)
+
+    def test_change_color_reports_hover_changes(self):
+        self.assertTrue(self.button.changeColor((100, 50)))
+        self.assertFalse(self.button.changeColor((101, 51)))
+        self.assertTrue(self.button.changeColor((0, 0)))
+        self.assertIs(self.button.text, self.button.base_text)
+
+    def test_check_for_input(self):
+        self.assertTrue(self.button.checkForInput(self.button.rect.topleft))
+        self.assertFalse(self.button.checkForInput(self.button.rect.bottomright))
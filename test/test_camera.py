@@ -0,0 +1,37 @@
+import unittest
+import pygame
+from camera import Camera
+
+class TestCamera(unittest.TestCase):
+    def setUp(self):
+        self.camera = Camera(400, 300, 4000, 4000)
+
+    def test_center_on(self):
+        self.camera.center_on(2000, 2000)
+        self.assertEqual(self.camera.rect.center, (2000, 2000))
+
+    def test_clamped_to_map(self):
+        self.camera.center_on(0, 0)
+        self.assertEqual(self.camera.offset, (0, 0))
+        self.camera.center_on(4000, 4000)
+        self.assertEqual(self.camera.rect.bottomright, (4000, 4000))
+
+    def test_small_map_stays_at_origin(self):
+        camera = Camera(520, 440, 400, 400)
+        camera.center_on(200, 200)
+        self.assertEqual(camera.offset, (0, 0))
+
+    def test_follow_centers_between_sprites(self):
+        first = pygame.sprite.Sprite()
+        first.rect = pygame.Rect(1000, 1000, 40, 40)
+        second = pygame.sprite.Sprite()
+        second.rect = pygame.Rect(1400, 1000, 40, 40)
+        self.camera.follow([first, second])
+        self.assertEqual(self.camera.rect.center, (1220, 1020))
+
+    def test_to_screen(self):
+        self.camera.center_on(2000, 2000)
+        self.assertEqual(self.camera.to_screen(pygame.Rect(1800, 1850, 40, 40)).topleft, (0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
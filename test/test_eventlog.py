@@ -0,0 +1,60 @@
+import io
+import time
+import unittest
+from eventlog import EventLog, DEBUG, INFO, WARNING
+
+class TestEventLog(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.log = EventLog(self.stream, interval=60)
+
+    def lines(self):
+        self.log.flush()
+        return [line.split(' ', 1)[1] for line in self.stream.getvalue().splitlines()]
+
+    def test_levels_and_categories(self):
+        self.log.debug('bomb', "placed")
+        self.log.info('bomb', "exploded")
+        self.log.enable('monster')
+        self.log.debug('monster', "moved")
+        self.log.disable('player')
+        self.log.warning('player', "died")
+        self.assertEqual(self.lines(), ["info bomb: exploded", "debug monster: moved"])
+
+    def test_messages_are_formatted_when_written(self):
+        value = []
+        self.log.info('game', "winners %s", value)
+        value.append(1)
+        self.assertEqual(self.lines(), ["info game: winners [1]"])
+
+    def test_full_buffer_drops_the_oldest(self):
+        log = EventLog(self.stream, capacity=4, interval=60)
+        for index in range(6):
+            log.info('game', "event %d", index)
+        self.assertEqual(log.dropped, 2)
+        log.flush()
+        self.assertEqual([line.split(': ')[1] for line in self.stream.getvalue().splitlines()],
+                         ["event 2", "event 3", "event 4", "event 5"])
+
+    def test_quiet_drops_events(self):
+        with self.log.quiet():
+            self.log.warning('game', "lost")
+            self.assertFalse(self.log.enabled('game', WARNING))
+        self.log.info('game', "kept")
+        self.assertEqual(self.lines(), ["info game: kept"])
+
+    def test_configure(self):
+        self.log.configure('warning, bomb:debug, monster:off')
+        self.assertTrue(self.log.enabled('bomb', DEBUG))
+        self.assertFalse(self.log.enabled('player', INFO))
+        self.assertFalse(self.log.enabled('monster', WARNING))
+        with self.assertRaises(ValueError):
+            self.log.configure('bomb:loud')
+
+    def test_background_thread_writes(self):
+        log = EventLog(self.stream, interval=0.01)
+        log.info('game', "started")
+        deadline = time.time() + 5
+        while not self.stream.getvalue() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertIn("info game: started", self.stream.getvalue())
@@ -0,0 +1,36 @@
+import unittest
+import pygame
+from game import Game
+from timing import SimulationClock, STEP_MS, get_ticks
+from resources import images
+
+class TestGameStep(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        images.clear()
+        self.addCleanup(images.clear)
+        self.game = Game(pygame.Surface((520, 440)), 1, 2, 1, clock=SimulationClock(), seed=2)
+        self.player = next(player for player in self.game.players if player.id == 1)
+
+    def test_step_advances_game_clock(self):
+        for _ in range(3):
+            self.game.step([], 100)
+        self.assertEqual(self.game.game_clock.get_ticks(), 300)
+        self.assertNotEqual(get_ticks(), 300, "The game clock should only be active while the game is stepped")
+
+    def test_inputs_are_applied(self):
+        self.game.step([(1, 'down')])
+        self.assertEqual(self.player.get_coordinates(), (1, 0))
+
+    def test_bomb_explodes_on_game_time(self):
+        self.game.step([(1, 'bomb')])
+        self.assertEqual(len(self.game.bombs), 1)
+        while self.game.game_clock.get_ticks() < 3000 - STEP_MS:
+            self.assertIsNone(self.game.step(), "Nobody should be caught before the bomb explodes")
+        self.assertEqual(len(self.game.bombs), 1, "The fuse should still be burning")
+        self.game.step()
+        self.game.step()
+        self.assertEqual(len(self.game.bombs), 0, "The bomb should explode 3 seconds of game time after it was placed")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import Mock
+import pygame
+from map import Map, OBSTACLE
+from floor import Floor
+from brick import Brick, Obstacle
+from resources import images
+from camera import Camera
+
+class TestMap(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        images.clear()  # Other tests cache mocked surfaces
+        self.game_map = Map('map1.txt', 40)
+        self.screen = pygame.Surface((self.game_map.width * 40, self.game_map.height * 40))
+
+    def test_background_built_on_first_draw(self):
+        self.assertEqual(self.game_map.background_chunks, {}, "Background should not be rendered before the first draw")
+        self.game_map.draw(self.screen)
+        self.assertEqual(self.game_map.background_chunks[(0, 0)].get_size(), (13 * 40, 11 * 40))
+
+    def test_draw_is_single_blit(self):
+        self.game_map.draw(self.screen)
+        screen = Mock()
+        screen.get_rect.return_value = self.screen.get_rect()
+        self.game_map.draw(screen)
+        self.assertEqual(screen.blit.call_count, 1)
+
+    def test_set_tile_patches_background(self):
+        self.game_map.draw(self.screen)
+        chunk = self.game_map.background_chunks[(0, 0)]
+        brick_pixel = chunk.get_at((4 * 40 + 20, 20))
+        floor = Floor()
+        self.game_map.set_tile(0, 4, floor)
+        self.assertEqual(chunk.get_at((4 * 40 + 20, 20)), floor.image.get_at((20, 20)))
+        self.assertNotEqual(chunk.get_at((4 * 40 + 20, 20)), brick_pixel)
+        self.assertEqual(self.game_map.changed_tiles, [pygame.Rect(4 * 40, 0, 40, 40)])
+
+    def test_large_map_renders_only_visible_chunks(self):
+        game_map = Map.generate(101, 101, 40, seed=1)
+        camera = Camera(13 * 40, 11 * 40, 101 * 40, 101 * 40)
+        camera.center_on(50 * 40, 50 * 40)
+        game_map.draw(self.screen, camera)
+        self.assertEqual(list(game_map.background_chunks), [(1, 1)])
+
+    def test_generated_layout(self):
+        game_map = Map.generate(101, 51, 40, seed=1)
+        self.assertEqual((game_map.width, game_map.height), (101, 51))
+        self.assertTrue(game_map.isWall(1, 1))
+        for row, col in [(0, 0), (0, 100), (50, 0), (50, 100)]:
+            self.assertTrue(game_map.isFloor(row, col), "Spawn corners should be free")
+        self.assertEqual(Map.generate(21, 21, 40, seed=3).tiles, Map.generate(21, 21, 40, seed=3).tiles)
+
+    def test_generated_layout_with_even_size(self):
+        game_map = Map.generate(128, 64, 40, brick_density=1, seed=1)
+        for row, col in [(0, 0), (0, 127), (63, 0), (63, 127)]:
+            self.assertTrue(game_map.isFloor(row, col), "Spawn corners should be free")
+        self.assertTrue(game_map.isFloor(62, 127) and game_map.isFloor(63, 126),
+                        "Players should be able to leave the bottom right corner")
+
+    def test_tiles_are_one_byte_per_cell(self):
+        self.assertIsInstance(self.game_map.tiles, bytearray)
+        self.assertEqual(len(self.game_map.tiles), 13 * 11)
+
+    def test_tile_queries(self):
+        self.assertTrue(self.game_map.isFloor(0, 0))
+        self.assertTrue(self.game_map.isWall(1, 1))
+        self.assertTrue(self.game_map.isBrick(0, 4))
+        self.assertTrue(self.game_map.is_passable(0, 0))
+        self.assertFalse(self.game_map.is_passable(1, 1))
+        self.assertTrue(self.game_map.can_pass(1, 1, ignore_walls=True))
+        self.assertFalse(self.game_map.can_pass(0, 4, ignore_walls=True))
+
+    def test_out_of_bounds_queries(self):
+        for row, col in [(-1, 0), (0, -1), (11, 0), (0, 13)]:
+            self.assertFalse(self.game_map.isFloor(row, col))
+            self.assertFalse(self.game_map.isWall(row, col))
+            self.assertFalse(self.game_map.isBrick(row, col))
+            self.assertFalse(self.game_map.isObstacle(row, col))
+            self.assertFalse(self.game_map.is_passable(row, col))
+
+    def test_obstacle_counts_as_brick(self):
+        self.game_map.set_tile(0, 0, Obstacle())
+        self.assertEqual(self.game_map.tile_at(0, 0), OBSTACLE)
+        self.assertTrue(self.game_map.isObstacle(0, 0))
+        self.assertTrue(self.game_map.isBrick(0, 0))
+        self.assertTrue(self.game_map.is_tile_type(0, 0, Brick))
+        self.assertFalse(self.game_map.is_passable(0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,89 +1,233 @@
-import unittest
-from unittest.mock import Mock, patch
-import pygame
-from monster import Monster, DecisionMakingMonster
-from map import Map  # Assuming Map class is used for determining move validity
-
-class TestMonster(unittest.TestCase):
-    def setUp(self):
-        pygame.init()
-        
-        # Mocking the image loading as Monster might load an image
-        patcher = patch('pygame.image.load', Mock(return_value=pygame.Surface((40, 40))))
-        self.mock_image_load = patcher.start()
-        self.addCleanup(patcher.stop)
-        
-        # Set up a simple map mock that allows all movements
-        self.mock_map = Mock(spec=Map)
-        self.mock_map.width = 10
-        self.mock_map.height = 10
-        self.mock_map.is_passable.side_effect = lambda x, y: True
-        
-        # Create a Monster instance
-        self.monster = Monster(self.mock_map, 5, 5, 1)  # Initial position at (5, 5)
-
-    def test_move_monster(self):
-        # Initial position
-        initial_row, initial_col = self.monster.row, self.monster.col
-
-        # Movement simulation: move the monster to the right (5, 6)
-        self.monster.row, self.monster.col = 5, 6  # Manually setting new position
-
-        # Invoke update to process any additional logic
-        self.monster.update(self.mock_map, [], [])  # Pass empty lists for monsters and players
-
-        # Assertions: Check if the monster's position changed as expected
-        self.assertEqual((self.monster.row, self.monster.col), (5, 6), "Monster did not move as expected")
-        self.assertNotEqual((initial_row, initial_col), (self.monster.row, self.monster.col), "Monster position did not change")
-
-    def test_initial_position(self):
-        # Check initial position
-        self.assertEqual((self.monster.row, self.monster.col), (5, 5), "Monster initial position is incorrect")
-
-    def test_monster_speed(self):
-        # Check monster speed
-        self.assertEqual(self.monster.speed, 1, "Monster speed is incorrect")
-
-    def test_monster_image_loaded(self):
-        # Check if image is loaded
-        self.assertIsNotNone(self.monster.image, "Monster image not loaded")
-
-    def test_monster_rect_position(self):
-        # Check if rect position is correct
-        self.assertEqual(self.monster.rect.topleft, (5 * 40, 5 * 40), "Monster rect position is incorrect")
-
-    def test_update_position(self):
-        # Update monster position
-        self.monster.row, self.monster.col = 6, 6
-        self.monster.update(self.mock_map, [], [])
-        self.assertEqual((self.monster.row, self.monster.col), (6, 6), "Monster update position is incorrect")
-
-    def test_monster_get_coordinates(self):
-        # Check get_coordinates method
-        self.assertEqual(self.monster.get_coordinates(), (5, 5), "Monster get_coordinates is incorrect")
-
-    def test_monster_move_valid(self):
-        # Move to a valid position
-        self.monster.row, self.monster.col = 5, 6
-        self.monster.update(self.mock_map, [], [])
-        self.assertEqual((self.monster.row, self.monster.col), (5, 6), "Monster did not move to valid position")
-
-    def test_monster_catches_player(self):
-        # Create a mock player and check if caught
-        player = Mock()
-        player.rect = pygame.Rect(self.monster.rect.topleft, self.monster.rect.size)
-        self.assertTrue(self.monster.catches(player), "Monster did not catch the player")
-
-    def test_monster_does_not_catch_player(self):
-        # Create a mock player and check if not caught
-        player = Mock()
-        player.rect = pygame.Rect((self.monster.rect.right + 1, self.monster.rect.top), self.monster.rect.size)
-        self.assertFalse(self.monster.catches(player), "Monster incorrectly caught the player")
-
-    def test_monster_kill(self):
-        # Test kill method
-        self.monster.kill()
-        self.assertFalse(self.monster.alive(), "Monster is still alive after kill")
-
-if __name__ == '__main__':
-    unittest.main()
+import unittest
+from unittest.mock import Mock, patch
+import pygame
+from monster import Monster, DecisionMakingMonster, PathfindingMonster, DistanceField, PathCache, bfs_path, astar_path
+from map import Map  # Assuming Map class is used for determining move validity
+from gameField import GameField
+
+class TestMonster(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        
+        # Mocking the image loading as Monster might load an image
+        patcher = patch('pygame.image.load', Mock(return_value=pygame.Surface((40, 40))))
+        self.mock_image_load = patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        # Set up a simple map mock that allows all movements
+        self.mock_map = Mock(spec=Map)
+        self.mock_map.width = 10
+        self.mock_map.height = 10
+        self.mock_map.is_passable.side_effect = lambda x, y: True
+        
+        # Create a Monster instance
+        self.monster = Monster(self.mock_map, 5, 5, 1)  # Initial position at (5, 5)
+
+    def test_move_monster(self):
+        # Initial position
+        initial_row, initial_col = self.monster.row, self.monster.col
+
+        # Movement simulation: move the monster to the right (5, 6)
+        self.monster.row, self.monster.col = 5, 6  # Manually setting new position
+
+        # Invoke update to process any additional logic
+        self.monster.update(self.mock_map, [], [])  # Pass empty lists for monsters and players
+
+        # Assertions: Check if the monster's position changed as expected
+        self.assertEqual((self.monster.row, self.monster.col), (5, 6), "Monster did not move as expected")
+        self.assertNotEqual((initial_row, initial_col), (self.monster.row, self.monster.col), "Monster position did not change")
+
+    def test_initial_position(self):
+        # Check initial position
+        self.assertEqual((self.monster.row, self.monster.col), (5, 5), "Monster initial position is incorrect")
+
+    def test_monster_speed(self):
+        # Check monster speed
+        self.assertEqual(self.monster.speed, 1, "Monster speed is incorrect")
+
+    def test_monster_image_loaded(self):
+        # Check if image is loaded
+        self.assertIsNotNone(self.monster.image, "Monster image not loaded")
+
+    def test_monster_rect_position(self):
+        # Check if rect position is correct
+        self.assertEqual(self.monster.rect.topleft, (5 * 40, 5 * 40), "Monster rect position is incorrect")
+
+    def test_update_position(self):
+        # Update monster position
+        self.monster.row, self.monster.col = 6, 6
+        self.monster.update(self.mock_map, [], [])
+        self.assertEqual((self.monster.row, self.monster.col), (6, 6), "Monster update position is incorrect")
+
+    def test_monster_get_coordinates(self):
+        # Check get_coordinates method
+        self.assertEqual(self.monster.get_coordinates(), (5, 5), "Monster get_coordinates is incorrect")
+
+    def test_monster_move_valid(self):
+        # Move to a valid position
+        self.monster.row, self.monster.col = 5, 6
+        self.monster.update(self.mock_map, [], [])
+        self.assertEqual((self.monster.row, self.monster.col), (5, 6), "Monster did not move to valid position")
+
+    def test_monster_catches_player(self):
+        # Create a mock player and check if caught
+        player = Mock()
+        player.rect = pygame.Rect(self.monster.rect.topleft, self.monster.rect.size)
+        self.assertTrue(self.monster.catches(player), "Monster did not catch the player")
+
+    def test_monster_does_not_catch_player(self):
+        # Create a mock player and check if not caught
+        player = Mock()
+        player.rect = pygame.Rect((self.monster.rect.right + 1, self.monster.rect.top), self.monster.rect.size)
+        self.assertFalse(self.monster.catches(player), "Monster incorrectly caught the player")
+
+    def test_monster_kill(self):
+        # Test kill method
+        self.monster.kill()
+        self.assertFalse(self.monster.alive(), "Monster is still alive after kill")
+
+class TestDistanceField(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.game_map = Map('map1.txt', 40)
+        self.field = DistanceField()
+
+    def test_distances_from_single_player(self):
+        self.field.compute(self.game_map, [(0, 0)])
+        self.assertEqual(self.field.distance(0, 0), 0)
+        self.assertEqual(self.field.distance(0, 3), 3)
+        self.assertEqual(self.field.distance(2, 0), 2)
+        self.assertEqual(self.field.distance(1, 1), DistanceField.UNREACHABLE, "Walls should be unreachable")
+        self.assertEqual(self.field.distance(-1, 0), DistanceField.UNREACHABLE)
+
+    def test_distances_to_nearest_player(self):
+        self.field.compute(self.game_map, [(0, 0), (10, 12)])
+        self.assertEqual(self.field.distance(10, 12), 0)
+        self.assertEqual(self.field.distance(0, 1), 1)
+        self.assertEqual(self.field.distance(10, 11), 1)
+
+    def test_next_step_follows_shortest_path(self):
+        self.field.compute(self.game_map, [(0, 0)])
+        monster = PathfindingMonster(GameField(self.game_map), 2, 1, 1)
+        path = monster.bfs(self.game_map, (0, 0))
+        row, col = 2, 1
+        steps = 0
+        while (row, col) != (0, 0):
+            row, col = self.field.next_step(row, col)
+            steps += 1
+        self.assertEqual(steps, len(path) - 1, "Following the field should take as many steps as the BFS path")
+        self.assertEqual(path, [(2, 1), (2, 0), (1, 0), (0, 0)])
+        self.assertIsNone(self.field.next_step(0, 0), "A monster on the player should not move")
+
+    def test_refresh_computes_once_per_tick(self):
+        players = [Mock(row=0, col=0)]
+        self.field.refresh(self.game_map, players)
+        self.field.refresh(self.game_map, players)
+        self.assertEqual(self.field.computations, 1)
+        self.field.invalidate()
+        self.field.refresh(self.game_map, players)
+        self.assertEqual(self.field.computations, 2)
+
+    def test_refresh_reuses_field_until_map_changes(self):
+        players = [Mock(row=0, col=0)]
+        self.field.refresh(self.game_map, players)
+        self.field.refresh(self.game_map, players)
+        self.assertEqual((self.field.computations, self.field.reuses), (1, 1))
+        self.game_map.set_tile(0, 4, 0)
+        self.field.refresh(self.game_map, players)
+        self.assertEqual(self.field.computations, 2, "A changed map should recompute the field")
+        players[0].col = 1
+        self.field.refresh(self.game_map, players)
+        self.assertEqual(self.field.computations, 3, "A moved player should recompute the field")
+
+    def test_monster_moves_towards_player(self):
+        monster = PathfindingMonster(GameField(self.game_map), 2, 1, 1)
+        monster.next_move_time = 0
+        monster.update(self.game_map, [], [Mock(row=0, col=0)])
+        self.assertEqual(monster.game_field.distance_field.distance(monster.row, monster.col), 2)
+
+class TestPathCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.cache = PathCache(maxsize=2)
+
+    def test_hit_and_miss(self):
+        self.assertIsNone(self.cache.get((0, 0), (0, 2), 1))
+        self.cache.put((0, 0), (0, 2), 1, [(0, 0), (0, 1), (0, 2)])
+        self.assertEqual(self.cache.get((0, 0), (0, 2), 1), ((0, 0), (0, 1), (0, 2)))
+        self.assertIsNone(self.cache.get((0, 0), (0, 2), 2), "A new map version should miss")
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+        self.assertAlmostEqual(self.cache.hit_rate, 1 / 3)
+
+    def test_missing_path_is_cached(self):
+        self.cache.put((0, 0), (5, 5), 1, None)
+        self.assertEqual(self.cache.get((0, 0), (5, 5), 1), ())
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.put((0, 0), (0, 1), 1, [(0, 0), (0, 1)])
+        self.cache.put((0, 0), (0, 2), 1, [(0, 0), (0, 1), (0, 2)])
+        self.cache.get((0, 0), (0, 1), 1)
+        self.cache.put((0, 0), (0, 3), 1, [(0, 0), (0, 3)])
+        self.assertIsNotNone(self.cache.get((0, 0), (0, 1), 1))
+        self.assertIsNone(self.cache.get((0, 0), (0, 2), 1), "Least recently used path should be evicted")
+
+    def test_find_path_uses_cache_until_map_changes(self):
+        game_map = Map('map1.txt', 40)
+        monster = PathfindingMonster(GameField(game_map), 2, 1, 1)
+        cache = monster.game_field.path_cache
+        self.assertEqual(monster.find_path(game_map, (0, 0)), [(2, 1), (2, 0), (1, 0), (0, 0)])
+        monster.find_path(game_map, (0, 0))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        game_map.mark_bomb_tile(5, 5)
+        monster.find_path(game_map, (0, 0))
+        self.assertEqual(cache.misses, 2, "A changed map should search again")
+
+class TestAStar(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def test_same_path_lengths_as_bfs(self):
+        for filename in ('map1.txt', 'map2.txt', 'map3.txt'):
+            game_map = Map(filename, 40)
+            cells = [(row, col) for row in range(game_map.height) for col in range(game_map.width)
+                     if game_map.is_passable(row, col)]
+            for goal in cells[::7]:
+                for start in cells:
+                    expected = bfs_path(game_map, start, goal)
+                    path = astar_path(game_map, start, goal)
+                    if expected is None:
+                        self.assertIsNone(path, f"{filename}: {start} -> {goal} should be unreachable")
+                        continue
+                    self.assertEqual(len(path), len(expected), f"{filename}: {start} -> {goal} is not shortest")
+                    self.assertEqual((path[0], path[-1]), (start, goal))
+                    for (row, col), (next_row, next_col) in zip(path, path[1:]):
+                        self.assertEqual(abs(row - next_row) + abs(col - next_col), 1)
+                        self.assertTrue(game_map.is_passable(next_row, next_col))
+
+    def test_search_budget(self):
+        game_map = Map.generate(41, 41, 40, brick_density=0, seed=1)
+        self.assertIsNone(astar_path(game_map, (0, 0), (40, 40), max_nodes=10), "A small budget should give up")
+        self.assertEqual(len(astar_path(game_map, (0, 0), (40, 40), max_nodes=1000)), 81)
+
+    def test_monster_strategy(self):
+        game_map = Map('map1.txt', 40)
+        player = Mock(row=0, col=0)
+        for strategy in ('field', 'bfs', 'astar'):
+            monster = PathfindingMonster(GameField(game_map), 2, 1, 1)
+            monster.pathfinder = strategy
+            self.assertTrue(monster.move_towards_player(game_map, [player]))
+            self.assertEqual((monster.row, monster.col), (2, 0), f"{strategy} should step along the shortest path")
+
+class TestMapVersion(unittest.TestCase):
+    def test_version_bumped_by_mutations(self):
+        game_map = Map('map1.txt', 40)
+        version = game_map.version
+        game_map.set_tile(0, 4, 0)
+        game_map.mark_bomb_tile(0, 0)
+        game_map.unmark_bomb_tile(0, 0)
+        self.assertEqual(game_map.version, version + 3)
+        game_map.unmark_bomb_tile(0, 0)
+        self.assertEqual(game_map.version, version + 3, "Unmarking a tile without a bomb changes nothing")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import asyncio
+import unittest
+from client import GameClient
+from game import Game
+from resources import images
+from server import GameServer, MatchServer, TICK_RATES
+from simulation import setup_headless
+from snapshot import capture, diff, patch
+
+class TestDelta(unittest.TestCase):
+    def test_patch_reverses_diff(self):
+        old = bytes(range(200))
+        for new in (old, old[:150], old + b'more', bytes(10) + old[10:100] + b'x' + old[101:]):
+            self.assertEqual(patch(old, diff(old, new)), new)
+
+    def test_small_changes_give_small_deltas(self):
+        old = bytes(400)
+        new = bytearray(old)
+        new[3] = new[300] = 1
+        self.assertLess(len(diff(old, bytes(new))), 30)
+
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        images.clear()
+        self.addCleanup(images.clear)
+        self.addCleanup(setattr, images, 'headless', False)
+        setup_headless()
+
+    def run_async(self, coroutine):
+        return asyncio.run(asyncio.wait_for(coroutine, 10))
+
+    def test_clients_follow_the_server(self):
+        async def scenario():
+            server = GameServer(Game(None, 1, 2, 1, seed=2))
+            port = await server.start()
+            first, second = GameClient(), GameClient()
+            await first.connect('127.0.0.1', port)
+            await second.connect('127.0.0.1', port)
+            self.assertEqual((first.player_id, second.player_id), (1, 2))
+            self.assertEqual(first.state, server.state)
+
+            first.send('bomb')
+            second.send('right')
+            await asyncio.sleep(0.01)
+            await server.run(realtime=False, max_ticks=30)
+            for client in (first, second):
+                while client.tick < server.game.tick:
+                    await client.receive()
+                client.sync()
+            await first.close()
+            await second.close()
+            await server.close()
+            return server, first, second
+
+        server, first, second = self.run_async(scenario())
+        for client in (first, second):
+            self.assertEqual(client.state, server.state)
+            self.assertEqual(capture(client.game), server.state)
+            self.assertEqual(client.acked, 1)
+            self.assertEqual(len(client.latencies), 1)
+        self.assertEqual(len(server.game.bombs), 1)
+        self.assertLess(server.bytes_per_tick, 100, "Ticks should be sent as small deltas, not full states")
+
+    def test_full_game_is_rejected(self):
+        async def scenario():
+            server = GameServer(Game(None, 1, 2, 1, seed=2))
+            port = await server.start()
+            clients = [GameClient(), GameClient()]
+            await clients[0].connect('127.0.0.1', port, player_id=2)
+            self.assertEqual(clients[0].player_id, 2)
+            with self.assertRaises(ConnectionError):
+                await clients[1].connect('127.0.0.1', port, player_id=2)
+            await clients[1].connect('127.0.0.1', port)
+            self.assertEqual(clients[1].player_id, 1)
+            for client in clients:
+                await client.close()
+            await server.close()
+
+        self.run_async(scenario())
+
+class TestMatchServer(unittest.TestCase):
+    def setUp(self):
+        images.clear()
+        self.addCleanup(images.clear)
+        self.addCleanup(setattr, images, 'headless', False)
+        setup_headless()
+
+    def test_matches_tick_at_the_tick_rate(self):
+        async def scenario():
+            finished = []
+            server = MatchServer(on_finished=lambda match_id, match: finished.append(match_id))
+            running = [server.add_match(Game(None, 1, 2, 1, seed=seed)) for seed in (2, 3)]
+            # Without monsters the game is won by every player at once
+            ended = server.add_match(Game(None, 1, 2, 1, seed=4, monster_types=[]))
+            matches = dict(server.matches)
+            await server.run(0.5)
+            await server.close()
+            return server, [matches[match_id] for match_id in running], ended, finished
+
+        server, running, ended, finished = asyncio.run(asyncio.wait_for(scenario(), 10))
+        self.assertEqual(finished, [ended])
+        self.assertEqual(server.tick_rate, TICK_RATES[0])
+        for match in running:
+            self.assertTrue(5 <= match.ticks <= 11, f"A match should tick about 10 times in half a second, not {match.ticks}")
+            self.assertGreater(match.cpu_time, 0)
+
+    def test_overload_lowers_the_tick_rate(self):
+        server = MatchServer()
+        match = server.matches[server.add_match(Game(None, 1, 2, 1, seed=2))]
+        server.adjust(0.95)
+        self.assertEqual(server.tick_rate, TICK_RATES[1])
+        self.assertEqual(match.dt, 1000 / TICK_RATES[1])
+        server.adjust(0.7)
+        self.assertEqual(server.tick_rate, TICK_RATES[1], "The rate should only go up when the load allows it")
+        server.adjust(0.3)
+        self.assertEqual(server.tick_rate, TICK_RATES[0])
+        self.assertEqual(match.dt, 1000 / TICK_RATES[0])
+
+    def test_clients_join_a_match(self):
+        async def scenario():
+            server = MatchServer()
+            server.add_match(Game(None, 1, 2, 1, seed=2))
+            second = server.add_match(Game(None, 1, 3, 1, seed=3))
+            port = await server.start()
+            client = GameClient()
+            await client.connect('127.0.0.1', port, match_id=second)
+            self.assertEqual(len(client.game.roster), 3)
+            with self.assertRaises(ConnectionError):
+                await GameClient().connect('127.0.0.1', port, match_id=99)
+            run = asyncio.create_task(server.run(0.3))
+            tick = await client.receive()
+            await run
+            await client.close()
+            await server.close()
+            return tick
+
+        tick = asyncio.run(asyncio.wait_for(scenario(), 10))
+        self.assertEqual(tick, 1)
+
+if __name__ == '__main__':
+    unittest.main()
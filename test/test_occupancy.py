@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import Mock, patch
+import pygame
+from occupancy import GridGroup, occupants_at
+from player import Player
+from bomb import Bomb
+from resources import images
+
+class TestGridGroup(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+        # Mocking image loading
+        patcher = patch('pygame.image.load', Mock(return_value=pygame.Surface((40, 40))))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        images.clear()
+        self.addCleanup(images.clear)
+
+        self.players = GridGroup()
+        self.player = Player(1, 2, 3, 1, 1, [])
+        self.players.add(self.player)
+
+    def test_added_sprite_is_indexed(self):
+        self.assertEqual(self.players.at(2, 3), [self.player])
+        self.assertEqual(self.players.at(0, 0), [])
+
+    def test_index_follows_moves(self):
+        self.player.move(1, 0)
+        self.assertEqual(self.players.at(2, 3), [])
+        self.assertEqual(self.players.at(3, 3), [self.player])
+        self.player.col = 4
+        self.assertEqual(self.players.at(3, 4), [self.player])
+        self.assertEqual(list(self.players.cells), [(3, 4)], "Old cells should not be left behind")
+
+    def test_removed_sprite_is_unindexed(self):
+        self.players.remove(self.player)
+        self.assertEqual(self.players.at(2, 3), [])
+        self.assertEqual(self.players.cells, {})
+
+    def test_sprite_in_several_groups(self):
+        bombs = GridGroup()
+        other = GridGroup()
+        bomb = Bomb(self.player, 2, 3, 1, 3000)
+        bombs.add(bomb)
+        other.add(bomb)
+        bomb.kill()
+        self.assertEqual((bombs.cells, other.cells), ({}, {}))
+
+    def test_occupants_at_plain_group(self):
+        group = pygame.sprite.Group(Player(2, 2, 3, 1, 1, []))
+        self.assertEqual(len(occupants_at(group, 2, 3)), 1, "Plain groups should be searched sprite by sprite")
+        self.assertEqual(occupants_at(self.players, 2, 3), [self.player])
+
+if __name__ == '__main__':
+    unittest.main()
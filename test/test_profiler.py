@@ -0,0 +1,77 @@
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import pygame
+from game import Game
+from profiler import FrameProfiler, SUBSYSTEMS
+from resources import images
+from simulation import setup_headless
+
+class TestFrameProfiler(unittest.TestCase):
+    def test_marks_split_the_frame(self):
+        profiler = FrameProfiler()
+        with patch('time.perf_counter', side_effect=[0.0, 0.002, 0.005, 0.105, 0.106]):
+            profiler.begin_frame()
+            profiler.mark('monsters')
+            profiler.mark('bombs')
+            profiler.skip()
+            profiler.mark('display')
+        profiler.end_frame()
+        self.assertAlmostEqual(profiler.samples['monsters'][0], 2)
+        self.assertAlmostEqual(profiler.samples['bombs'][0], 3)
+        self.assertAlmostEqual(profiler.samples['display'][0], 1)
+        self.assertAlmostEqual(profiler.totals[0], 6, msg="Skipped time should not count")
+
+    def test_rolling_percentiles(self):
+        profiler = FrameProfiler(window=100)
+        for frame in range(300):
+            profiler.begin_frame()
+            profiler.current['monsters'] = (frame % 100) / 1000
+            profiler.end_frame()
+        self.assertEqual(len(profiler.samples['monsters']), 100)
+        self.assertEqual(profiler.percentiles('monsters'), (50, 99))
+        self.assertEqual(FrameProfiler().percentiles('bombs'), (0, 0))
+
+    def test_csv_has_a_row_per_frame(self):
+        path = os.path.join(tempfile.mkdtemp(), 'frames.csv')
+        profiler = FrameProfiler(csv_path=path)
+        for _ in range(3):
+            profiler.begin_frame()
+            profiler.end_frame()
+        profiler.close()
+        with open(path, newline='') as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[0], ['frame', *SUBSYSTEMS, 'total'])
+        self.assertEqual([row[0] for row in rows[1:]], ['1', '2', '3'])
+
+class TestGameProfiling(unittest.TestCase):
+    def setUp(self):
+        images.clear()
+        self.addCleanup(images.clear)
+        self.addCleanup(setattr, images, 'headless', False)
+        setup_headless()
+        patcher = patch('pygame.display.update')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_step_and_draw_are_timed(self):
+        for dirty_rects in (False, True):
+            game = Game(pygame.Surface((13 * 40, 11 * 40)), 1, 2, 1, dirty_rects=dirty_rects, seed=2)
+            game.profiler = FrameProfiler()
+            game.profiler.begin_frame()
+            game.step([(1, 'bomb')])
+            game.render()
+            game.profiler.end_frame()
+            timed = {name for name in SUBSYSTEMS if game.profiler.samples[name][0] > 0}
+            self.assertTrue({'input', 'monsters', 'bombs', 'draw_map', 'draw_players', 'display'} <= timed)
+
+    def test_overlay_covers_every_subsystem(self):
+        profiler = FrameProfiler()
+        screen = pygame.Surface((520, 440))
+        rect = profiler.draw(screen)
+        self.assertGreater(rect.height, len(SUBSYSTEMS) * 5)
+        overlay = profiler.overlay
+        profiler.draw(screen)
+        self.assertIs(profiler.overlay, overlay, "The overlay should only be rendered again every refresh frames")
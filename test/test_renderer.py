@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import patch
+import pygame
+from map import Map
+from floor import Floor
+from monster import Monster
+from renderer import DirtyRectRenderer
+from camera import Camera
+from resources import images
+
+class TestDirtyRectRenderer(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        images.clear()  # Other tests cache mocked surfaces
+
+        # The display is never opened in tests
+        patcher = patch('pygame.display.update')
+        self.mock_update = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.game_map = Map('map1.txt', 40)
+        self.screen = pygame.Surface((13 * 40, 11 * 40))
+        self.monster = Monster(self.game_map, 0, 0, 1)
+        self.monsters = pygame.sprite.Group(self.monster)
+        self.camera = Camera(13 * 40, 11 * 40, 13 * 40, 11 * 40)
+        self.renderer = DirtyRectRenderer(self.screen, self.game_map, self.camera)
+        self.renderer.draw([self.monsters])
+        self.mock_update.reset_mock()
+
+    def test_first_frame_is_full_redraw(self):
+        renderer = DirtyRectRenderer(self.screen, self.game_map, self.camera)
+        self.assertEqual(renderer.draw([self.monsters]), [self.screen.get_rect()])
+        self.assertFalse(renderer.full_redraw)
+
+    def test_static_frame_presents_nothing(self):
+        self.assertEqual(self.renderer.draw([self.monsters]), [])
+        self.mock_update.assert_not_called()
+
+    def test_moved_sprite_marks_old_and_new_rect(self):
+        old_rect = self.monster.rect.copy()
+        self.monster.rect.topleft = (40, 0)
+        dirty = self.renderer.draw([self.monsters])
+        self.assertIn(old_rect, dirty)
+        self.assertIn(self.monster.rect, dirty)
+        self.mock_update.assert_called_once_with(dirty)
+
+    def test_removed_sprite_marks_old_rect(self):
+        self.monster.kill()
+        self.assertEqual(self.renderer.draw([self.monsters]), [self.monster.rect])
+
+    def test_changed_tile_is_dirty(self):
+        self.game_map.set_tile(0, 4, Floor())
+        self.assertEqual(self.renderer.draw([self.monsters]), [pygame.Rect(4 * 40, 0, 40, 40)])
+
+    def test_scrolling_forces_full_redraw(self):
+        self.camera.rect.x += 40
+        self.assertEqual(self.renderer.draw([self.monsters]), [self.screen.get_rect()])
+
+    def test_dirty_rects_are_in_screen_coordinates(self):
+        self.camera.world_width = 26 * 40
+        self.camera.center_on(26 * 40, 0)
+        self.monster.rect.topleft = (20 * 40, 0)
+        self.renderer.draw([self.monsters])
+        self.monster.rect.topleft = (21 * 40, 0)
+        self.assertEqual(self.renderer.draw([self.monsters]), [pygame.Rect(8 * 40, 0, 40, 40), pygame.Rect(7 * 40, 0, 40, 40)])
+
+    def test_invalidate_forces_full_redraw(self):
+        self.renderer.invalidate()
+        self.assertEqual(self.renderer.draw([self.monsters]), [self.screen.get_rect()])
+        self.mock_update.assert_called_once_with()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from game import Game
+from replay import Recorder, Replay
+from simulation import setup_headless, RandomPolicy
+from snapshot import capture
+from resources import images
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        images.clear()
+        self.addCleanup(images.clear)
+        self.addCleanup(setattr, images, 'headless', False)
+        setup_headless()
+        self.game = Game(None, 1, 2, 1, seed=3)
+        self.recorder = Recorder(self.game, snapshot_interval=100)
+        self.states = {}
+        policy = RandomPolicy(3, actions_per_second=1)
+        self.winners = None
+        while self.winners is None and self.game.tick < 1000:
+            self.states[self.game.tick] = capture(self.game)
+            self.winners = self.game.step(policy(self.game, 1000 / 60))
+
+    def test_seek_matches_recorded_game(self):
+        replay = Replay(self.recorder.data(self.winners))
+        game = None
+        for tick in (self.game.tick - 1, 350, 100, 99, 0, 101, 512):
+            game = replay.seek(tick, game)
+            self.assertEqual(game.tick, tick)
+            self.assertEqual(capture(game), self.states[tick], f"Seeking to tick {tick} should restore its state")
+
+    def test_playback_reaches_recorded_outcome(self):
+        replay = Replay(self.recorder.data(self.winners))
+        game = replay.new_game()
+        while game.tick < replay.ticks:
+            replay.step(game)
+        self.assertEqual(game.winners, self.winners)
+        self.assertEqual(game.deaths, self.game.deaths)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'game.replay')
+            self.recorder.save(path, self.winners)
+            replay = Replay.load(path)
+            self.assertLess(os.path.getsize(path), 4096)
+        self.assertEqual(replay.ticks, self.game.tick)
+        self.assertEqual(sorted(replay.snapshots), list(range(0, self.game.tick, 100)))
+        self.assertEqual(capture(replay.seek(250)), self.states[250])
+
+    def test_step_length_must_not_change(self):
+        with self.assertRaises(ValueError):
+            self.recorder.record(self.game, [], 50)
+
+if __name__ == '__main__':
+    unittest.main()
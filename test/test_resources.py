@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import Mock, patch
+import pygame
+from resources import ImageCache, TextCache, images
+from floor import Floor
+from wall import Wall
+
+class TestImageCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+        # Mocking image loading
+        patcher = patch('pygame.image.load', Mock(side_effect=lambda path: pygame.Surface((40, 40))))
+        self.mock_image_load = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cache = ImageCache()
+
+    def test_image_loaded_once(self):
+        first = self.cache.load("images/bomb_image.png")
+        second = self.cache.load("images/bomb_image.png")
+        self.assertIs(first, second, "Cached image should be shared")
+        self.mock_image_load.assert_called_once_with("images/bomb_image.png")
+
+    def test_hit_and_miss_counters(self):
+        self.cache.load("images/bomb_image.png")
+        self.cache.load("images/bomb_image.png")
+        self.cache.load("images/explosion_image.png")
+        self.assertEqual(self.cache.misses, 2, "Every new path should count as a miss")
+        self.assertEqual(self.cache.hits, 1, "Repeated path should count as a hit")
+
+    def test_preload_then_no_misses(self):
+        self.cache.preload(["images/bomb_image.png", "images/explosion_image.png"])
+        self.cache.reset_stats()
+        self.cache.load("images/bomb_image.png")
+        self.cache.load("images/explosion_image.png")
+        self.assertEqual(self.cache.misses, 0, "Preloaded images should not be read again")
+        self.assertEqual(self.cache.hits, 2)
+
+    def test_clear(self):
+        self.cache.load("images/bomb_image.png")
+        self.cache.clear()
+        self.cache.load("images/bomb_image.png")
+        self.assertEqual(self.cache.misses, 1, "Cleared cache should load the image again")
+        self.assertEqual(self.mock_image_load.call_count, 2)
+
+    def test_tiles_share_surface(self):
+        self.addCleanup(images.clear)
+        self.assertIs(Floor().image, Floor().image, "Floor tiles should share one surface")
+        self.assertIs(Wall().image, Wall().image, "Wall tiles should share one surface")
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.cache = TextCache()
+
+    def test_font_opened_once_per_size(self):
+        self.assertIs(self.cache.font(20), self.cache.font(20))
+        self.assertIsNot(self.cache.font(20), self.cache.font(15))
+
+    def test_text_rendered_once(self):
+        first = self.cache.render("MAIN MENU", 20, "White")
+        self.assertIs(self.cache.render("MAIN MENU", 20, "White"), first)
+        self.assertIsNot(self.cache.render("MAIN MENU", 20, "Green"), first)
+        self.assertIsNot(self.cache.render("MAIN MENU", 15, "White"), first)
+        self.cache.clear()
+        self.assertIsNot(self.cache.render("MAIN MENU", 20, "White"), first)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from game import Game
+from resources import images
+from rollback import RollbackSession, LatencyLink, run_loopback
+from simulation import setup_headless
+from snapshot import capture
+
+class TestLatencyLink(unittest.TestCase):
+    def test_messages_arrive_after_half_the_round_trip(self):
+        link = LatencyLink(100)
+        link.send(0, 1, 'first')
+        link.send(10, 0, 'second')
+        self.assertEqual(link.receive(49), [])
+        self.assertEqual(link.receive(50), [(1, 'first')])
+        self.assertEqual(link.flush(), [(0, 'second')])
+
+    def test_jitter_can_reorder_messages(self):
+        link = LatencyLink(100, jitter=20, seed=3)
+        for index in range(50):
+            link.send(index, 0, index)
+        self.assertNotEqual([message for _, message in link.flush()], list(range(50)))
+
+class TestRollbackSession(unittest.TestCase):
+    def setUp(self):
+        images.clear()
+        self.addCleanup(images.clear)
+        self.addCleanup(setattr, images, 'headless', False)
+        setup_headless()
+
+    def test_local_input_is_applied_at_once(self):
+        session = RollbackSession(Game(None, 1, 2, 1, seed=2), [1])
+        self.assertEqual(session.add_local_input(1, ['bomb']), (1, 0, ('bomb',)))
+        self.assertTrue(session.advance())
+        self.assertEqual(len(session.game.bombs), 1)
+
+    def test_late_remote_input_rolls_back(self):
+        session = RollbackSession(Game(None, 1, 2, 1, seed=2), [1])
+        for _ in range(5):
+            session.advance()
+        session.add_remote_input(2, 0, [])
+        session.add_remote_input(2, 1, ['bomb'])
+        self.assertEqual(session.confirmed_tick, 1)
+        session.advance()
+        self.assertEqual((session.rollbacks, session.resimulated, session.tick), (1, 4, 6))
+
+        reference = Game(None, 1, 2, 1, seed=2)
+        for tick in range(6):
+            reference.step([(2, 'bomb')] if tick == 1 else [], session.dt)
+        self.assertEqual(capture(session.game), capture(reference))
+
+    def test_waits_for_remote_inputs(self):
+        session = RollbackSession(Game(None, 1, 2, 1, seed=2), [1], max_prediction=3)
+        advanced = [session.advance() for _ in range(6)]
+        self.assertEqual(advanced, [True] * 3 + [False] * 3)
+        self.assertEqual(session.stalls, 3)
+
+    def test_loopback_matches_a_game_without_latency(self):
+        for seed in (1, 3):
+            sessions, consistent = run_loopback(ticks=600, rtt=100, jitter=20, seed=seed)
+            self.assertTrue(consistent)
+            self.assertTrue(any(session.rollbacks for session in sessions))
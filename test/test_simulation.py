@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import Mock, patch
+from simulation import run_match, RandomPolicy
+from resources import images
+
+class TestSimulation(unittest.TestCase):
+    def setUp(self):
+        images.clear()
+        self.addCleanup(images.clear)
+        self.addCleanup(setattr, images, 'headless', False)
+
+    def test_same_seed_same_match(self):
+        first = run_match(seed=7)
+        second = run_match(seed=7)
+        self.assertEqual((first.winners, first.ticks), (second.winners, second.ticks))
+
+    def test_no_images_decoded_or_drawn(self):
+        with patch('pygame.image.load') as image_load, patch('pygame.display.update') as display_update:
+            run_match(seed=3)
+        image_load.assert_not_called()
+        display_update.assert_not_called()
+
+    def test_time_limit(self):
+        idle = lambda game, dt: []
+        result = run_match(seed=1, time_limit=1000, policy=idle)
+        if result.winners is None:
+            self.assertGreaterEqual(result.game_time, 1000)
+        self.assertLessEqual(result.game_time, 1000 + 1000 / 60)
+
+    def test_random_policy_uses_actions(self):
+        game = Mock()
+        game.players = [Mock(id=1), Mock(id=2)]
+        inputs = RandomPolicy(seed=1, actions_per_second=1000)(game, 1000)
+        self.assertEqual([player_id for player_id, _ in inputs], [1, 2], "Every player should act when the chance is 1")
+
+if __name__ == '__main__':
+    unittest.main()
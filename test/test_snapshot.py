@@ -0,0 +1,68 @@
+import unittest
+from game import Game
+from monster import Monster
+from resources import images
+from simulation import setup_headless
+from snapshot import capture, restore
+from timing import STEP_MS
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        images.clear()
+        self.addCleanup(images.clear)
+        self.addCleanup(setattr, images, 'headless', False)
+        setup_headless()
+        self.game = Game(None, 1, 2, 1, seed=2)
+        self.game.step([(1, 'bomb'), (2, 'right')])
+        for _ in range(60):
+            self.game.step([(1, 'down')] if self.game.tick == 10 else [])
+
+    def play(self, game, ticks):
+        for _ in range(ticks):
+            game.step([(2, 'bomb')] if game.tick == 100 else [])
+        return capture(game)
+
+    def test_state_is_small_bytes(self):
+        state = capture(self.game)
+        self.assertIsInstance(state, bytes)
+        self.assertLess(len(state), 1024)
+        self.assertEqual(len(self.game.bombs), 1, "The snapshot should hold a bomb with a burning fuse")
+
+    def test_restore_goes_back_in_time(self):
+        state = capture(self.game)
+        later = self.play(self.game, 240)
+        self.assertNotEqual(later, state)
+        restore(self.game, state)
+        self.assertEqual(capture(self.game), state)
+        self.assertEqual(self.play(self.game, 240), later, "Replaying the same inputs after a restore should give the same state")
+
+    def test_restore_into_another_game(self):
+        state = capture(self.game)
+        later = self.play(self.game, 240)
+        other = Game(None, 1, 2, 1, seed=5)
+        other.step([(1, 'left')] * 3, STEP_MS)
+        restore(other, state)
+        self.assertEqual(capture(other), state)
+        self.assertEqual(self.play(other, 240), later)
+
+    def test_obstacle_destroyed_by_another_player(self):
+        # A blast takes the obstacle off the count of the bomb's owner, which can go below zero
+        placer, owner = self.game.roster[1], self.game.roster[2]
+        placer.increase_obstacle_capacity()
+        self.assertTrue(placer.place_obstacle(self.game.game_map, placer.row, placer.col))
+        self.game.game_map.destroy_brick(placer.row, placer.col, self.game.powerUps, owner)
+        self.assertEqual(owner.active_obstacles, -1)
+        state = capture(self.game)
+        owner.active_obstacles = 0
+        restore(self.game, state)
+        self.assertEqual(owner.active_obstacles, -1)
+
+    def test_unknown_monster_class(self):
+        class CustomMonster(Monster):
+            pass
+        self.game.monsters.add(CustomMonster(self.game.game_field, 0, 0, 1))
+        with self.assertRaisesRegex(ValueError, "CustomMonster cannot be stored in a snapshot"):
+            capture(self.game)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import contextlib
+import io
+import unittest
+from game import MONSTER_TYPES
+from resources import images
+from snapshot import capture
+from stress import build_scenario, run_scenario, MAX_SIZE
+
+class TestStress(unittest.TestCase):
+    def setUp(self):
+        images.clear()
+        self.addCleanup(images.clear)
+        self.addCleanup(setattr, images, 'headless', False)
+
+    def build(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return build_scenario(**kwargs)
+
+    def test_scene_is_crowded(self):
+        game = self.build(size=41, monsters_per_type=10, players=5, bombs=30, power_ups=20, seed=4)
+        self.assertEqual((game.game_map.width, game.game_map.height), (41, 41))
+        self.assertEqual(len(game.monsters), 10 * len(MONSTER_TYPES))
+        self.assertEqual(sorted(game.roster), [1, 2, 3, 4, 5])
+        self.assertTrue(all(player.is_invincible for player in game.players))
+        self.assertLessEqual(len(game.bombs), 30)
+        self.assertEqual(len(game.bombs), len(game.game_map.bomb_tiles))
+        self.assertGreater(len(game.bombs), 20)
+        self.assertEqual(len(game.powerUps), 20)
+
+    def test_same_arguments_build_the_same_scene(self):
+        first = self.build(size=31, monsters_per_type=5, seed=7)
+        second = self.build(size=31, monsters_per_type=5, seed=7)
+        self.assertEqual(capture(first), capture(second))
+
+    def test_bombs_go_off_together(self):
+        game = self.build(size=31, monsters_per_type=5, bombs=20, power_ups=0, fuse=100, seed=2)
+        result = run_scenario(game, ticks=12)
+        self.assertEqual(result.ticks, 12)
+        self.assertEqual(len(result.tick_ms), 12)
+        self.assertEqual(result.bombs, sum(1 for bomb in game.bombs if bomb.player.has_detonator))
+        self.assertGreater(result.subsystems['bombs'][2], 0)
+        self.assertGreaterEqual(result.worst, result.percentile(0.95))
+        self.assertIsNone(game.profiler)
+
+    def test_arena_size_is_limited(self):
+        with self.assertRaises(ValueError):
+            build_scenario(size=MAX_SIZE + 1)
@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import Mock
+import pygame
+from game import Game
+from map import Map
+from resources import images
+from timers import TimerService
+from timing import SimulationClock
+
+class TestTimerService(unittest.TestCase):
+    def setUp(self):
+        self.timers = TimerService()
+        self.fired = []
+
+    def test_fires_in_due_order(self):
+        self.timers.schedule(300, self.fired.append, 'c')
+        self.timers.schedule(100, self.fired.append, 'a')
+        self.timers.schedule(200, self.fired.append, 'b')
+        self.assertEqual(self.timers.run_due(250), 2)
+        self.assertEqual(self.fired, ['a', 'b'])
+        self.assertEqual(len(self.timers), 1)
+        self.assertEqual(self.timers.next_due(), 300)
+
+    def test_same_time_fires_in_schedule_order(self):
+        for name in 'abc':
+            self.timers.schedule(100, self.fired.append, name)
+        self.timers.run_due(100)
+        self.assertEqual(self.fired, ['a', 'b', 'c'])
+
+    def test_cancel(self):
+        timer = self.timers.schedule(100, self.fired.append, 'a')
+        self.timers.schedule(200, self.fired.append, 'b')
+        self.timers.cancel(timer)
+        self.timers.cancel(timer)
+        self.assertEqual(len(self.timers), 1, "Cancelling twice should count once")
+        self.assertEqual(self.timers.next_due(), 200)
+        self.timers.run_due(1000)
+        self.assertEqual(self.fired, ['b'])
+        self.timers.cancel(timer)
+        self.timers.cancel(None)
+        self.assertEqual(len(self.timers), 0)
+
+    def test_callback_scheduling_due_timer(self):
+        self.timers.schedule(100, lambda: self.timers.schedule(100, self.fired.append, 'chained'))
+        self.assertEqual(self.timers.run_due(100), 2, "A timer due now should fire in the same drain")
+        self.assertEqual(self.fired, ['chained'])
+
+    def test_many_cancelled_timers_are_compacted(self):
+        timers = [self.timers.schedule(due, Mock()) for due in range(100)]
+        for timer in timers[:80]:
+            self.timers.cancel(timer)
+        self.assertLess(len(self.timers.queue), 100, "Mostly cancelled heap should be rebuilt")
+        self.assertEqual(len(self.timers), 20)
+        self.assertEqual(self.timers.run_due(1000), 20)
+
+class TestBombFuses(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        images.clear()
+        self.addCleanup(images.clear)
+        self.game = Game(pygame.Surface((520, 440)), Map.generate(21, 21, 40, brick_density=0, seed=1), 2, 1,
+                         clock=SimulationClock(), seed=1)
+        # Monsters stand still and players survive the blasts, so only the fuses decide what happens
+        for monster in self.game.monsters:
+            monster.update = lambda *args: None
+        for player in self.game.players:
+            player.is_invincible = True
+            player.invincibility_timer = float('inf')
+
+    def test_overlapping_fuses_both_explode(self):
+        # Player 2 places a bomb while player 1's is still burning, far enough away not to be set off by it
+        self.game.step([(1, 'bomb')], 500)
+        self.game.step([], 500)
+        self.game.step([(2, 'bomb')], 500)
+        while self.game.game_clock.get_ticks() < 5000:
+            self.assertIsNone(self.game.step([], 500))
+        self.assertEqual(len(self.game.bombs), 0, "Both bombs should explode")
+        for player in self.game.players:
+            self.assertEqual(player.active_bombs, 0)
+
+if __name__ == '__main__':
+    unittest.main()
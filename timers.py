@@ -0,0 +1,113 @@
+import heapq
+import itertools
+
+
+class Timer:
+    """
+    A callback scheduled on a TimerService, returned by `TimerService.schedule` so it can be cancelled.
+
+    Attributes:
+        due (int): The time in milliseconds at which the callback runs.
+        callback (callable): The function to call.
+        args (tuple): The arguments the callback is called with.
+        active (bool): Whether the timer is still waiting to fire, False once it fired or was cancelled.
+    """
+    def __init__(self, due, callback, args):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+
+class TimerService:
+    """
+    Runs callbacks at a given game time, e.g. bomb fuses and the end of power-up effects.
+
+    Timers are kept in a heap ordered by due time, so draining the service each tick only looks at the
+    timers that are due instead of at every object that may be waiting for something. Timers due at the
+    same time fire in the order they were scheduled. Cancelled timers stay in the heap until they reach
+    the top, or until they make up most of it.
+    """
+    def __init__(self):
+        self.queue = []
+        self._sequence = itertools.count()
+        self._cancelled = 0
+
+    def __len__(self):
+        """Returns the number of timers still waiting to fire."""
+        return len(self.queue) - self._cancelled
+
+    def schedule(self, due, callback, *args):
+        """
+        Schedules a callback.
+
+        Args:
+            due (int): The time in milliseconds at which the callback runs.
+            callback (callable): The function to call.
+            *args: The arguments the callback is called with.
+
+        Returns:
+            Timer: The handle to cancel the timer with.
+        """
+        timer = Timer(due, callback, args)
+        heapq.heappush(self.queue, (due, next(self._sequence), timer))
+        return timer
+
+    def cancel(self, timer):
+        """
+        Cancels a timer. Timers that already fired or were cancelled, and None, are ignored.
+
+        Args:
+            timer (Timer): The handle returned by `schedule`.
+        """
+        if timer is None or not timer.active:
+            return
+        timer.active = False
+        self._cancelled += 1
+        if self._cancelled > 32 and self._cancelled * 2 > len(self.queue):
+            # Drop the cancelled timers at once instead of popping them one by one
+            self.queue = [entry for entry in self.queue if entry[2].active]
+            heapq.heapify(self.queue)
+            self._cancelled = 0
+
+    def next_due(self):
+        """
+        Returns the time at which the next timer fires, or None if no timer is waiting.
+        """
+        self._discard_cancelled()
+        return self.queue[0][0] if self.queue else None
+
+    def run_due(self, current_time):
+        """
+        Fires every timer that is due. Timers scheduled by a callback fire in the same call if they are
+        due as well.
+
+        Args:
+            current_time (int): The current time in milliseconds.
+
+        Returns:
+            int: The number of callbacks that ran.
+        """
+        fired = 0
+        while True:
+            self._discard_cancelled()
+            if not self.queue or self.queue[0][0] > current_time:
+                return fired
+            _, _, timer = heapq.heappop(self.queue)
+            timer.active = False
+            timer.callback(*timer.args)
+            fired += 1
+
+    def clear(self):
+        """
+        Cancels every timer.
+        """
+        for _, _, timer in self.queue:
+            timer.active = False
+        self.queue = []
+        self._cancelled = 0
+
+    def _discard_cancelled(self):
+        while self.queue and not self.queue[0][2].active:
+            heapq.heappop(self.queue)
+            self._cancelled -= 1
@@ -0,0 +1,84 @@
+import pygame
+from contextlib import contextmanager
+
+# The simulation advances in steps of this many milliseconds, independent of the display frame rate
+TICK_RATE = 60
+STEP_MS = 1000 / TICK_RATE
+
+
+class SystemClock:
+    """
+    Reads the time from pygame, i.e. the milliseconds since `pygame.init()`.
+    """
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+
+class SimulationClock:
+    """
+    A clock that only moves when it is advanced, used to run a game on simulated time.
+
+    Attributes:
+        time (float): The current time in milliseconds.
+    """
+    def __init__(self, start=0):
+        self.time = start
+
+    def get_ticks(self):
+        return self.time
+
+    def advance(self, dt):
+        """
+        Moves the clock forward.
+
+        Args:
+            dt (float): The number of milliseconds to advance.
+        """
+        self.time += dt
+
+
+_clock = SystemClock()
+
+
+def get_ticks():
+    """
+    Returns the current time in milliseconds from the active clock. Game objects read the time through
+    this function instead of `pygame.time.get_ticks()`, so a game can be run on its own clock.
+    """
+    return _clock.get_ticks()
+
+
+def get_clock():
+    """Returns the active clock."""
+    return _clock
+
+
+def set_clock(clock):
+    """
+    Makes a clock the active one.
+
+    Args:
+        clock: An object with a `get_ticks()` method, e.g. a SimulationClock.
+
+    Returns:
+        The clock that was active before.
+    """
+    global _clock
+    previous = _clock
+    _clock = clock
+    return previous
+
+
+@contextmanager
+def using_clock(clock):
+    """
+    Makes a clock the active one for the duration of a `with` block, e.g. while a game is stepped.
+
+    Args:
+        clock: An object with a `get_ticks()` method.
+    """
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)